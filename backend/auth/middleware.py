@@ -15,6 +15,7 @@ PUBLIC_PATHS = [
     "/logout",
     "/static",
     "/favicon.ico",
+    "/ready",
 ]
 
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Index, Text, LargeBinary
 from backend.database_base import Base
 from datetime import datetime
 
@@ -7,11 +7,14 @@ from datetime import datetime
 # ---------------------------------------------------------
 class Item(Base):
     __tablename__ = "items"
+    __table_args__ = (
+        Index("ix_items_order", "kuerzel", "prod_id", "start_bft"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
-    # Gruppierungsschlüssel
-    merge_key = Column(String, index=True)
+    # Gruppierungsschlüssel (eindeutig pro Position)
+    merge_key = Column(String, index=True, unique=True)
 
     # Auftragsschlüssel
     kuerzel = Column(String, index=True)
@@ -61,6 +64,9 @@ class Item(Base):
 # ---------------------------------------------------------
 class CompletedToday(Base):
     __tablename__ = "completed_today"
+    __table_args__ = (
+        Index("ix_completed_today_order", "kuerzel", "prod_id", "start_bft"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -80,3 +86,91 @@ class CompletedToday(Base):
 
     # Ziel-Lagerort (falls vorhanden)
     zielort = Column(String)
+
+
+# ---------------------------------------------------------
+# ORDER STATUS – AGGREGAT PRO AUFTRAG (Kürzel + ProdID + Start-BFT)
+# ---------------------------------------------------------
+class OrderStatus(Base):
+    __tablename__ = "order_status"
+    __table_args__ = (
+        Index("ix_order_status_key", "kuerzel", "prod_id", "start_bft", unique=True),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Auftragsschlüssel
+    kuerzel = Column(String)
+    prod_id = Column(String, index=True)
+    start_bft = Column(String)
+
+    # Bündel (merge_keys) der Logistik-Items
+    total_buendel = Column(Integer, default=0)
+    kommissioniert_buendel = Column(Integer, default=0)
+    ausgeliefert_buendel = Column(Integer, default=0)
+    kommissioniert_einige = Column(Boolean, default=False)
+
+    # Fertig: ALLE Logistik-Items ausgeliefert – auch verschobene
+    # (die Bündel-Zähler oben zählen nur sichtbare Items)
+    alle_ausgeliefert = Column(Boolean, default=False)
+
+    # Flags
+    fehlteile = Column(Boolean, default=False)
+    reaktiviert = Column(Boolean, default=False)
+    verschoben = Column(Boolean, default=False)
+
+    # Anzeige (erste Logistik-Position)
+    artikel_nr = Column(String, default="")
+
+    # Für CompletedToday
+    menge = Column(Float, default=0.0)
+    zielort = Column(String, default="")
+    has_produktion = Column(Boolean, default=False)
+    has_logistik = Column(Boolean, default=False)
+
+
+# ---------------------------------------------------------
+# PICKING-EVENTS – OFFLINE GESAMMELTE KLICKS DER TABLETS
+# ---------------------------------------------------------
+class PickingEvent(Base):
+    __tablename__ = "picking_events"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Vom Client vergebene ID (UUID) → jedes Event wird nur einmal angewendet
+    event_id = Column(String, unique=True, index=True)
+
+    # "kommissioniert", "fehlteil_erledigt", "ausliefern", "verschieben"
+    typ = Column(String)
+
+    # Zeitpunkt am Gerät (wie gesendet) und Eingang am Server
+    client_ts = Column(String)
+    received_at = Column(DateTime, default=datetime.now, index=True)
+
+    # Nutzdaten als JSON (merge_keys, ziellager, kuerzel, prod_id)
+    daten = Column(Text)
+
+    # "angewendet" oder "ungueltig"
+    ergebnis = Column(String)
+
+
+# ---------------------------------------------------------
+# IMPORTE – FINGERABDRUCK JEDER HOCHGELADENEN DATEI
+# ---------------------------------------------------------
+class ImportRecord(Base):
+    __tablename__ = "imports"
+
+    id = Column(Integer, primary_key=True, index=True)
+    created_at = Column(DateTime, default=datetime.now, index=True)
+
+    filename = Column(String)
+    format = Column(String)     # xlsx, xls, csv, parquet
+    mode = Column(String)       # voll, delta
+
+    # SHA-256 des Dateiinhalts → identische Datei erkennen
+    content_hash = Column(String(64), index=True)
+
+    # Zeilen der Datei (nach prepare_dataframe) und ihre Hashes:
+    # sortierte uint64-Werte, roh hintereinander (8 Byte pro Zeile)
+    rows = Column(Integer)
+    row_hashes = Column(LargeBinary)
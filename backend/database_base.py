@@ -1,15 +1,56 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 import sqlite3
 import os
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///./app.db"
 
+
+# ---------------------------------------------------------
+# SQLITE-PROFIL (WAL, Pragmas, Busy-Timeout)
+# ---------------------------------------------------------
+# Abschalten mit SQLITE_TUNING=0 (z.B. auf Netzlaufwerken ohne WAL-Support)
+SQLITE_TUNING = os.getenv("SQLITE_TUNING", "1") != "0"
+
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+
+SQLITE_PRAGMAS = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "busy_timeout": SQLITE_BUSY_TIMEOUT_MS,
+    # negativ = KiB → 64 MB Seiten-Cache
+    "cache_size": int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536")) * -1,
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+    "temp_store": "MEMORY",
+}
+
+
+def apply_sqlite_profile(engine, pragmas: dict = None):
+    """Setzt die Pragmas bei JEDER neuen Verbindung des Engines."""
+    pragmas = SQLITE_PRAGMAS if pragmas is None else pragmas
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value};")
+        cursor.close()
+
+    return engine
+
+
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}
+    connect_args={
+        "check_same_thread": False,
+        # Wartezeit des sqlite3-Treibers bei gesperrter DB (Sekunden)
+        "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000,
+    }
 )
 
+if SQLITE_TUNING:
+    apply_sqlite_profile(engine)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -48,6 +89,7 @@ EXPECTED_COLUMNS_ITEMS = {
 # ⭐ Erwartete Spalten für Tabelle "completed_today"
 EXPECTED_COLUMNS_COMPLETED = {
     "kuerzel": "TEXT",
+    "prod_id": "TEXT",
     "timestamp": "DATETIME",
     "typ": "TEXT",
     "menge": "INTEGER",
@@ -55,6 +97,12 @@ EXPECTED_COLUMNS_COMPLETED = {
     "start_bft": "TEXT"   # ← NEU
 }
 
+# ⭐ Erwartete Spalten für Tabelle "order_status" (abgeleitet → ohne Default,
+# NULL-Werte werden beim Start von ensure_order_status() neu berechnet)
+EXPECTED_COLUMNS_ORDER_STATUS = {
+    "alle_ausgeliefert": "BOOLEAN",
+}
+
 print("DB PATH:", os.path.abspath("app.db"))
 
 
@@ -90,6 +138,68 @@ def ensure_columns_exist():
             cursor.execute(f"ALTER TABLE completed_today ADD COLUMN {column} {definition};")
             conn.commit()
 
+    # ---------------------------------------------------------
+    # Tabelle ORDER_STATUS prüfen (nur wenn schon vorhanden)
+    # ---------------------------------------------------------
+    cursor.execute("PRAGMA table_info(order_status);")
+    existing_orders = [row[1] for row in cursor.fetchall()]
+
+    for column, definition in EXPECTED_COLUMNS_ORDER_STATUS.items():
+        if existing_orders and column not in existing_orders:
+            print(f"[Migration] Füge Spalte zu 'order_status' hinzu: {column} ({definition})")
+            cursor.execute(f"ALTER TABLE order_status ADD COLUMN {column} {definition};")
+            conn.commit()
+
+    conn.close()
+
+
+# ⭐ Indizes passend zu den Zugriffspfaden (Auftrag = Kürzel + ProdID + Start-BFT)
+EXPECTED_INDEXES = {
+    "ix_items_order": "items (kuerzel, prod_id, start_bft)",
+    "ix_completed_today_order": "completed_today (kuerzel, prod_id, start_bft)",
+}
+
+
+def _has_unique_index(cursor, table: str, column: str) -> bool:
+    cursor.execute(f"PRAGMA index_list({table});")
+    for row in cursor.fetchall():
+        name, unique = row[1], row[2]
+        if not unique:
+            continue
+        cursor.execute(f"PRAGMA index_info({name});")
+        if [r[2] for r in cursor.fetchall()] == [column]:
+            return True
+    return False
+
+
+def ensure_indexes():
+    """Legt fehlende Indizes in bestehenden Datenbanken an."""
+    if not os.path.exists(DB_PATH):
+        return  # neue DB → Indizes kommen über create_all()
+
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table';")
+    tables = {row[0] for row in cursor.fetchall()}
+
+    for name, definition in EXPECTED_INDEXES.items():
+        if definition.split(" ")[0] not in tables:
+            continue
+        try:
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {definition};")
+        except sqlite3.OperationalError as e:
+            print(f"[Migration] Index {name} nicht angelegt: {e}")
+
+    # merge_key muss eindeutig sein (Bulk-Import verlässt sich darauf)
+    if "items" in tables and not _has_unique_index(cursor, "items", "merge_key"):
+        try:
+            cursor.execute("CREATE UNIQUE INDEX ux_items_merge_key ON items (merge_key);")
+            print("[Migration] Eindeutiger Index auf items.merge_key angelegt")
+        except sqlite3.IntegrityError:
+            print("[Migration] WARNUNG: doppelte merge_keys in 'items' – eindeutiger Index nicht angelegt")
+
+    conn.commit()
     conn.close()
 
 
@@ -97,3 +207,4 @@ def ensure_columns_exist():
 # AUTOMATISCH BEIM START AUSFÜHREN
 # ---------------------------------------------------------
 ensure_columns_exist()
+ensure_indexes()
@@ -0,0 +1,80 @@
+from sqlalchemy import func, case, and_, not_
+
+from backend.database import Item
+
+# Trennzeichen für group_concat (kommt in merge_keys nicht vor)
+KEY_SEP = "\x1f"
+
+
+def _text_or(column, default: str):
+    """'' / 'nan' / NULL → Default (wie bisher die pandas-Normalisierung)."""
+    value = func.coalesce(column, "")
+    return case((value.in_(["", "nan"]), default), else_=value)
+
+
+# ---------------------------------------------------------
+# DETAILSEITE – ARTIKELGRUPPEN EINES AUFTRAGS (eine Abfrage)
+# ---------------------------------------------------------
+def load_order_groups(db, kuerzel: str, prod_id: str, start_bft: str) -> list:
+    """
+    Liest nur die Positionen dieses Auftrags (Index ix_items_order) und
+    gruppiert sie in SQLite nach Artikel, Durchmesser, Länge und Biegung.
+    """
+    artikel_clean = _text_or(Item.artikel_clean, "?").label("artikel_clean")
+    artikel_nr = _text_or(Item.artikel_nr, "?").label("artikel_nr")
+    durchmesser = func.coalesce(Item.durchmesser, 0.0).label("durchmesser")
+    laenge = func.coalesce(Item.laenge, 0.0).label("laenge")
+    biegung = _text_or(Item.biegung, "unbekannt").label("biegung")
+
+    referenz = func.trim(func.coalesce(Item.referenz, ""))
+
+    # Produktionsartikel sind NIE kommissionierbar
+    produktion = and_(
+        func.trim(func.coalesce(Item.beschaffung, "")) == "Produktion",
+        referenz == "Produktion",
+    )
+
+    rows = (
+        db.query(
+            artikel_clean,
+            artikel_nr,
+            durchmesser,
+            laenge,
+            biegung,
+            func.sum(func.abs(func.coalesce(Item.bedarfs_menge_pos, 0))).label("menge"),
+            func.min(func.coalesce(Item.kommissioniert, False)).label("kommissioniert"),
+            func.min(func.coalesce(Item.ausgeliefert, False)).label("ausgeliefert"),
+            func.min(case((referenz == "Am Lager", 1), else_=0)).label("am_lager"),
+            func.max(case((referenz == "Bestellung", 1), else_=0)).label("fehlteil"),
+            func.group_concat(Item.merge_key, KEY_SEP).label("row_keys"),
+        )
+        .filter(
+            Item.kuerzel == kuerzel,
+            Item.prod_id == prod_id,
+            Item.start_bft == start_bft,
+            not_(produktion),
+        )
+        .group_by(artikel_clean, artikel_nr, durchmesser, laenge, biegung)
+        .order_by(durchmesser, laenge, artikel_clean, artikel_nr, biegung)
+        .all()
+    )
+
+    return [
+        {
+            "artikel_clean": r.artikel_clean,
+            "artikel_nr": r.artikel_nr,
+            "durchmesser": float(r.durchmesser),
+            "laenge": float(r.laenge),
+            "biegung": r.biegung,
+            "menge": int(r.menge or 0),
+            "prod_ids": [prod_id],
+            "row_keys": sorted(set((r.row_keys or "").split(KEY_SEP)) - {""}),
+            "kommissioniert": bool(r.kommissioniert),
+            "ausgeliefert": bool(r.ausgeliefert),
+            "am_lager": bool(r.am_lager),
+            "fehlteil": bool(r.fehlteil),
+            "kritisch_fehlteil": False,
+            "start_bft": start_bft,
+        }
+        for r in rows
+    ]
@@ -0,0 +1,119 @@
+from backend.database_base import SessionLocal
+from backend.database import Item, OrderStatus
+from backend.utils.tiles import aggregate_orders
+import pandas as pd
+
+# SQLite erlaubt nur eine begrenzte Anzahl Parameter pro Statement
+IN_CHUNK_SIZE = 500
+
+ITEM_COLUMNS = [
+    Item.id,
+    Item.kuerzel,
+    Item.prod_id,
+    Item.start_bft,
+    Item.merge_key,
+    Item.artikel_nr,
+    Item.beschaffung,
+    Item.referenz,
+    Item.bedarfs_menge_pos,
+    Item.ziel_lagerort,
+    Item.kommissioniert,
+    Item.ausgeliefert,
+    Item.verschoben,
+    Item.reaktiviert,
+]
+
+
+def _chunks(values: list, size: int = IN_CHUNK_SIZE):
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
+
+# ---------------------------------------------------------
+# Inkrementelles Update (nur betroffene ProdIDs)
+# ---------------------------------------------------------
+def refresh_orders(db, prod_ids):
+    """
+    Berechnet die Auftragszeilen für die angegebenen ProdIDs neu.
+    Muss nach jeder Statusänderung an Items aufgerufen werden,
+    Commit macht der Aufrufer.
+    """
+    prod_ids = sorted({p for p in prod_ids if p is not None})
+
+    for chunk in _chunks(prod_ids):
+        db.flush()
+
+        db.query(OrderStatus).filter(
+            OrderStatus.prod_id.in_(chunk)
+        ).delete(synchronize_session=False)
+
+        items = (
+            db.query(*ITEM_COLUMNS)
+            .filter(Item.prod_id.in_(chunk))
+            .order_by(Item.id)
+            .all()
+        )
+
+        df = pd.DataFrame(items, columns=[c.key for c in ITEM_COLUMNS])
+        records = aggregate_orders(df).to_dict(orient="records")
+
+        if records:
+            db.execute(OrderStatus.__table__.insert(), records)
+
+
+def rebuild_all(db):
+    """Komplettaufbau, z.B. für bestehende Datenbanken ohne order_status."""
+    db.query(OrderStatus).delete(synchronize_session=False)
+
+    prod_ids = [p for (p,) in db.query(Item.prod_id).distinct().all()]
+    refresh_orders(db, prod_ids)
+
+
+def ensure_order_status():
+    """
+    Baut die Tabelle beim Start auf, falls sie (noch) leer ist oder
+    nachträglich ergänzte Spalten noch keine Werte haben.
+    """
+    db = SessionLocal()
+    try:
+        empty = db.query(OrderStatus.id).first() is None
+        outdated = db.query(OrderStatus.id).filter(OrderStatus.alle_ausgeliefert.is_(None)).first() is not None
+
+        if (empty or outdated) and db.query(Item.id).first() is not None:
+            print("[Migration] Baue Tabelle 'order_status' auf ...")
+            rebuild_all(db)
+            db.commit()
+    finally:
+        db.close()
+
+
+# ---------------------------------------------------------
+# Lesen
+# ---------------------------------------------------------
+def get_order(db, kuerzel: str, prod_id: str, start_bft: str):
+    return db.query(OrderStatus).filter(
+        OrderStatus.kuerzel == kuerzel,
+        OrderStatus.prod_id == prod_id,
+        OrderStatus.start_bft == start_bft
+    ).first()
+
+
+def order_is_done(order) -> bool:
+    # Auftrag ist fertig, wenn ALLE Logistik-Items ausgeliefert sind
+    # (auch verschobene – wie früher is_done)
+    if order is None:
+        return False
+    return bool(order.alle_ausgeliefert)
+
+
+def load_open_orders(db):
+    """Alle sichtbaren, nicht fertigen Aufträge für die Logistik-Übersicht."""
+    return (
+        db.query(OrderStatus)
+        .filter(
+            OrderStatus.verschoben == False,
+            OrderStatus.total_buendel > 0,
+            OrderStatus.alle_ausgeliefert == False,
+        )
+        .all()
+    )
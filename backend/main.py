@@ -3,6 +3,8 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pathlib import Path
 from fastapi.responses import RedirectResponse
+from contextlib import asynccontextmanager
+import asyncio
 import os
 
 # 🔐 .env laden
@@ -11,6 +13,7 @@ load_dotenv()
 
 # Datenbank-Basis
 from backend.database_base import Base, engine
+from backend.logic.order_status import ensure_order_status
 
 # Auth
 from backend.auth.middleware import AuthMiddleware
@@ -35,16 +38,32 @@ from backend.routes.logistik_produktionssignal import router as logistik_produkt
 from backend.routes.ocr import router as ocr_router
 from backend.routes.reaktivieren import router as reaktivieren_router
 from backend.routes.admin_router import router as admin_router
+from backend.routes.live import router as live_router
+from backend.routes.health import router as health_router
+from backend.routes.scanner import router as scanner_router
+
+# OCR-Prozesspool (lädt easyocr erst nach dem Start bzw. beim ersten Scan)
+from backend.services.ocr_pool import schedule_preload, shutdown_pool
 
 # ---------------------------------------------------------
 # Datenbanktabellen erzeugen
 # ---------------------------------------------------------
 Base.metadata.create_all(bind=engine)
+ensure_order_status()
+
+# ---------------------------------------------------------
+# Start / Stop (OCR-Prozesse)
+# ---------------------------------------------------------
+@asynccontextmanager
+async def lifespan(app):
+    schedule_preload(asyncio.get_running_loop())
+    yield
+    shutdown_pool()
 
 # ---------------------------------------------------------
 # App erstellen
 # ---------------------------------------------------------
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # ---------------------------------------------------------
 # Templates & Static
@@ -87,6 +106,9 @@ app.include_router(logistik_produktionssignal_router)
 app.include_router(ocr_router, prefix="/api")
 app.include_router(reaktivieren_router)
 app.include_router(admin_router)
+app.include_router(live_router)
+app.include_router(health_router)
+app.include_router(scanner_router, prefix="/api")
 
 # ---------------------------------------------------------
 # Uvicorn-Start für Railway
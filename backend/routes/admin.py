@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Request, HTTPException
 from backend.database_base import SessionLocal
 from backend.database import Item
+from backend.logic.order_status import refresh_orders
+from backend.utils.item_snapshot import bump_data_version
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -18,7 +20,9 @@ async def delete_item(item_id: int, request: Request):
         raise HTTPException(status_code=404, detail="Item nicht gefunden")
 
     db.delete(item)
+    refresh_orders(db, [item.prod_id])
     db.commit()
     db.close()
+    bump_data_version()
 
     return {"status": "ok", "message": f"Item {item_id} gelöscht"}
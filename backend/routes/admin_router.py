@@ -2,6 +2,9 @@ from fastapi import APIRouter, Request
 from fastapi.responses import RedirectResponse
 from backend.database_base import SessionLocal
 from backend.database import Item
+from backend.logic.order_status import refresh_orders
+from backend.utils.item_snapshot import cache_stats
+from backend.services.picking import after_commit
 
 router = APIRouter()
 
@@ -17,7 +20,19 @@ def admin_delete_order(request: Request, prod_id: str):
     for item in items:
         db.delete(item)
 
+    refresh_orders(db, [prod_id])
     db.commit()
+    db.close()
+    after_commit([prod_id])
 
     return RedirectResponse("/logistik", status_code=303)
 
+
+# ---------------------------------------------------------
+# Snapshot-Cache – Trefferquote
+# ---------------------------------------------------------
+@router.get("/admin/cache-stats")
+def admin_cache_stats(request: Request):
+    if request.state.role != "admin":
+        return RedirectResponse("/logistik", status_code=303)
+    return cache_stats()
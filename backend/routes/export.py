@@ -1,66 +1,98 @@
+import os
+
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
+from sqlalchemy import select, and_, or_, func
+
 from backend.database_base import SessionLocal
 from backend.database import Item
-import io
-import pandas as pd
+from backend.utils.xlsx_stream import stream_xlsx
 
 router = APIRouter()
 
+# So viele Zeilen pro Abruf aus SQLite bzw. pro ausgeliefertem Stück
+EXPORT_CHUNK_ROWS = int(os.getenv("EXPORT_CHUNK_ROWS", "5000"))
 
-@router.get("/export/logistik")
-def export_logistik():
-    db = SessionLocal()
-
-    items = db.query(Item).all()
-
-    rows = []
-
-    for item in items:
+LOGISTIK_HEADER = [
+    "ProdID",
+    "Kürzel",
+    "Artikel-Nr",
+    "Bew.-Artikel",
+    "Durchmesser",
+    "Länge",
+    "Biegung",
+    "Bedarfs-Menge",
+    "Beschaffung",
+    "Referenz (ERP-Artikel)",
+    "Menge",
+    "Kommissioniert",
+    "Status",
+    "Start-BFT",
+    "Start-Bew",
+]
 
+# Nur die exportierten Spalten (keine ORM-Objekte)
+LOGISTIK_QUERY = (
+    select(
+        Item.prod_id,
+        Item.kuerzel,
+        Item.artikel_nr,
+        Item.artikel_clean,
+        Item.durchmesser,
+        Item.laenge,
+        Item.biegung,
+        Item.bedarfs_menge_pos,
+        Item.beschaffung,
+        Item.referenz,
+        Item.menge,
+        Item.kommissioniert,
+        Item.start_bft,
+        Item.start_bew,
+    )
+    .where(
         # 🔥 1) PRODUKTIONSARTIKEL IGNORIEREN
         # Diese Artikel sind NIE kommissionierbar
-        if item.beschaffung == "Produktion" and item.referenz == "Produktion":
-            continue
+        ~and_(
+            func.coalesce(Item.beschaffung, "") == "Produktion",
+            func.coalesce(Item.referenz, "") == "Produktion",
+        ),
+        # 🔥 3) Ausgebuchte ("kritisch") nicht exportieren
+        or_(Item.ausgebucht.is_(None), Item.ausgebucht == False),
+    )
+    .order_by(Item.id)
+)
 
-        # 🔥 2) Status bestimmen
-        if item.ausgebucht:
-            status = "kritisch"
-        elif not item.kommissioniert:
-            status = "offen"
-        else:
-            status = "teil-kommissioniert"
 
-        # 🔥 3) Nur offene oder teil-kommissionierte Logistik-Artikel exportieren
-        if status not in ["offen", "teil-kommissioniert"]:
-            continue
+def _logistik_row(r) -> tuple:
+    # 🔥 2) Status bestimmen (nur offen oder teil-kommissioniert übrig)
+    status = "teil-kommissioniert" if r.kommissioniert else "offen"
 
-        rows.append({
-            "ProdID": item.prod_id,
-            "Kürzel": item.kuerzel,
-            "Artikel-Nr": item.artikel_nr,
-            "Bew.-Artikel": item.artikel_clean,
-            "Durchmesser": item.durchmesser,
-            "Länge": item.laenge,
-            "Biegung": item.biegung,
-            "Bedarfs-Menge": item.bedarfs_menge_pos,
-            "Beschaffung": item.beschaffung,
-            "Referenz (ERP-Artikel)": item.referenz,
-            "Menge": item.menge,
-            "Kommissioniert": item.kommissioniert,
-            "Status": status,
-            "Start-BFT": item.start_bft,
-            "Start-Bew": item.start_bew,
-        })
+    return (
+        r.prod_id, r.kuerzel, r.artikel_nr, r.artikel_clean,
+        r.durchmesser, r.laenge, r.biegung, r.bedarfs_menge_pos,
+        r.beschaffung, r.referenz, r.menge, r.kommissioniert,
+        status, r.start_bft, r.start_bew,
+    )
 
-    df = pd.DataFrame(rows)
 
-    output = io.BytesIO()
-    df.to_excel(output, index=False)
-    output.seek(0)
+def _logistik_xlsx():
+    db = SessionLocal()
+    try:
+        # yield_per: der Cursor liefert Pakete nach, statt alles zu laden
+        result = db.execute(LOGISTIK_QUERY.execution_options(yield_per=EXPORT_CHUNK_ROWS))
+        batches = (
+            [_logistik_row(r) for r in part]
+            for part in result.partitions()
+        )
+        yield from stream_xlsx(LOGISTIK_HEADER, batches)
+    finally:
+        db.close()
 
+
+@router.get("/export/logistik")
+def export_logistik():
     return StreamingResponse(
-        output,
+        _logistik_xlsx(),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={"Content-Disposition": "attachment; filename=logistik_export.xlsx"}
     )
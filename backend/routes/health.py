@@ -0,0 +1,44 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+
+from backend.database_base import SessionLocal
+from backend.services.ocr_pool import pool_stats
+
+router = APIRouter()
+
+
+# ---------------------------------------------------------
+# READINESS (für Railway / Load-Balancer)
+# ---------------------------------------------------------
+@router.get("/ready")
+def ready():
+    """
+    Bereit, sobald die Datenbank antwortet. OCR wird getrennt gemeldet –
+    die Logistikseiten funktionieren auch, solange das Modell noch lädt.
+    """
+    db = SessionLocal()
+    try:
+        db.execute(text("SELECT 1"))
+        db_ok = True
+    except Exception as e:
+        print("Readiness: Datenbank nicht erreichbar:", e)
+        db_ok = False
+    finally:
+        db.close()
+
+    ocr = pool_stats()
+
+    return JSONResponse(
+        status_code=200 if db_ok else 503,
+        content={
+            "status": "ok" if db_ok else "fehler",
+            "db": db_ok,
+            "ocr": {
+                "state": ocr["state"],
+                "ready": ocr["state"] == "bereit",
+                "available": ocr["available"],
+                "detail": ocr["detail"],
+            },
+        },
+    )
@@ -0,0 +1,57 @@
+import asyncio
+
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+
+from backend.services.live_updates import subscribe, unsubscribe, render_event
+
+router = APIRouter()
+
+# Kommentarzeile alle X Sekunden, damit Proxies die Verbindung offen lassen
+HEARTBEAT_SECONDS = 20
+
+# Erster Block jeder Verbindung. Die id sorgt dafür, dass der Browser beim
+# automatischen Wiederverbinden immer einen Last-Event-ID-Header schickt –
+# auch wenn vor dem Abbruch noch kein Event kam.
+HELLO = "id: 0\nretry: 3000\n\n"
+
+
+# ---------------------------------------------------------
+# LIVE-UPDATES – SERVER-SENT EVENTS FÜR DIE BOARDS
+# ---------------------------------------------------------
+@router.get("/events/tiles")
+async def tile_events(request: Request):
+    templates = request.app.state.templates
+    sub = subscribe()
+
+    # Wiederverbunden (WLAN weg, Server-Neustart): was in der Zwischenzeit
+    # gesendet wurde, ist verloren → Board einmal komplett neu laden
+    reconnected = request.headers.get("last-event-id") is not None
+
+    async def stream():
+        try:
+            yield HELLO
+            if reconnected:
+                yield render_event({"id": 0, "type": "reload"}, templates)
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(sub.queue.get(), HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": ping\n\n"
+                    continue
+
+                yield render_event(event, templates)
+        finally:
+            unsubscribe(sub)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -6,9 +6,19 @@ from datetime import datetime, date
 
 from backend.database_base import SessionLocal
 from backend.database import Item
-from backend.logic.status import is_done
-from backend.logic.completed import mark_as_completed
+from backend.logic.order_status import load_open_orders
+from backend.logic.order_detail import load_order_groups
 from backend.utils.arbeitsplatz_loader import load_arbeitsplatz_artikel
+from backend.utils.tiles import logistik_tile, logistik_lt_tile, sort_logistik_tiles
+from backend.utils.item_snapshot import load_df
+from backend.services.picking import (
+    apply_kommissioniert,
+    apply_fehlteil_erledigt,
+    apply_ausliefern,
+    apply_verschieben,
+    finish,
+    after_commit,
+)
 
 # Produktionssignal
 from backend.logic.ladungstraeger import load_ladungstraeger
@@ -19,19 +29,6 @@ router = APIRouter()
 # ---------------------------------------------------------
 # Hilfsfunktionen
 # ---------------------------------------------------------
-def load_df() -> pd.DataFrame:
-    db = SessionLocal()
-    items = db.query(Item).all()
-    db.close()
-
-    if not items:
-        return pd.DataFrame()
-
-    df = pd.DataFrame([i.__dict__ for i in items])
-    df = df.drop(columns=["_sa_instance_state"], errors="ignore")
-    return df
-
-
 def load_ziellagerorte():
     try:
         with open("backend/data/zielorte.json", "r", encoding="utf-8") as f:
@@ -53,95 +50,14 @@ def parse_start_bft(series: pd.Series):
 # ---------------------------------------------------------
 @router.get("/logistik")
 def logistik_overview(request: Request):
-    df = load_df()
-
-    # Parkzone ausblenden
-    if "verschoben" in df.columns:
-        df = df[df["verschoben"] != True]
-
-    tiles = []
-
-    if not df.empty:
-        for (kuerzel, prod_id, start_bft) in sorted(
-            df.groupby(["kuerzel", "prod_id", "start_bft"]).groups.keys(),
-            key=lambda x: (x[0], x[1], x[2]),
-        ):
-            df_all = df[
-                (df["kuerzel"] == kuerzel)
-                & (df["prod_id"] == prod_id)
-            ]
-
-            reaktiviert = False
-            if "reaktiviert" in df.columns:
-                reaktiviert = bool(df_all["reaktiviert"].any())
-
-            # Fertige Aufträge IMMER ausblenden
-            if is_done(kuerzel, prod_id, start_bft):
-                continue
-
-            df_k = df[
-                (df["kuerzel"] == kuerzel)
-                & (df["prod_id"] == prod_id)
-                & (df["start_bft"] == start_bft)
-                & ~(
-                    (df["beschaffung"] == "Produktion")
-                    & (df["referenz"] == "Produktion")
-                )
-            ]
-
-            if df_k.empty:
-                continue
-
-            fehlteile_vorhanden = bool((df_k["referenz"] == "Bestellung").any())
-
-            total_buendel = df_k["merge_key"].nunique()
-            kommissioniert_buendel = (
-                df_k.groupby("merge_key")["kommissioniert"].all().sum()
-            )
+    db = SessionLocal()
 
-            kommi_alle = bool(df_k["kommissioniert"].all())
-            kommi_einige = bool(df_k["kommissioniert"].any())
-
-            if not kommi_einige:
-                status = "grau"
-                icon = "⏳"
-            elif kommi_einige and not kommi_alle:
-                status = "gelb"
-                icon = "🛠"
-            elif kommi_alle:
-                status = "hellgruen"
-                icon = "✅"
-            else:
-                status = "grau"
-                icon = "⏳"
+    # Eine Abfrage auf order_status (Parkzone + fertige Aufträge schon gefiltert)
+    orders = load_open_orders(db)
 
-            tiles.append(
-                {
-                    "kuerzel": kuerzel,
-                    "prod_id": prod_id,
-                    "status": status,
-                    "icon": icon,
-                    "fehlteile": fehlteile_vorhanden,
-                    "kritische_fehlteile": False,
-                    "total": total_buendel,
-                    "done": kommissioniert_buendel,
-                    "produktion_fertig": True,
-                    "start_bft": start_bft,
-                    "reaktiviert": reaktiviert,
-                    "verschoben": False,
-                    "artikel_nr": df_k.iloc[0]["artikel_nr"],
-                }
-            )
+    db.close()
 
-        tiles = sorted(
-            tiles,
-            key=lambda t: (
-                0 if t["reaktiviert"] else 1,
-                t["kuerzel"],
-                t["prod_id"],
-                t["start_bft"],
-            ),
-        )
+    tiles = sort_logistik_tiles([logistik_tile(o) for o in orders])
 
     # ---------------------------------------------------------
     # PRODUKTIONS-KACHELN
@@ -149,17 +65,11 @@ def logistik_overview(request: Request):
     state = load_state()
     lt_list = load_ladungstraeger()
 
-    prod_tiles = []
-    for lt in lt_list:
-        if state.get(lt["id"]) == "fertig":
-            prod_tiles.append(
-                {
-                    "id": lt["id"],
-                    "name": lt["name"],
-                    "status": "fertig",
-                    "icon": "🚚",
-                }
-            )
+    prod_tiles = [
+        logistik_lt_tile(lt)
+        for lt in lt_list
+        if state.get(lt["id"]) == "fertig"
+    ]
 
     prod_tiles = sorted(
         prod_tiles, key=lambda x: int(x["id"].replace("LT", ""))
@@ -189,17 +99,11 @@ def logistik_kommissioniert(
     start_bft: str = Form(default=""),
 ):
     db = SessionLocal()
-    items = db.query(Item).filter(Item.merge_key.in_(row_keys)).all()
-
-    for item in items:
-        item.kommissioniert = True
-        db.add(item)
-
+    prod_ids = apply_kommissioniert(db, row_keys)
+    finish(db, prod_ids)
     db.commit()
     db.close()
-
-    if is_done(kuerzel, prod_id, start_bft):
-        mark_as_completed(kuerzel, prod_id, start_bft)
+    after_commit(prod_ids)
 
     return RedirectResponse(
         f"/logistik/{kuerzel}/{prod_id}?start_bft={start_bft}",
@@ -220,15 +124,12 @@ def logistik_nicht_gefunden(
 ):
     db = SessionLocal()
 
-    merge_key = row_keys[0]
-    items = db.query(Item).filter(Item.merge_key == merge_key).all()
-
-    for item in items:
-        item.referenz = "Nicht gefunden"
-        db.add(item)
-
+    # Nur die erste Position des Formulars
+    prod_ids = apply_fehlteil_erledigt(db, row_keys[:1])
+    finish(db, prod_ids)
     db.commit()
     db.close()
+    after_commit(prod_ids)
 
     return RedirectResponse(
         f"/logistik/{kuerzel}/{prod_id}?start_bft={start_bft}",
@@ -249,20 +150,11 @@ def logistik_ausliefern(
     start_bft: str = Form(default=""),
 ):
     db = SessionLocal()
-    items = db.query(Item).filter(Item.merge_key.in_(row_keys)).all()
-
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    for item in items:
-        item.ausgeliefert = True
-        item.ziel_lagerort = ziellager
-        item.ausgeliefert_am = timestamp
-        db.add(item)
-
+    prod_ids = apply_ausliefern(db, row_keys, ziellager)
+    finish(db, prod_ids)
     db.commit()
     db.close()
-
-    mark_as_completed(kuerzel, prod_id, start_bft)
+    after_commit(prod_ids)
 
     return RedirectResponse("/logistik", status_code=303)
 
@@ -276,14 +168,11 @@ def logistik_verschieben(
     start_bft: str = Form(...),
 ):
     db = SessionLocal()
-
-    db.query(Item).filter(
-        Item.kuerzel == kuerzel,
-        Item.prod_id == prod_id,
-    ).update({"verschoben": True})
-
+    prod_ids = apply_verschieben(db, kuerzel, prod_id)
+    finish(db, prod_ids)
     db.commit()
     db.close()
+    after_commit(prod_ids)
 
     return RedirectResponse("/logistik", status_code=303)
 
@@ -345,8 +234,10 @@ def parkzone_reaktivieren(
         }
     )
 
+    finish(db, [prod_id])
     db.commit()
     db.close()
+    after_commit([prod_id])
 
     return RedirectResponse("/logistik", status_code=303)
 
@@ -413,7 +304,6 @@ def arbeitsplatz_artikel_delete(artikel: str = Form(...)):
 # ---------------------------------------------------------
 @router.get("/logistik/{kuerzel}/{prod_id}")
 def logistik_detail(request: Request, kuerzel: str, prod_id: str):
-    df = load_df()
     ziellagerorte = load_ziellagerorte()
 
     arbeitsplatz = load_arbeitsplatz_artikel()
@@ -423,139 +313,21 @@ def logistik_detail(request: Request, kuerzel: str, prod_id: str):
     if not start_bft_filter:
         return RedirectResponse("/logistik", status_code=303)
 
-    df["prod_id"] = df["prod_id"].astype(str)
-
-    df_k = df[
-        (df["kuerzel"] == kuerzel)
-        & (df["prod_id"] == str(prod_id))
-        & (df["start_bft"] == start_bft_filter)
-    ].copy()
-
-    if df_k.empty:
-        return request.app.state.templates.TemplateResponse(
-            request=request,
-            name="logistik_detail.html",
-            context={
-                "request": request,
-                "kuerzel": kuerzel,
-                "prod_id": prod_id,
-                "groups": [],
-                "ziellagerorte": ziellagerorte,
-                "produktion_fertig": True,
-                "prod_ladungstraeger": None,
-                "log_ladungstraeger": None,
-                "start_bft": start_bft_filter,
-            },
-        )
-
     # ---------------------------------------------------------
-    # LOGISTIK-GRUPPEN
+    # LOGISTIK-GRUPPEN (nur dieser Auftrag, Gruppierung in SQLite)
     # ---------------------------------------------------------
-    df_groups = df_k[
-        ~(
-            (df_k["beschaffung"].astype(str).str.strip() == "Produktion")
-            & (df_k["referenz"].astype(str).str.strip() == "Produktion")
-        )
-    ].copy()
-
-    df_groups["durchmesser"] = pd.to_numeric(
-        df_groups.get("durchmesser", 0), errors="coerce"
-    ).fillna(0.0)
-
-    df_groups["laenge"] = pd.to_numeric(
-        df_groups.get("laenge", 0), errors="coerce"
-    ).fillna(0.0)
-
-    df_groups["biegung"] = (
-        df_groups.get("biegung", "")
-        .astype(str)
-        .replace({"nan": "unbekannt", "": "unbekannt"})
-    )
-
-    df_groups["artikel_nr"] = (
-        df_groups.get("artikel_nr", "")
-        .astype(str)
-        .replace({"nan": "?", "": "?"})
-    )
-
-    df_groups["artikel_clean"] = (
-        df_groups.get("artikel_clean", "")
-        .astype(str)
-        .replace({"nan": "?", "": "?"})
-    )
-
-    df_groups["start_bft"] = df_groups.get("start_bft", "").astype(str)
-
-    groups = []
-
-    group_cols = [
-        "kuerzel",
-        "artikel_clean",
-        "artikel_nr",
-        "durchmesser",
-        "laenge",
-        "biegung",
-        "start_bft",
-    ]
-
-    for keys, df_art in df_groups.groupby(group_cols):
-        (
-            kuerzel_val,
-            artikel_clean,
-            artikel_nr,
-            durchmesser,
-            laenge,
-            biegung,
-            start_bft_val,
-        ) = keys
-
-        referenzen = df_art["referenz"].astype(str).str.strip().unique()
-        bestellung = any(ref == "Bestellung" for ref in referenzen)
-
-        kommissioniert = bool(df_art["kommissioniert"].all())
-        ausgeliefert = bool(df_art["ausgeliefert"].all())
-        am_lager = all(ref == "Am Lager" for ref in referenzen)
-
-        artikel_nr_norm = str(artikel_nr).strip().lower()
-        artikel_clean_norm = str(artikel_clean).strip().lower()
-
-        bew_series = df_art.get("bew_artikel") or df_art.get("Bew.-Artikel")
-        bew_artikel_norm = (
-            str(bew_series.iloc[0]).strip().lower()
-            if bew_series is not None and len(bew_series) > 0
-            else ""
-        )
-
-        arbeitsplatz_norm = [str(a).strip().lower() for a in artikel_liste]
+    db = SessionLocal()
+    groups = load_order_groups(db, kuerzel, str(prod_id), start_bft_filter)
+    db.close()
 
-        liegt_am_arbeitsplatz = (
-            artikel_nr_norm in arbeitsplatz_norm
-            or artikel_clean_norm in arbeitsplatz_norm
-            or bew_artikel_norm in arbeitsplatz_norm
-        )
+    arbeitsplatz_norm = {str(a).strip().lower() for a in artikel_liste}
 
-        groups.append(
-            {
-                "artikel_clean": artikel_clean,
-                "artikel_nr": artikel_nr,
-                "durchmesser": float(durchmesser),
-                "laenge": float(laenge),
-                "biegung": biegung,
-                "menge": int(df_art["bedarfs_menge_pos"].abs().sum()),
-                "prod_ids": sorted(df_art["prod_id"].unique()),
-                "row_keys": sorted(df_art["merge_key"].astype(str).unique()),
-                "kommissioniert": kommissioniert,
-                "ausgeliefert": ausgeliefert,
-                "am_lager": am_lager,
-                "fehlteil": bestellung,
-                "kritisch_fehlteil": False,
-                "start_bft": start_bft_val,
-                "liegt_am_arbeitsplatz": liegt_am_arbeitsplatz,
-            }
+    for g in groups:
+        g["liegt_am_arbeitsplatz"] = (
+            str(g["artikel_nr"]).strip().lower() in arbeitsplatz_norm
+            or str(g["artikel_clean"]).strip().lower() in arbeitsplatz_norm
         )
 
-    groups = sorted(groups, key=lambda g: (g["durchmesser"], g["laenge"]))
-
     log_ladungstraeger = None
 
     alle_kommi = all(
@@ -3,6 +3,7 @@ from fastapi.responses import RedirectResponse
 
 from backend.logic.ladungstraeger import load_ladungstraeger
 from backend.logic.produktion_state import load_state, save_state
+from backend.services.live_updates import publish_lt
 
 router = APIRouter()
 
@@ -38,4 +39,5 @@ def logistik_produktions_lieferung(lt_id: str):
     state = load_state()
     state[lt_id] = "offen"
     save_state(state)
+    publish_lt(lt_id)
     return RedirectResponse("/logistik", status_code=303)
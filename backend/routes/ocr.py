@@ -1,146 +1,103 @@
-from fastapi import APIRouter, UploadFile, File
-import easyocr
-import cv2
-import numpy as np
-from PIL import Image
-import io
-import re
+from typing import List
+
+from fastapi import APIRouter, UploadFile, File, Form
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+
+from backend.services.ocr_pool import (
+    OcrBusy,
+    OcrTimeout,
+    OcrUnavailable,
+    OCR_RETRY_AFTER_SECONDS,
+    OCR_BATCH_MAX_IMAGES,
+    scan_label,
+    scan_labels,
+    pool_stats,
+)
+from backend.services.ocr_cache import cache_stats
+from backend.services.ocr_match import match_candidates, index_stats
 
 router = APIRouter()
 
-reader = easyocr.Reader(['de'], gpu=False)
 
 # ---------------------------------------------------------
-# NORMALISIERUNG: macht OCR-Ausgabe DB-kompatibel
+# OCR ENDPOINT
 # ---------------------------------------------------------
-def normalize_ocr_value(s: str) -> str:
-    if not s:
-        return None
-
-    s = s.lower().strip()
-
-    # Entferne Leerzeichen und typische OCR-Artefakte
-    remove_chars = [" ", "\n", "\t", "[", "]", "(", ")", "|"]
-    for ch in remove_chars:
-        s = s.replace(ch, "")
-
-    # Typische OCR-Verwechslungen korrigieren
-    ocr_fix = {
-        "0": "o",   # 0 -> o
-        "1": "i",   # 1 -> i
-        "l": "i",   # l -> i
-        "5": "s",   # 5 -> s
-        "6": "g",   # 6 -> g
-        "8": "b",   # 8 -> b
-        "§": "s",
-        "€": "e",
-        "ß": "ss",
-    }
-
-    for wrong, right in ocr_fix.items():
-        s = s.replace(wrong, right)
+@router.post("/ocr/etikett")
+async def ocr_etikett(file: UploadFile = File(...)):
+    content = await file.read()
 
-    # Doppelte Fehler korrigieren
-    s = s.replace("g1", "gi")
-    s = s.replace("i1", "ih")
-    s = s.replace("1h", "ih")
+    # Bildverarbeitung + easyocr laufen im OCR-Prozesspool,
+    # der Event-Loop bleibt für andere Requests frei.
+    result = await _scan_or_error(scan_label(content))
+    if isinstance(result, JSONResponse):
+        return result
 
-    return s
+    # Passende offene Items (merge_keys, bester Treffer zuerst)
+    result["candidates"] = await run_in_threadpool(match_candidates, result)
+    return result
 
 
 # ---------------------------------------------------------
-# Hilfsfunktionen
+# BATCH: mehrere Fotos und/oder mehrere Etiketten pro Foto
 # ---------------------------------------------------------
-def extract_first(pattern, text):
-    if not text:
-        return None
-    m = re.search(pattern, text)
-    return m.group(1) if m else None
+@router.post("/ocr/etiketten")
+async def ocr_etiketten(
+    files: List[UploadFile] = File(...),
+    alle_etiketten: bool = Form(True),
+):
+    if len(files) > OCR_BATCH_MAX_IMAGES:
+        return JSONResponse(
+            status_code=413,
+            content={"detail": f"Maximal {OCR_BATCH_MAX_IMAGES} Fotos pro Anfrage"},
+        )
+
+    contents = [await f.read() for f in files]
+
+    results = await _scan_or_error(scan_labels(contents, alle_etiketten))
+    if isinstance(results, JSONResponse):
+        return results
+
+    def with_candidates():
+        for labels in results:
+            for label in labels:
+                label["candidates"] = match_candidates(label)
+
+    await run_in_threadpool(with_candidates)
 
+    return {
+        "images": [
+            {"filename": f.filename, "labels": labels}
+            for f, labels in zip(files, results)
+        ]
+    }
 
-def find_label_region(img):
-    edges = cv2.Canny(img, 50, 150)
-    contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
 
-    best = None
-    best_area = 0
+async def _scan_or_error(scan):
+    """Wartet auf den Scan; Pool-Fehler → passende Fehlerantwort."""
+    try:
+        return await scan
 
-    for c in contours:
-        approx = cv2.approxPolyDP(c, 0.02 * cv2.arcLength(c, True), True)
-        if len(approx) == 4:
-            x, y, w, h = cv2.boundingRect(approx)
-            area = w * h
-            if area > best_area:
-                best_area = area
-                best = (x, y, w, h)
+    except OcrUnavailable:
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "OCR ist auf diesem Server nicht verfügbar"},
+        )
 
-    return best
+    except OcrBusy:
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "OCR ausgelastet, bitte gleich erneut versuchen"},
+            headers={"Retry-After": str(OCR_RETRY_AFTER_SECONDS)},
+        )
 
+    except OcrTimeout:
+        return JSONResponse(
+            status_code=504,
+            content={"detail": "OCR hat zu lange gedauert"},
+        )
 
-# ---------------------------------------------------------
-# OCR ENDPOINT
-# ---------------------------------------------------------
-@router.post("/ocr/etikett")
-async def ocr_etikett(file: UploadFile = File(...)):
-    content = await file.read()
-
-    image = Image.open(io.BytesIO(content)).convert("L")
-    img = np.array(image)
-
-    region = find_label_region(img)
-
-    if region:
-        x, y, w, h = region
-        crop = img[y:y+h, x:x+w]
-    else:
-        crop = img
-
-    crop = cv2.GaussianBlur(crop, (3, 3), 0)
-    crop = cv2.equalizeHist(crop)
-
-    texts = reader.readtext(
-        crop,
-        detail=0,
-        paragraph=False,
-        contrast_ths=0.05,
-        adjust_contrast=0.7,
-        text_threshold=0.6,
-        decoder='greedy'
-    )
-
-    full_text = " ".join(t for t in texts if t).replace("\n", " ")
-
-    # ---------------------------------------------------------
-    # REGEX + NORMALISIERUNG
-    # ---------------------------------------------------------
-    kuerzel_raw = extract_first(r"/\s*([A-Z0-9]{4,10})", full_text)
-    stueckzahl_raw = extract_first(r"(\d+)\s*St\b", full_text)
-    durchmesser_raw = extract_first(r"\b\d{1,2}/(\d{1,2})\b", full_text)
-    laenge_raw = extract_first(r"L[: ]+(\d{2,4})\b", full_text)
-    artikelnummer_raw = extract_first(r"([A-Z0-9]{3,10}-\d{6,10})", full_text)
-
-    # Normalisieren
-    kuerzel = normalize_ocr_value(kuerzel_raw)
-    stueckzahl = normalize_ocr_value(stueckzahl_raw)
-    durchmesser = normalize_ocr_value(durchmesser_raw)
-    laenge = normalize_ocr_value(laenge_raw)
-    artikelnummer = normalize_ocr_value(artikelnummer_raw)
 
-    return {
-        "kuerzel": kuerzel,
-        "stueckzahl": stueckzahl,
-        "durchmesser": durchmesser,
-        "laenge": laenge,
-        "artikelnummer": artikelnummer,
-        "debug_raw": {
-            "full_text": full_text,
-            "region": region,
-            "raw": {
-                "kuerzel": kuerzel_raw,
-                "stueckzahl": stueckzahl_raw,
-                "durchmesser": durchmesser_raw,
-                "laenge": laenge_raw,
-                "artikelnummer": artikelnummer_raw
-            }
-        }
-    }
+@router.get("/ocr/status")
+def ocr_status():
+    return {**pool_stats(), "cache": cache_stats(), "match_index": index_stats()}
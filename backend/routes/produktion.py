@@ -3,6 +3,8 @@ from fastapi.responses import RedirectResponse
 
 from backend.logic.produktion_state import load_state, save_state
 from backend.logic.ladungstraeger import load_ladungstraeger, save_ladungstraeger
+from backend.utils.tiles import produktion_tile
+from backend.services.live_updates import publish_lt
 
 router = APIRouter()
 
@@ -15,27 +17,10 @@ def produktion_overview(request: Request):
     state = load_state()
     lt_list = load_ladungstraeger()
 
-    tiles = []
-    for lt in lt_list:
-        lt_id = lt["id"]
-        name = lt["name"]
-        status = state.get(lt_id, "offen")
-
-        if status == "fertig":
-            color = "gruen"
-            icon = "✔"
-        else:
-            color = "grau"
-            icon = "⏳"
-
-        tiles.append(
-            {
-                "id": lt_id,
-                "name": name,
-                "status": color,
-                "icon": icon,
-            }
-        )
+    tiles = [
+        produktion_tile(lt, state.get(lt["id"], "offen"))
+        for lt in lt_list
+    ]
 
     # Sortierung nach LT-Nummer
     tiles.sort(key=lambda x: int(x["id"].replace("LT", "")))
@@ -59,6 +44,7 @@ def produktion_fertig(lt_id: str):
     state = load_state()
     state[lt_id] = "fertig"
     save_state(state)
+    publish_lt(lt_id)
     return RedirectResponse("/produktion", status_code=303)
 
 
@@ -70,6 +56,7 @@ def produktion_reset(lt_id: str):
     state = load_state()
     state[lt_id] = "offen"
     save_state(state)
+    publish_lt(lt_id)
     return RedirectResponse("/produktion", status_code=303)
 
 
@@ -101,6 +88,7 @@ def produktion_add(name: str = Form(...)):
     # Status initialisieren
     state[new_id] = "offen"
     save_state(state)
+    publish_lt(new_id)
 
     return RedirectResponse("/produktion", status_code=303)
 
@@ -122,4 +110,6 @@ def produktion_delete(lt_id: str):
         del state[lt_id]
         save_state(state)
 
+    publish_lt(lt_id)
+
     return RedirectResponse("/produktion", status_code=303)
@@ -3,6 +3,7 @@ from fastapi.responses import RedirectResponse
 
 from backend.database_base import SessionLocal
 from backend.database import Item
+from backend.services.picking import finish, after_commit
 
 router = APIRouter()
 
@@ -28,8 +29,10 @@ async def reactivate_order(
         item.verschoben = False
         item.start_bft = start_bft
 
+    finish(db, [prod_id])
     db.commit()
     db.close()
+    after_commit([prod_id])
 
     # ✅ WICHTIG: TemplateResponse nur mit KEYWORD-ARGUMENTEN
     return request.app.state.templates.TemplateResponse(
@@ -0,0 +1,92 @@
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter
+from pydantic import BaseModel
+
+from backend.database_base import SessionLocal
+from backend.services.picking import (
+    apply_kommissioniert,
+    apply_ausliefern,
+    unknown_keys,
+    finish,
+    after_commit,
+    order_state,
+)
+from backend.services.picking_events import sync_events, EVENT_TYPES
+
+router = APIRouter()
+
+
+# ---------------------------------------------------------
+# Request-Body
+# ---------------------------------------------------------
+class Auslieferung(BaseModel):
+    ziellager: str = ""
+    merge_keys: List[str]
+
+
+class PickingBatch(BaseModel):
+    kommissioniert: List[str] = []
+    ausliefern: List[Auslieferung] = []
+
+
+class Event(BaseModel):
+    id: str
+    ts: str = ""                        # ISO 8601 vom Gerät
+    typ: Literal[EVENT_TYPES]
+    merge_keys: List[str] = []
+    ziellager: str = ""
+    kuerzel: Optional[str] = None
+    prod_id: Optional[str] = None
+
+
+class EventSync(BaseModel):
+    events: List[Event]
+
+
+# ---------------------------------------------------------
+# SCANNER – GANZEN WAGEN IN EINEM REQUEST BUCHEN
+# ---------------------------------------------------------
+@router.post("/logistik/batch")
+def logistik_batch(batch: PickingBatch):
+    """
+    {"kommissioniert": [merge_key, ...],
+     "ausliefern": [{"ziellager": "...", "merge_keys": [...]}, ...]}
+
+    Alles in einer Transaktion; Antwort: neuer Status aller betroffenen
+    Aufträge + merge_keys, die es nicht (mehr) gibt.
+    """
+    all_keys = batch.kommissioniert + [k for a in batch.ausliefern for k in a.merge_keys]
+
+    db = SessionLocal()
+    try:
+        prod_ids = apply_kommissioniert(db, batch.kommissioniert)
+        for a in batch.ausliefern:
+            prod_ids |= apply_ausliefern(db, a.merge_keys, a.ziellager)
+
+        orders = finish(db, prod_ids)
+        result = {
+            "orders": [order_state(o) for o in orders],
+            "unbekannt": unknown_keys(db, all_keys),
+        }
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    after_commit(prod_ids)
+    return result
+
+
+# ---------------------------------------------------------
+# SCANNER – OFFLINE GESAMMELTE EVENTS NACHREICHEN
+# ---------------------------------------------------------
+@router.post("/logistik/events")
+def logistik_events(sync: EventSync):
+    """
+    Events in Zeitstempel-Reihenfolge anwenden, bereits bekannte IDs
+    überspringen. Antwort: Status je Event + neuer Status der Aufträge.
+    """
+    return sync_events([e.model_dump() for e in sync.events])
@@ -1,151 +1,81 @@
-from fastapi import APIRouter, UploadFile, File, Request
-from fastapi.responses import RedirectResponse
-import pandas as pd
-from datetime import datetime
+from fastapi import APIRouter, UploadFile, File, Form, Request, HTTPException
+from fastapi.responses import RedirectResponse, JSONResponse
 
-from backend.utils.dataframe import prepare_dataframe
-from backend.database_base import SessionLocal
-from backend.database import Item, CompletedToday
+from backend.services.import_jobs import submit_upload, get_job, job_progress
 
 router = APIRouter()
 
 
-def norm(value):
-    if value is None:
-        return ""
-    value = str(value).strip()
-    if value.lower() in ["nan", "none", "null"]:
-        return ""
-    return value
-
-
+# ---------------------------------------------------------
+# UPLOAD – Import-Job anlegen (Antwort sofort)
+# ---------------------------------------------------------
 @router.post("/upload")
-async def upload_excel(request: Request, file: UploadFile = File(...)):
-    df = pd.read_excel(file.file)
-    df = prepare_dataframe(df)
-
-    db = SessionLocal()
-
-    # 1) Dashboard leeren
-    db.query(CompletedToday).delete()
-    db.commit()
+async def upload_excel(
+    request: Request,
+    file: UploadFile = File(...),
+    modus: str = Form("voll"),
+):
+    content = await file.read()
 
-    # 2) Nur vollständig abgeschlossene Items löschen
-    db.query(Item).filter(Item.ausgeliefert == True).delete()
-    db.commit()
+    try:
+        job = submit_upload(content, file.filename or "", modus)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    errors = []
-    warnings = []
+    return RedirectResponse(f"/upload/jobs/{job['id']}", status_code=303)
 
-    # 3) Neue Items aus Excel hinzufügen
-    for _, row in df.iterrows():
 
-        prod_id = norm(row.get("prod_id"))
-        kuerzel = norm(row.get("kuerzel"))
-        start_bft = norm(row.get("start_bft"))
-        artikel_nr = norm(row.get("artikel_nr"))
+# ---------------------------------------------------------
+# UPLOAD – Fortschritt / Ergebnis eines Import-Jobs
+# ---------------------------------------------------------
+@router.get("/upload/jobs/{job_id}")
+def upload_job(request: Request, job_id: str):
+    job = get_job(job_id)
 
-        # 🔥 WICHTIG:
-        # Bew.-Artikel ≠ Start Bew.
-        bew_artikel = norm(row.get("bew_artikel"))   # z.B. B500B-K07
-        start_bew = norm(row.get("start_bew"))       # echtes Start-Bew.-Datum / Wert
+    if not job:
+        raise HTTPException(status_code=404, detail="Import-Job nicht gefunden")
 
-        durchmesser = norm(row.get("durchmesser"))
-        laenge = norm(row.get("laenge"))
-        biegung = norm(row.get("biegung"))
-        menge = norm(row.get("menge"))
+    # Scanner / Skripte bekommen den Fortschritt als JSON
+    if "application/json" in request.headers.get("accept", ""):
+        return JSONResponse(job_progress(job))
 
-        # merge_key bleibt unverändert
-        merge_key = (
-            f"{prod_id}|"
-            f"{kuerzel}|"
-            f"{artikel_nr}|"
-            f"{start_bew}|"
-            f"{durchmesser}|"
-            f"{laenge}|"
-            f"{biegung}|"
-            f"{menge}"
+    if job["status"] == "fehler":
+        return request.app.state.templates.TemplateResponse(
+            request=request,
+            name="upload_error.html",
+            context={
+                "request": request,
+                "message": job["message"],
+            }
         )
 
-        # Prüfen, ob Auftrag existiert
-        existing_items_same_prod = db.query(Item).filter(Item.prod_id == prod_id).all()
-
-        if existing_items_same_prod:
-            # Auftrag komplett in Parkzone → reaktivieren
-            if all(i.verschoben for i in existing_items_same_prod):
-                for old in existing_items_same_prod:
-                    old.verschoben = False
-                    old.reaktiviert = True
-
-                db.commit()
-
-                warnings.append({
-                    "prod_id": prod_id,
-                    "kuerzel": kuerzel,
-                    "start_bft_alt": existing_items_same_prod[0].start_bft,
-                    "start_bft_neu": start_bft,
-                    "reason": "Auftrag wurde automatisch aus der Parkzone reaktiviert."
-                })
-
-        # Prüfen, ob Position existiert
-        existing_item = db.query(Item).filter(Item.merge_key == merge_key).first()
-
-        if existing_item:
-            errors.append({
-                "prod_id": prod_id,
-                "kuerzel": kuerzel,
-                "reason": "Position existiert bereits (merge_key)."
-            })
-            continue
-
-        # Neue Position anlegen
-        item = Item()
-        db.add(item)
-        db.flush()
-
-        item.merge_key = merge_key
-
-        item.fertig = False
-        item.kommissioniert = False
-        item.ausgeliefert = False
-
-        item.kuerzel = kuerzel
-        item.prod_id = prod_id
-        item.artikel_nr = artikel_nr
-
-        # 🔥 KORREKT:
-        # Bew.-Artikel → artikel_clean
-        item.artikel_clean = bew_artikel
-
-        # numerische Felder
-        item.durchmesser = float(row.get("durchmesser", 0) or 0)
-        item.laenge = float(row.get("laenge", 0) or 0)
-        item.biegung = norm(row.get("biegung"))
-
-        item.bedarfs_menge_pos = float(row.get("bedarfs_menge_pos", 0) or 0)
-        item.menge = float(row.get("menge", 0) or 0)
-
-        item.beschaffung = norm(row.get("beschaffung"))
-        item.referenz = norm(row.get("referenz"))
-
-        # 🔥 KORREKT:
-        # Start-BFT bleibt Start-BFT
-        # Start-Bew bleibt Start-Bew
-        item.start_bft = start_bft
-        item.start_bew = start_bew
+    if job["status"] != "fertig":
+        return request.app.state.templates.TemplateResponse(
+            request=request,
+            name="upload_progress.html",
+            context={
+                "request": request,
+                "job": job,
+            }
+        )
 
-    db.commit()
-    db.close()
+    errors = job["result"]["errors"]
+    warnings = job["result"]["warnings"]
+    diff = job["diff"]
 
-    if errors or warnings:
+    if errors or warnings or diff or job["bereits_importiert"]:
         return request.app.state.templates.TemplateResponse(
-            "upload_summary.html",
-            {
+            request=request,
+            name="upload_summary.html",
+            context={
                 "request": request,
                 "errors": errors,
-                "warnings": warnings
+                "warnings": warnings,
+                "diff": diff,
+                "bekannt": job["bekannt"],
+                "bereits_importiert": job["bereits_importiert"],
             }
         )
 
-    timestamp = datetime.now().strftime("%H:%M")
+    timestamp = job["finished"][:5]
     return RedirectResponse(f"/?upload_success=1&timestamp={timestamp}", status_code=303)
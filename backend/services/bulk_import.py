@@ -0,0 +1,440 @@
+import numpy as np
+import pandas as pd
+from sqlalchemy import select, update
+
+from backend.database import Item
+from backend.logic.order_status import refresh_orders
+
+# SQLite erlaubt nur eine begrenzte Anzahl Parameter pro Statement
+IN_CHUNK_SIZE = 500
+
+
+def norm(value):
+    if value is None:
+        return ""
+    value = str(value).strip()
+    if value.lower() in ["nan", "none", "null"]:
+        return ""
+    return value
+
+
+def _norm_column(df: pd.DataFrame, col: str) -> pd.Series:
+    if col not in df.columns:
+        return pd.Series([""] * len(df), index=df.index, dtype=object)
+    return df[col].map(norm).astype(object)
+
+
+def _float_column(df: pd.DataFrame, col: str) -> pd.Series:
+    if col not in df.columns:
+        return pd.Series([0.0] * len(df), index=df.index)
+    return pd.to_numeric(df[col], errors="coerce").fillna(0.0).astype(float)
+
+
+# ---------------------------------------------------------
+# Excel-Zeilen → Datensätze für die Tabelle "items"
+# ---------------------------------------------------------
+def build_records(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Baut aus dem vorbereiteten DataFrame alle Spalten für die
+    Tabelle "items" inkl. merge_key – spaltenweise statt Zeile für Zeile.
+    """
+    rows = pd.DataFrame(index=df.index)
+
+    rows["prod_id"] = _norm_column(df, "prod_id")
+    rows["kuerzel"] = _norm_column(df, "kuerzel")
+    rows["start_bft"] = _norm_column(df, "start_bft")
+    rows["artikel_nr"] = _norm_column(df, "artikel_nr")
+
+    # 🔥 WICHTIG:
+    # Bew.-Artikel ≠ Start Bew.
+    rows["artikel_clean"] = _norm_column(df, "bew_artikel")
+    rows["start_bew"] = _norm_column(df, "start_bew")
+
+    rows["biegung"] = _norm_column(df, "biegung")
+    rows["beschaffung"] = _norm_column(df, "beschaffung")
+    rows["referenz"] = _norm_column(df, "referenz")
+
+    # merge_key bleibt unverändert (Textform der Excel-Werte)
+    rows["merge_key"] = (
+        rows["prod_id"] + "|"
+        + rows["kuerzel"] + "|"
+        + rows["artikel_nr"] + "|"
+        + rows["start_bew"] + "|"
+        + _norm_column(df, "durchmesser") + "|"
+        + _norm_column(df, "laenge") + "|"
+        + rows["biegung"] + "|"
+        + _norm_column(df, "menge")
+    )
+
+    # numerische Felder
+    rows["durchmesser"] = _float_column(df, "durchmesser")
+    rows["laenge"] = _float_column(df, "laenge")
+    rows["bedarfs_menge_pos"] = _float_column(df, "bedarfs_menge_pos")
+    rows["menge"] = _float_column(df, "menge")
+
+    return rows
+
+
+def _chunks(values: list, size: int = IN_CHUNK_SIZE):
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
+
+def reactivate_parked(db, rows: pd.DataFrame, parked: dict, warnings: list) -> list:
+    """
+    Aufträge der Datei, die in der DB komplett in der Parkzone stehen,
+    reaktivieren (parked: prod_id → bisheriger Start-BFT).
+    """
+    first_per_prod = rows.drop_duplicates("prod_id")
+    reactivate = []
+
+    for prod_id, kuerzel, start_bft in zip(
+        first_per_prod["prod_id"],
+        first_per_prod["kuerzel"],
+        first_per_prod["start_bft"],
+    ):
+        if prod_id not in parked:
+            continue
+
+        reactivate.append(prod_id)
+        warnings.append({
+            "prod_id": prod_id,
+            "kuerzel": kuerzel,
+            "start_bft_alt": parked[prod_id],
+            "start_bft_neu": start_bft,
+            "reason": "Auftrag wurde automatisch aus der Parkzone reaktiviert."
+        })
+
+    for chunk in _chunks(reactivate):
+        db.query(Item).filter(Item.prod_id.in_(chunk)).update(
+            {"verschoben": False, "reaktiviert": True},
+            synchronize_session=False,
+        )
+
+    return reactivate
+
+
+def _file_prod_ids(rows: pd.DataFrame, scope_to_file: bool):
+    """ProdIDs der Datei (nur diese Aufträge aus der DB laden) oder None = alle."""
+    return sorted(rows["prod_id"].unique()) if scope_to_file else None
+
+
+def _scoped(db, query, prod_ids) -> list:
+    if prod_ids is None:
+        return db.execute(query).all()
+
+    result = []
+    for chunk in _chunks(prod_ids):
+        result += db.execute(query.where(Item.prod_id.in_(chunk))).all()
+    return result
+
+
+def _seen_mask(seen, n: int) -> np.ndarray:
+    """Maske "schon im letzten Import" → bool-Array der Länge n (None = keine)."""
+    if seen is None:
+        return np.zeros(n, dtype=bool)
+    return np.asarray(seen, dtype=bool)
+
+
+def _new_records(rows: pd.DataFrame) -> list:
+    records = rows.to_dict(orient="records")
+
+    for r in records:
+        r["fertig"] = False
+        r["kommissioniert"] = False
+        r["ausgeliefert"] = False
+
+    return records
+
+
+# ---------------------------------------------------------
+# BULK-IMPORT
+# ---------------------------------------------------------
+def import_dataframe(db, df: pd.DataFrame, on_progress=None, scope_to_file=False, seen=None):
+    """
+    Importiert ein vorbereitetes DataFrame mengenbasiert:
+    - bestehende merge_keys / ProdIDs mit EINER Abfrage laden
+    - Fehler, Warnungen und Parkzone-Reaktivierungen als Mengenoperationen
+    - neue Positionen mit EINEM Bulk-Insert schreiben
+
+    on_progress(skipped=..., warnings=..., inserted=...) wird nach der
+    Prüfung und nach dem Insert aufgerufen (z.B. für Import-Jobs).
+
+    scope_to_file=True lädt nur die Items der ProdIDs im DataFrame
+    (Streaming-Import: viele kleine Teilstücke statt einer großen Datei).
+
+    seen: Maske der Zeilen, die schon im letzten Import standen (siehe
+    import_fingerprint). Stehen sie noch in der DB, werden sie still
+    übersprungen statt als Fehler gemeldet; Parkzone und Auftragsstatus
+    gelten trotzdem für alle Zeilen.
+
+    Gibt (errors, warnings, inserted) zurück. Commit macht der Aufrufer.
+    """
+    errors = []
+    warnings = []
+
+    if df.empty:
+        return errors, warnings, 0
+
+    rows = build_records(df)
+    seen = _seen_mask(seen, len(rows))
+
+    # 1) Bestand in einer Abfrage laden
+    existing = _scoped(
+        db,
+        select(
+            Item.id,
+            Item.merge_key,
+            Item.prod_id,
+            Item.start_bft,
+            Item.verschoben,
+        ).order_by(Item.id),
+        _file_prod_ids(rows, scope_to_file),
+    )
+
+    existing_keys = {e.merge_key for e in existing}
+
+    existing_by_prod = {}
+    for e in existing:
+        existing_by_prod.setdefault(e.prod_id, []).append(e)
+
+    # 2) Parkzone: Aufträge, die komplett verschoben sind → reaktivieren
+    parked = {
+        prod_id: old_items[0].start_bft
+        for prod_id, old_items in existing_by_prod.items()
+        if all(o.verschoben for o in old_items)
+    }
+    reactivate_parked(db, rows, parked, warnings)
+
+    # 3) Doppelte Positionen (DB oder mehrfach in der Datei) → Fehler,
+    #    außer für Zeilen aus dem letzten Import, die noch in der DB stehen
+    in_db = rows["merge_key"].isin(existing_keys)
+    blocked = in_db | rows["merge_key"].duplicated()
+    report = blocked & ~(in_db & seen)
+
+    for prod_id, kuerzel in zip(
+        rows.loc[report, "prod_id"],
+        rows.loc[report, "kuerzel"],
+    ):
+        errors.append({
+            "prod_id": prod_id,
+            "kuerzel": kuerzel,
+            "reason": "Position existiert bereits (merge_key)."
+        })
+
+    if on_progress:
+        on_progress(skipped=len(errors), warnings=len(warnings), inserted=0)
+
+    # 4) Neue Positionen mit einem Bulk-Insert anlegen
+    records = _new_records(rows[~blocked])
+
+    if records:
+        db.execute(Item.__table__.insert(), records)
+
+    # 5) Auftragsstatus nur für die berührten ProdIDs neu berechnen
+    refresh_orders(db, rows["prod_id"].unique().tolist())
+
+    if on_progress:
+        on_progress(skipped=len(errors), warnings=len(warnings), inserted=len(records))
+
+    return errors, warnings, len(records)
+
+
+# ---------------------------------------------------------
+# DELTA-IMPORT (Semantik wie state_manager.merge_excel_into_state)
+# ---------------------------------------------------------
+# - neue merge_keys → anlegen (Fortschritt False)
+# - bekannte merge_keys → Stammdaten aktualisieren, Fortschritt bleibt
+#   (kommissioniert, ausgeliefert, Zielort, Parkzone, ...)
+# - merge_keys, die nicht mehr in der Datei stehen → bleiben unverändert
+#
+# Verglichen wird über einen Hash der Stammdaten-Spalten pro Zeile:
+# eine fast gleiche Datei schreibt nur die paar geänderten Zeilen.
+
+TEXT_COLUMNS = [
+    "prod_id", "kuerzel", "start_bft", "artikel_nr", "artikel_clean",
+    "start_bew", "biegung", "beschaffung", "referenz",
+]
+FLOAT_COLUMNS = ["durchmesser", "laenge", "bedarfs_menge_pos", "menge"]
+MASTER_COLUMNS = TEXT_COLUMNS + FLOAT_COLUMNS
+
+# Von der Logistik gesetzt ("Fehlteil erledigt") → gilt als Fortschritt
+REFERENZ_ERLEDIGT = "Nicht gefunden"
+
+# So viele Beispiele pro Kategorie im Diff-Bericht
+DIFF_EXAMPLES = 10
+
+
+def _row_hashes(frame: pd.DataFrame):
+    return pd.util.hash_pandas_object(frame[MASTER_COLUMNS], index=False).to_numpy()
+
+
+def _load_current(db, prod_ids=None) -> pd.DataFrame:
+    columns = [Item.id, Item.merge_key, Item.verschoben] + [
+        getattr(Item, c) for c in MASTER_COLUMNS
+    ]
+    # Core-Select statt ORM-Query (keine ORM-Zeilen, bei 100k Items merklich schneller)
+    current = pd.DataFrame(
+        _scoped(db, select(*columns).order_by(Item.id), prod_ids),
+        columns=[c.key for c in columns],
+    )
+
+    # Gleiche Typen wie build_records, sonst unterscheiden sich die Hashes
+    for col in TEXT_COLUMNS:
+        current[col] = current[col].fillna("").astype(str).astype(object)
+    for col in FLOAT_COLUMNS:
+        current[col] = pd.to_numeric(current[col], errors="coerce").fillna(0.0).astype(float)
+    current["verschoben"] = current["verschoben"].fillna(False).astype(bool)
+
+    # Ältere Datenbanken können doppelte merge_keys enthalten (siehe
+    # ensure_indexes) → je Schlüssel zählt das Item mit der kleinsten id
+    current = current[~current["merge_key"].duplicated()]
+
+    return current.set_index("merge_key", drop=False)
+
+
+def _changed_fields(new: pd.DataFrame, old: pd.DataFrame) -> list:
+    return [
+        {
+            "merge_key": key,
+            "felder": [c for c in MASTER_COLUMNS if n[c] != o[c]],
+        }
+        for key, n, o in zip(
+            new["merge_key"],
+            new[MASTER_COLUMNS].to_dict(orient="records"),
+            old[MASTER_COLUMNS].to_dict(orient="records"),
+        )
+    ]
+
+
+def merge_diff(total: dict, part: dict) -> dict:
+    """Diff-Berichte mehrerer Teilstücke zusammenfassen (Streaming-Import)."""
+    if total is None:
+        return part
+
+    for key, value in part.items():
+        if key == "beispiele":
+            for kind, examples in value.items():
+                total[key][kind] = (total[key][kind] + examples)[:DIFF_EXAMPLES]
+        elif value is not None:
+            total[key] = (total[key] or 0) + value
+
+    return total
+
+
+def import_delta(db, df: pd.DataFrame, on_progress=None, scope_to_file=False, seen_keys=None,
+                 seen=None):
+    """
+    Gleicht das vorbereitete DataFrame mit der Tabelle "items" ab und
+    schreibt nur neue Positionen und geänderte Stammdaten (je ein Bulk-Statement).
+
+    Gibt (errors, warnings, diff, prod_ids) zurück; prod_ids sind die
+    berührten Aufträge (order_status ist für sie schon neu berechnet).
+    Commit macht der Aufrufer.
+
+    Streaming-Import: scope_to_file=True wie bei import_dataframe,
+    seen_keys = merge_keys der vorherigen Teilstücke (Dubletten über
+    Teilstücke hinweg); diff["nicht_in_datei"] ist dann None.
+
+    seen: Maske der Zeilen aus dem letzten Import – stehen sie noch in der
+    DB, gelten sie ohne Stammdaten-Vergleich als unverändert. Parkzone und
+    Auftragsstatus gelten trotzdem für alle Zeilen.
+    """
+    errors = []
+    warnings = []
+    diff = {
+        "neu": 0,
+        "geaendert": 0,
+        "unveraendert": 0,
+        "nicht_in_datei": 0,
+        "doppelt_in_datei": 0,
+        "reaktiviert": 0,
+        "beispiele": {"neu": [], "geaendert": []},
+    }
+
+    if df.empty:
+        return errors, warnings, diff, set()
+
+    rows = build_records(df)
+    seen = _seen_mask(seen, len(rows))
+
+    # 1) Doppelte Positionen in der Datei → Fehler (erste Zeile gilt)
+    duplicated = rows["merge_key"].duplicated()
+    if seen_keys is not None:
+        duplicated |= rows["merge_key"].isin(seen_keys)
+        seen_keys.update(rows["merge_key"])
+    for prod_id, kuerzel in zip(
+        rows.loc[duplicated, "prod_id"],
+        rows.loc[duplicated, "kuerzel"],
+    ):
+        errors.append({
+            "prod_id": prod_id,
+            "kuerzel": kuerzel,
+            "reason": "Position mehrfach in der Datei (merge_key)."
+        })
+    rows = rows[~duplicated]
+    seen = seen[~duplicated.to_numpy()]
+
+    # 2) Bestand in einer Abfrage laden, nach merge_key zuordnen
+    current = _load_current(db, _file_prod_ids(rows, scope_to_file))
+
+    known = rows["merge_key"].isin(current.index).to_numpy()
+    new_rows = rows[~known]
+
+    # Zeilen aus dem letzten Import, die noch in der DB stehen → kein Vergleich
+    unchanged_seen = int((known & seen).sum())
+    old_rows = rows[known & ~seen].copy()
+    before = current.loc[old_rows["merge_key"]]
+
+    # "Nicht gefunden" nicht durch die Referenz aus der Datei überschreiben
+    erledigt = (before["referenz"] == REFERENZ_ERLEDIGT).to_numpy()
+    old_rows.loc[erledigt, "referenz"] = REFERENZ_ERLEDIGT
+
+    changed = _row_hashes(old_rows) != _row_hashes(before)
+    changed_rows = old_rows[changed]
+
+    # 3) Parkzone wie beim normalen Import
+    verschoben = current.groupby("prod_id", sort=False)["verschoben"]
+    parked_ids = verschoben.all()
+    parked = current.drop_duplicates("prod_id").set_index("prod_id")["start_bft"]
+    parked = parked[parked_ids[parked_ids].index].to_dict()
+    reactivated = reactivate_parked(db, rows, parked, warnings)
+
+    if on_progress:
+        on_progress(skipped=len(errors), warnings=len(warnings), inserted=0)
+
+    # 4) Geänderte Stammdaten (per Primärschlüssel) + neue Positionen
+    if len(changed_rows):
+        updates = changed_rows[MASTER_COLUMNS].to_dict(orient="records")
+        for r, item_id in zip(updates, before.loc[changed, "id"]):
+            r["id"] = int(item_id)
+        db.execute(update(Item), updates)
+
+    records = _new_records(new_rows)
+    if records:
+        db.execute(Item.__table__.insert(), records)
+
+    # 5) Auftragsstatus nur für tatsächlich berührte ProdIDs
+    prod_ids = set(new_rows["prod_id"]) | set(changed_rows["prod_id"]) | set(reactivated)
+    refresh_orders(db, prod_ids)
+
+    if on_progress:
+        on_progress(skipped=len(errors), warnings=len(warnings), inserted=len(records))
+
+    diff.update(
+        neu=len(records),
+        geaendert=len(changed_rows),
+        unveraendert=int(len(old_rows) - len(changed_rows)) + unchanged_seen,
+        nicht_in_datei=None if scope_to_file else int(len(current) - len(old_rows) - unchanged_seen),
+        doppelt_in_datei=int(duplicated.sum()),
+        reaktiviert=len(reactivated),
+        beispiele={
+            "neu": new_rows["merge_key"].head(DIFF_EXAMPLES).tolist(),
+            "geaendert": _changed_fields(
+                changed_rows.head(DIFF_EXAMPLES),
+                before[changed].head(DIFF_EXAMPLES),
+            ),
+        },
+    )
+
+    return errors, warnings, diff, prod_ids
@@ -0,0 +1,84 @@
+from datetime import datetime
+
+from sqlalchemy import select, case, and_, func, literal, DateTime
+
+from backend.database import CompletedToday, OrderStatus
+from backend.logic.order_status import IN_CHUNK_SIZE
+
+# ---------------------------------------------------------
+# AUFTRAGSABSCHLUSS (CompletedToday) – MENGENBASIERT
+# ---------------------------------------------------------
+# Ersetzt is_done() + mark_as_completed(): beide öffneten eine eigene
+# Session und lasen den Auftrag einzeln. Hier entscheidet EIN Statement
+# (INSERT ... SELECT ... WHERE NOT EXISTS) über alle Aufträge der ProdIDs:
+#
+#   fertig  = alle Logistik-Items ausgeliefert, auch verschobene (wie order_is_done)
+#   typ     = produktion / logistik / beides
+#   menge, zielort aus order_status
+#
+# Läuft in der Session des Aufrufers (nach refresh_orders, vor dem Commit),
+# damit Statusänderung und Abschluss in derselben Transaktion landen.
+
+_orders = OrderStatus.__table__
+_completed = CompletedToday.__table__
+
+COMPLETED_COLUMNS = ["kuerzel", "prod_id", "start_bft", "timestamp", "typ", "menge", "zielort"]
+
+
+def _completion_insert(now: datetime, prod_ids=None):
+    o, c = _orders.c, _completed.c
+
+    typ = case(
+        (and_(o.has_produktion, o.has_logistik), "beides"),
+        (o.has_produktion, "produktion"),
+        else_="logistik",
+    )
+
+    already = (
+        select(c.id)
+        .where(
+            c.kuerzel.is_not_distinct_from(o.kuerzel),
+            c.prod_id.is_not_distinct_from(o.prod_id),
+            c.start_bft.is_not_distinct_from(o.start_bft),
+        )
+        .exists()
+    )
+
+    done = (
+        select(
+            o.kuerzel,
+            o.prod_id,
+            o.start_bft,
+            literal(now, DateTime),
+            typ,
+            func.coalesce(o.menge, 0),
+            func.coalesce(o.zielort, ""),
+        )
+        .where(
+            o.alle_ausgeliefert == True,
+            ~already,
+        )
+    )
+
+    if prod_ids is not None:
+        done = done.where(o.prod_id.in_(prod_ids))
+
+    return _completed.insert().from_select(COMPLETED_COLUMNS, done)
+
+
+def complete_orders(db, prod_ids=None) -> int:
+    """
+    Trägt alle fertigen, noch nicht eingetragenen Aufträge der ProdIDs
+    in CompletedToday ein (prod_ids=None → alle Aufträge).
+    Commit macht der Aufrufer. Rückgabe: Anzahl neuer Einträge.
+    """
+    now = datetime.now()
+
+    if prod_ids is None:
+        return db.execute(_completion_insert(now)).rowcount
+
+    prod_ids = sorted({p for p in prod_ids if p is not None})
+    added = 0
+    for i in range(0, len(prod_ids), IN_CHUNK_SIZE):
+        added += db.execute(_completion_insert(now, prod_ids[i:i + IN_CHUNK_SIZE])).rowcount
+    return added
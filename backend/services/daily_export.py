@@ -7,6 +7,7 @@ import os
 
 from backend.database_base import SessionLocal
 from backend.database import Item
+from backend.services.completion import complete_orders
 
 
 def export_and_send_email():
@@ -14,6 +15,11 @@ def export_and_send_email():
     db = SessionLocal()
 
     try:
+        # Fertige Aufträge, die noch fehlen (z.B. über den Import fertig
+        # geworden), vor dem Export in CompletedToday nachtragen
+        complete_orders(db)
+        db.commit()
+
         # Nur ausgelieferte Items exportieren
         items = db.query(Item).filter(Item.ausgeliefert == True).all()
 
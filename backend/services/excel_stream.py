@@ -0,0 +1,176 @@
+import io
+import os
+
+import pandas as pd
+from openpyxl import load_workbook
+
+# ---------------------------------------------------------
+# EXCEL IN TEILSTÜCKEN LESEN (Streaming-Import)
+# ---------------------------------------------------------
+# pd.read_excel baut über openpyxl die komplette Arbeitsmappe im Speicher
+# auf – bei Quartals-Neuplanungen (200k+ Zeilen) mehrere hundert MB.
+# Im read_only-Modus liest openpyxl die Zeilen nacheinander aus dem XML;
+# der Import verarbeitet jeweils IMPORT_CHUNK_ROWS Zeilen und verwirft sie.
+#
+#   IMPORT_STREAMING           auto | 1 | 0
+#   IMPORT_STREAMING_MIN_ROWS  ab so vielen Zeilen streamen (auto)
+#   IMPORT_CHUNK_ROWS          Zeilen pro Teilstück
+
+IMPORT_STREAMING = os.getenv("IMPORT_STREAMING", "auto")
+IMPORT_STREAMING_MIN_ROWS = int(os.getenv("IMPORT_STREAMING_MIN_ROWS", "50000"))
+IMPORT_CHUNK_ROWS = int(os.getenv("IMPORT_CHUNK_ROWS", "20000"))
+
+
+def _open(content: bytes):
+    return load_workbook(io.BytesIO(content), read_only=True, data_only=True)
+
+
+def sheet_rows(content: bytes) -> int:
+    """Zeilenzahl laut Blatt-Dimension (ohne das Blatt zu lesen), 0 = unbekannt."""
+    wb = _open(content)
+    try:
+        return wb.worksheets[0].max_row or 0
+    finally:
+        wb.close()
+
+
+def use_streaming(content: bytes) -> bool:
+    if IMPORT_STREAMING == "1":
+        return True
+    if IMPORT_STREAMING != "auto":
+        return False
+    try:
+        return sheet_rows(content) >= IMPORT_STREAMING_MIN_ROWS
+    except Exception:
+        # Kein xlsx (z.B. altes .xls) → normaler Weg über pandas
+        return False
+
+
+def _header(values) -> list:
+    """Spaltenköpfe wie pd.read_excel: leer → "Unnamed: i", doppelt → "name.1"."""
+    header = []
+    seen = {}
+    for i, v in enumerate(values):
+        name = f"Unnamed: {i}" if v is None else v
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        header.append(name)
+    return header
+
+
+def _cell(value):
+    # Wie der openpyxl-Reader von pandas: ganzzahlige Floats als int
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _column_kinds(rows, width: int) -> list:
+    """
+    Erster Durchlauf über das Blatt: welchen Typ pd.read_excel je Spalte
+    wählen würde – "int", "float" oder None (object, Werte wie gelesen).
+
+    Eine Zahlenspalte mit Lücken oder Nachkommastellen wird bei pandas
+    float64 (100000 → "100000.0" im merge_key). Das hängt von der GANZEN
+    Spalte ab, nicht vom Teilstück – sonst ändern sich die Schlüssel,
+    sobald eine Datei die Streaming-Grenze überschreitet.
+    """
+    numbers = [False] * width
+    other = [False] * width
+    gaps = [False] * width
+    fraction = [False] * width
+
+    # Leere Zeilen zählen als Lücke, wenn danach noch Daten kommen
+    # (pandas schneidet nur leere Zeilen am Ende ab)
+    pending_gap = False
+
+    for row in rows:
+        if all(v is None for v in row):
+            pending_gap = True
+            continue
+        if pending_gap:
+            gaps = [True] * width
+            pending_gap = False
+
+        for i in range(width):
+            v = row[i] if i < len(row) else None
+            if v is None:
+                gaps[i] = True
+            elif isinstance(v, bool) or not isinstance(v, (int, float)):
+                other[i] = True
+            else:
+                numbers[i] = True
+                if isinstance(v, float) and not v.is_integer():
+                    fraction[i] = True
+
+    return [
+        None if other[i] or not numbers[i]
+        else "float" if gaps[i] or fraction[i]
+        else "int"
+        for i in range(width)
+    ]
+
+
+def _frame(buffer: list, header: list, kinds: list) -> pd.DataFrame:
+    df = pd.DataFrame(buffer, columns=header, dtype=object)
+    for i, kind in enumerate(kinds):
+        if kind == "float":
+            df.isetitem(i, df.iloc[:, i].astype("float64"))
+        elif kind == "int":
+            df.isetitem(i, df.iloc[:, i].astype("int64"))
+    return df
+
+
+def sheet_header(content: bytes) -> list:
+    """Spaltenköpfe des ersten Blatts (wie iter_excel_chunks), leer ohne Zeilen."""
+    wb = _open(content)
+    try:
+        first = next(wb.worksheets[0].iter_rows(max_row=1, values_only=True), None)
+        return _header(first) if first is not None else []
+    finally:
+        wb.close()
+
+
+def iter_excel_chunks(content: bytes, chunk_rows: int = None):
+    """
+    Erstes Blatt → DataFrames mit je chunk_rows Zeilen (Spalten wie
+    pd.read_excel). Leere Zeilen werden übersprungen.
+
+    Die Spaltentypen legt ein erster Durchlauf für die ganze Datei fest
+    (_column_kinds) – keine Typ-Erkennung pro Teilstück, die je nach
+    leeren Zellen 100000 oder 100000.0 ergäbe.
+    """
+    chunk_rows = chunk_rows or IMPORT_CHUNK_ROWS
+
+    wb = _open(content)
+    try:
+        sheet = wb.worksheets[0]
+        rows = sheet.iter_rows(values_only=True)
+
+        first = next(rows, None)
+        if first is None:
+            return
+        header = _header(first)
+        width = len(header)
+
+        kinds = _column_kinds(sheet.iter_rows(min_row=2, values_only=True), width)
+
+        buffer = []
+        for row in rows:
+            if all(v is None for v in row):
+                continue
+            buffer.append(
+                tuple(_cell(v) for v in row[:width]) + (None,) * (width - len(row))
+            )
+
+            if len(buffer) >= chunk_rows:
+                yield _frame(buffer, header, kinds)
+                buffer = []
+
+        if buffer:
+            yield _frame(buffer, header, kinds)
+    finally:
+        wb.close()
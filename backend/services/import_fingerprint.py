@@ -0,0 +1,75 @@
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+from backend.database import ImportRecord
+from backend.services.bulk_import import build_records, MASTER_COLUMNS
+
+# ---------------------------------------------------------
+# FINGERABDRUCK EINES IMPORTS
+# ---------------------------------------------------------
+# Dieselbe Datei wird regelmäßig doppelt hochgeladen (zwei Schichten,
+# Browser-Wiederholung). Pro Import werden gespeichert:
+#   - SHA-256 des Dateiinhalts  → identische Datei: sofort fertig
+#   - Hash jeder Zeile          → bekannte Zeilen werden nicht erneut mit dem
+#                                 Bestand verglichen (Parkzone und Auftrags-
+#                                 status laufen trotzdem über alle Zeilen)
+#
+# Verglichen wird immer mit dem LETZTEN Import: nur dessen Stand steht
+# sicher in der DB (eine ältere Datei erneut hochladen ist eine Änderung).
+#
+# Die Zeilen-Hashes werden aus build_records gebildet (Text über norm(),
+# Zahlen als float) – dieselben Daten als xlsx oder CSV ergeben dieselben Hashes.
+#
+#   IMPORT_HISTORY  so viele Importe bleiben gespeichert
+
+IMPORT_HISTORY = int(os.getenv("IMPORT_HISTORY", "20"))
+
+
+def content_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    if df.empty:
+        return np.empty(0, dtype=np.uint64)
+    rows = build_records(df)
+    return pd.util.hash_pandas_object(rows[MASTER_COLUMNS], index=False).to_numpy()
+
+
+def last_import(db):
+    return db.query(ImportRecord).order_by(ImportRecord.id.desc()).first()
+
+
+def known_rows(record) -> np.ndarray:
+    """Zeilen-Hashes eines Imports (sortiert), leer wenn es keinen gibt."""
+    if record is None or not record.row_hashes:
+        return np.empty(0, dtype=np.uint64)
+    return np.frombuffer(record.row_hashes, dtype="<u8")
+
+
+def record_import(db, filename: str, fmt: str, mode: str, digest: str, hashes: np.ndarray):
+    """Import festhalten, ältere über IMPORT_HISTORY hinaus löschen. Commit macht der Aufrufer."""
+    rows = len(hashes)
+    hashes = np.unique(hashes).astype("<u8")
+
+    db.add(ImportRecord(
+        filename=filename,
+        format=fmt,
+        mode=mode,
+        content_hash=digest,
+        rows=rows,
+        row_hashes=hashes.tobytes(),
+    ))
+    db.flush()
+
+    keep = [
+        i for (i,) in db.query(ImportRecord.id)
+        .order_by(ImportRecord.id.desc())
+        .limit(IMPORT_HISTORY)
+    ]
+    db.query(ImportRecord).filter(ImportRecord.id.notin_(keep)).delete(
+        synchronize_session=False
+    )
@@ -0,0 +1,388 @@
+import queue
+import threading
+import uuid
+from datetime import datetime
+
+import numpy as np
+
+from backend.utils.dataframe import prepare_dataframe, column_plan
+from backend.services.bulk_import import import_dataframe, import_delta, merge_diff, norm
+from backend.services.excel_stream import use_streaming, iter_excel_chunks, sheet_header
+from backend.services.upload_formats import detect_format, read_upload
+from backend.services.import_fingerprint import (
+    content_hash, row_hashes, last_import, known_rows, record_import,
+)
+from backend.database_base import SessionLocal
+from backend.database import Item, CompletedToday
+from backend.logic.order_status import refresh_orders
+from backend.utils.item_snapshot import bump_data_version
+from backend.services.live_updates import publish_reload
+from backend.services.picking import after_commit
+from backend.services.completion import complete_orders
+from backend.services.ocr_match import update_orders as update_match_index
+
+# Wie viele abgeschlossene Jobs im Speicher bleiben
+MAX_FINISHED_JOBS = 50
+
+# "voll"  = Dashboard leeren, Ausgelieferte löschen, nur neue merge_keys anlegen
+# "delta" = nur Änderungen gegenüber dem Bestand schreiben, Fortschritt bleibt
+IMPORT_MODES = ("voll", "delta")
+
+_jobs = {}
+_jobs_lock = threading.Lock()
+_queue = queue.Queue()
+_worker = None
+
+
+# ---------------------------------------------------------
+# Job-Verwaltung
+# ---------------------------------------------------------
+def _new_job(filename: str, mode: str, fmt: str = "xlsx") -> dict:
+    return {
+        "id": uuid.uuid4().hex,
+        "filename": filename,
+        "mode": mode,
+        "format": fmt,
+        "status": "wartend",      # wartend → laeuft → fertig | fehler
+        "phase": "",
+        "created": datetime.now().strftime("%H:%M:%S"),
+        "finished": None,
+        "rows_parsed": 0,
+        "inserted": 0,
+        "skipped": 0,
+        "warnings": 0,
+        "message": "",
+        "bekannt": 0,                 # Zeilen schon im letzten Import → nicht erneut verglichen
+        "bereits_importiert": None,   # identische Datei: Zeitpunkt/Name des Imports
+        "diff": None,
+        "result": None,
+    }
+
+
+def _update(job: dict, **fields):
+    with _jobs_lock:
+        job.update(fields)
+
+
+def _prune_jobs():
+    finished = [
+        j for j in _jobs.values()
+        if j["status"] in ("fertig", "fehler")
+    ]
+    for job in finished[:-MAX_FINISHED_JOBS]:
+        _jobs.pop(job["id"], None)
+
+
+def get_job(job_id: str):
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+        return dict(job) if job else None
+
+
+def job_progress(job: dict) -> dict:
+    """Öffentliche Sicht eines Jobs (ohne Ergebnislisten)."""
+    return {k: v for k, v in job.items() if k != "result"}
+
+
+def submit_upload(content: bytes, filename: str = "", mode: str = "voll") -> dict:
+    """
+    Legt einen Import-Job an und reiht ihn in die Warteschlange ein.
+    Es gibt genau EINEN Worker → Uploads laufen nacheinander, nie verschachtelt.
+    """
+    if mode not in IMPORT_MODES:
+        raise ValueError(f"Unbekannter Import-Modus: {mode}")
+
+    # Unbekanntes Format → sofort 400, nicht erst im Worker
+    fmt = detect_format(content, filename)
+
+    job = _new_job(filename, mode, fmt)
+
+    with _jobs_lock:
+        _prune_jobs()
+        _jobs[job["id"]] = job
+
+    _ensure_worker()
+    _queue.put((job, content))
+
+    return dict(job)
+
+
+# ---------------------------------------------------------
+# Worker
+# ---------------------------------------------------------
+def _ensure_worker():
+    global _worker
+
+    with _jobs_lock:
+        if _worker is not None and _worker.is_alive():
+            return
+
+        _worker = threading.Thread(target=_worker_loop, daemon=True)
+        _worker.start()
+
+
+def _worker_loop():
+    while True:
+        job, content = _queue.get()
+        try:
+            _run_job(job, content)
+        except Exception as e:
+            print("Import-Job Fehler:", e)
+            _update(
+                job,
+                status="fehler",
+                message=str(e),
+                finished=datetime.now().strftime("%H:%M:%S"),
+            )
+        finally:
+            _queue.task_done()
+
+
+def _check_header(header: list):
+    """Gleiche Prüfung wie prepare_dataframe, nur anhand der Kopfzeile."""
+    if column_plan(tuple(header))[1] is None:
+        raise ValueError("Keine gültige Kürzel-Spalte gefunden.")
+
+
+def _prepared_chunks(job: dict, content: bytes):
+    """Streaming: Teilstücke lesen + vorbereiten, Fortschritt mitzählen."""
+    rows = 0
+    for chunk in iter_excel_chunks(content):
+        df = prepare_dataframe(chunk)
+        rows += len(df)
+        _update(job, rows_parsed=rows)
+        yield df
+
+
+def _mark_seen(job: dict, frames, known, hashes: list):
+    """
+    (DataFrame, Maske der Zeilen aus dem letzten Import) je Teilstück;
+    alle Zeilen-Hashes sammeln. Die Zeilen bleiben im DataFrame: Parkzone
+    und Auftragsstatus brauchen jede ProdID der Datei.
+    """
+    count = 0
+    for df in frames:
+        h = row_hashes(df)
+        hashes.append(h)
+
+        seen = np.isin(h, known) if known.size else np.zeros(len(h), dtype=bool)
+        if seen.any():
+            count += int(seen.sum())
+            _update(job, bekannt=count)
+
+        yield df, seen
+
+
+def _already_imported(job: dict, record):
+    _update(
+        job,
+        status="fertig",
+        phase="",
+        message="bereits importiert",
+        finished=datetime.now().strftime("%H:%M:%S"),
+        bereits_importiert={
+            "zeit": record.created_at.strftime("%d.%m.%Y %H:%M"),
+            "dateiname": record.filename,
+            "modus": record.mode,
+            "zeilen": record.rows,
+        },
+        result={"errors": [], "warnings": []},
+    )
+
+
+def _run_job(job: dict, content: bytes):
+    _update(job, status="laeuft", phase="Fingerabdruck prüfen")
+
+    # Identische Datei im selben Modus wie beim letzten Import → nichts zu tun
+    # (voll nach delta muss trotzdem Dashboard und Ausgelieferte leeren)
+    digest = content_hash(content)
+    db = SessionLocal()
+    try:
+        previous = last_import(db)
+        if (
+            previous is not None
+            and previous.content_hash == digest
+            and previous.mode == job["mode"]
+        ):
+            _already_imported(job, previous)
+            return
+        known = known_rows(previous)
+    finally:
+        db.close()
+
+    _update(job, phase=f"{job['format'].upper()} lesen")
+
+    if job["format"] == "xlsx" and use_streaming(content):
+        # Kopfzeile prüfen, bevor der Import etwas löscht
+        _check_header(sheet_header(content))
+
+        # Große Datei: Teilstück für Teilstück lesen und importieren
+        _update(job, phase="Importieren (Streaming)")
+        frames = _prepared_chunks(job, content)
+        streaming = True
+    else:
+        df = read_upload(content, job["format"])
+
+        _update(job, phase="Daten vorbereiten")
+        df = prepare_dataframe(df)
+
+        _update(job, phase="Importieren", rows_parsed=len(df))
+        frames = [df]
+        streaming = False
+
+    hashes = []
+    frames = _mark_seen(job, frames, known, hashes)
+
+    def on_progress(**counts):
+        _update(job, **counts)
+
+    if job["mode"] == "delta":
+        errors, warnings, diff = run_delta_upload(frames, on_progress, streaming)
+    else:
+        errors, warnings = run_upload(frames, on_progress, streaming)
+        diff = None
+
+    db = SessionLocal()
+    try:
+        record_import(
+            db, job["filename"], job["format"], job["mode"], digest,
+            np.concatenate(hashes) if hashes else np.empty(0, dtype=np.uint64),
+        )
+        db.commit()
+    finally:
+        db.close()
+
+    _update(
+        job,
+        status="fertig",
+        phase="",
+        finished=datetime.now().strftime("%H:%M:%S"),
+        diff=diff,
+        result={"errors": errors, "warnings": warnings},
+    )
+
+
+def _offset_progress(on_progress, totals: dict):
+    """Zähler eines Teilstücks → Gesamtzähler (Stand vor dem Teilstück + Teilstück)."""
+    if on_progress is None:
+        return None
+
+    def progress(**counts):
+        on_progress(**{k: totals[k] + v for k, v in counts.items()})
+
+    return progress
+
+
+# ---------------------------------------------------------
+# Eigentlicher Upload (Dashboard leeren + Import)
+# ---------------------------------------------------------
+def _clear_dashboard(db) -> set:
+    """
+    Dashboard leeren, ausgelieferte Items löschen → betroffene ProdIDs.
+    Kein Commit: scheitert der Import danach, wird auch das Leeren
+    zurückgerollt (Streaming liest die Datei erst während des Imports).
+    """
+    # 1) Dashboard leeren
+    db.query(CompletedToday).delete()
+
+    # 2) Nur vollständig abgeschlossene Items löschen
+    delivered = [p for (p,) in db.query(Item.prod_id).filter(Item.ausgeliefert == True).distinct()]
+
+    db.query(Item).filter(Item.ausgeliefert == True).delete()
+    refresh_orders(db, delivered)
+
+    return set(delivered)
+
+
+def run_upload(frames, on_progress=None, scope_to_file=False):
+    """
+    frames: (DataFrame, Maske "im letzten Import") – eines (ganze Datei)
+    oder viele Teilstücke (Streaming, dann scope_to_file=True).
+    Leeren und Import in EINER Transaktion, ein Commit am Ende.
+    """
+    db = SessionLocal()
+
+    # Betroffene Aufträge (für den OCR-Abgleich-Index)
+    prod_ids = set()
+    errors, warnings = [], []
+    totals = {"skipped": 0, "warnings": 0, "inserted": 0}
+
+    try:
+        prod_ids |= _clear_dashboard(db)
+
+        # 3) Neue Items aus Excel hinzufügen (mengenbasiert, Bulk-Insert je Teilstück)
+        for df, seen in frames:
+            if "prod_id" in df.columns:
+                prod_ids.update(df["prod_id"].map(norm))
+
+            e, w, inserted = import_dataframe(
+                db, df,
+                on_progress=_offset_progress(on_progress, totals),
+                scope_to_file=scope_to_file,
+                seen=seen,
+            )
+            errors += e
+            warnings += w
+            totals.update(
+                skipped=totals["skipped"] + len(e),
+                warnings=totals["warnings"] + len(w),
+                inserted=totals["inserted"] + inserted,
+            )
+
+        db.commit()
+    finally:
+        db.close()
+        bump_data_version()
+        publish_reload()
+        update_match_index(prod_ids)
+
+    return errors, warnings
+
+
+# ---------------------------------------------------------
+# Delta-Upload (Bestand bleibt, nur Änderungen schreiben)
+# ---------------------------------------------------------
+def run_delta_upload(frames, on_progress=None, scope_to_file=False):
+    db = SessionLocal()
+    prod_ids = set()
+    errors, warnings, diff = [], [], None
+    totals = {"skipped": 0, "warnings": 0, "inserted": 0}
+
+    # Dubletten über Teilstücke hinweg erkennen
+    seen_keys = set() if scope_to_file else None
+
+    try:
+        items_before = db.query(Item.id).count()
+
+        for df, seen in frames:
+            e, w, part, touched = import_delta(
+                db, df,
+                on_progress=_offset_progress(on_progress, totals),
+                scope_to_file=scope_to_file,
+                seen_keys=seen_keys,
+                seen=seen,
+            )
+            errors += e
+            warnings += w
+            prod_ids |= touched
+            diff = merge_diff(diff, part)
+            totals.update(
+                skipped=totals["skipped"] + len(e),
+                warnings=totals["warnings"] + len(w),
+                inserted=totals["inserted"] + part["neu"],
+            )
+
+        if diff is not None and scope_to_file:
+            diff["nicht_in_datei"] = items_before - diff["geaendert"] - diff["unveraendert"]
+
+        # Geänderte Stammdaten können Aufträge fertig machen
+        complete_orders(db, prod_ids)
+        db.commit()
+    finally:
+        db.close()
+
+        # Nichts geändert → Boards und Caches bleiben, wie sie sind
+        if prod_ids:
+            after_commit(prod_ids)
+
+    return errors, warnings, diff
@@ -0,0 +1,192 @@
+import asyncio
+import itertools
+import json
+import threading
+
+from backend.database_base import SessionLocal
+from backend.database import OrderStatus
+from backend.logic.order_status import order_is_done
+from backend.logic.ladungstraeger import load_ladungstraeger
+from backend.logic.produktion_state import load_state
+from backend.utils.tiles import (
+    logistik_tile,
+    logistik_lt_tile,
+    produktion_tile,
+    sort_logistik_tiles,
+)
+
+# ---------------------------------------------------------
+# LIVE-UPDATES FÜR LOGISTIK-/PRODUKTIONS-BOARDS (SSE)
+# ---------------------------------------------------------
+# Jeder verbundene Browser hat eine kleine asyncio.Queue auf dem Event-Loop.
+# Schreibende Routen laufen im Threadpool und reichen Events über
+# call_soon_threadsafe() an die Queues weiter. Leerlaufende Verbindungen
+# kosten damit nur eine wartende Coroutine.
+
+# Wie viele Events pro Verbindung höchstens anstehen (danach: Reload)
+MAX_PENDING_EVENTS = 100
+
+IN_CHUNK_SIZE = 500
+
+_subscribers = set()
+_lock = threading.Lock()
+_event_ids = itertools.count(1)
+
+
+class Subscriber:
+    def __init__(self, loop):
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=MAX_PENDING_EVENTS)
+
+
+def subscribe() -> Subscriber:
+    """Muss im Event-Loop aufgerufen werden (SSE-Route)."""
+    sub = Subscriber(asyncio.get_running_loop())
+    with _lock:
+        _subscribers.add(sub)
+    return sub
+
+
+def unsubscribe(sub: Subscriber):
+    with _lock:
+        _subscribers.discard(sub)
+
+
+def subscriber_count() -> int:
+    with _lock:
+        return len(_subscribers)
+
+
+def _offer(sub: Subscriber, event: dict):
+    try:
+        sub.queue.put_nowait(event)
+    except asyncio.QueueFull:
+        # Browser kommt nicht hinterher → alles verwerfen, einmal neu laden
+        while not sub.queue.empty():
+            sub.queue.get_nowait()
+        sub.queue.put_nowait({"id": event["id"], "type": "reload"})
+
+
+def publish(event_type: str, **data):
+    """Thread-sicher, kann aus sync- und async-Routen aufgerufen werden."""
+    with _lock:
+        subs = list(_subscribers)
+
+    if not subs:
+        return
+
+    event = {"id": next(_event_ids), "type": event_type, **data}
+
+    for sub in subs:
+        try:
+            sub.loop.call_soon_threadsafe(_offer, sub, event)
+        except RuntimeError:
+            # Loop bereits beendet
+            unsubscribe(sub)
+
+
+# ---------------------------------------------------------
+# Events der schreibenden Routen
+# ---------------------------------------------------------
+def publish_orders(prod_ids):
+    """
+    Aktuelle Kacheln aller Aufträge der ProdIDs senden.
+    Das Board ersetzt alle Kacheln dieser ProdID – fertige, verschobene
+    oder gelöschte Aufträge verschwinden dadurch automatisch.
+    """
+    if not subscriber_count():
+        return
+
+    prod_ids = sorted({p for p in prod_ids if p is not None})
+
+    db = SessionLocal()
+    try:
+        orders = []
+        for i in range(0, len(prod_ids), IN_CHUNK_SIZE):
+            chunk = prod_ids[i:i + IN_CHUNK_SIZE]
+            orders += db.query(OrderStatus).filter(OrderStatus.prod_id.in_(chunk)).all()
+
+        tiles = {p: [] for p in prod_ids}
+        for o in orders:
+            if o.verschoben or not o.total_buendel or order_is_done(o):
+                continue
+            tiles[o.prod_id].append(logistik_tile(o))
+    finally:
+        db.close()
+
+    for prod_id, prod_tiles in tiles.items():
+        publish("orders", prod_id=prod_id, tiles=sort_logistik_tiles(prod_tiles))
+
+
+def publish_lt(lt_id: str):
+    """Status eines Ladungsträgers (fertig / offen / gelöscht) senden."""
+    if not subscriber_count():
+        return
+
+    lt = next((lt for lt in load_ladungstraeger() if lt["id"] == lt_id), None)
+
+    if lt is None:
+        publish("lt", lt_id=lt_id, status="geloescht")
+        return
+
+    status = load_state().get(lt_id, "offen")
+    publish(
+        "lt",
+        lt_id=lt_id,
+        status=status,
+        produktion_tile=produktion_tile(lt, status),
+        logistik_tile=logistik_lt_tile(lt) if status == "fertig" else None,
+    )
+
+
+def publish_reload():
+    """Große Änderungen (Upload) → Boards laden einmal komplett neu."""
+    publish("reload")
+
+
+# ---------------------------------------------------------
+# SSE-Format
+# ---------------------------------------------------------
+def render_event(event: dict, templates) -> str:
+    """
+    Baut den SSE-Block inkl. fertigem Kachel-HTML. Das Ergebnis wird am
+    Event gemerkt, damit bei vielen Boards nur EINMAL gerendert wird.
+    """
+    cached = event.get("_sse")
+    if cached:
+        return cached
+
+    payload = {k: v for k, v in event.items() if not k.startswith("_")}
+
+    if event["type"] == "orders":
+        template = templates.get_template("partials/logistik_tile.html")
+        payload["tiles"] = [
+            {
+                "day": t["start_bft"].split(" ")[0],
+                "html": template.render(tile=t),
+            }
+            for t in event["tiles"]
+        ]
+
+    elif event["type"] == "lt" and event["status"] != "geloescht":
+        payload["produktion_html"] = templates.get_template(
+            "partials/produktion_tile.html"
+        ).render(tile=event["produktion_tile"])
+
+        payload["logistik_html"] = (
+            templates.get_template("partials/logistik_lt_tile.html").render(
+                p=event["logistik_tile"]
+            )
+            if event["logistik_tile"]
+            else None
+        )
+        payload.pop("produktion_tile")
+        payload.pop("logistik_tile")
+
+    block = (
+        f"id: {event['id']}\n"
+        f"event: {event['type']}\n"
+        f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+    )
+    event["_sse"] = block
+    return block
@@ -0,0 +1,156 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+# ---------------------------------------------------------
+# OCR-ERGEBNIS-CACHE
+# ---------------------------------------------------------
+# Kommissionierer scannen dasselbe Etikett oft mehrfach, das Tablet schickt
+# bei schlechten Ergebnissen dasselbe Foto erneut. Das Ergebnis (Felder +
+# debug_raw) hängt nur vom Bild ab → Cache über den SHA-256 der Bild-Bytes.
+#
+# Optional (OCR_CACHE_PHASH=1) zusätzlich über einen Wahrnehmungs-Hash des
+# ausgeschnittenen Etiketts: trifft auch neu fotografierte, gleiche Etiketten.
+# Standardmäßig aus – sehr ähnliche Etiketten (nur eine Ziffer anders) können
+# denselben Hash bekommen.
+#
+#   OCR_CACHE_ENTRIES       max. Einträge (LRU), 0 = Cache aus
+#   OCR_CACHE_TTL_SECONDS   Lebensdauer eines Eintrags
+#   OCR_CACHE_PHASH_MAX_DISTANCE  erlaubte abweichende Bits (von 256)
+
+OCR_CACHE_ENTRIES = int(os.getenv("OCR_CACHE_ENTRIES", "256"))
+OCR_CACHE_TTL_SECONDS = float(os.getenv("OCR_CACHE_TTL_SECONDS", "900"))
+OCR_CACHE_PHASH = os.getenv("OCR_CACHE_PHASH", "0") == "1"
+OCR_CACHE_PHASH_MAX_DISTANCE = int(os.getenv("OCR_CACHE_PHASH_MAX_DISTANCE", "6"))
+
+
+class LruCache:
+    """Kleiner thread-sicherer LRU-Cache mit TTL."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._data = OrderedDict()      # key → (expires, value)
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+
+            expires, value = entry
+            if expires < now:
+                del self._data[key]
+                self.stats["expired"] += 1
+                self.stats["misses"] += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.stats["hits"] += 1
+            return value
+
+    def put(self, key, value):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def items(self):
+        """Gültige Einträge (ohne Statistik zu verändern)."""
+        now = time.monotonic()
+        with self._lock:
+            return [(k, v) for k, (expires, v) in self._data.items() if expires >= now]
+
+    def touch(self, key):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.stats["hits"] += 1
+
+    def miss(self):
+        with self._lock:
+            self.stats["misses"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def info(self) -> dict:
+        with self._lock:
+            total = self.stats["hits"] + self.stats["misses"]
+            return {
+                **self.stats,
+                "entries": len(self._data),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hit_rate": round(self.stats["hits"] / total, 3) if total else 0.0,
+            }
+
+
+_by_content = LruCache(OCR_CACHE_ENTRIES, OCR_CACHE_TTL_SECONDS)
+_by_label = LruCache(OCR_CACHE_ENTRIES, OCR_CACHE_TTL_SECONDS)
+
+
+def content_key(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def _distance(a: str, b: str) -> int:
+    return bin(int(a, 16) ^ int(b, 16)).count("1")
+
+
+# ---------------------------------------------------------
+# Zugriff
+# ---------------------------------------------------------
+def get_by_content(key: str):
+    return _by_content.get(key)
+
+
+def get_by_label(label_hash: str):
+    """Ähnlichster Eintrag innerhalb OCR_CACHE_PHASH_MAX_DISTANCE Bits."""
+    best_key, best_value, best_distance = None, None, OCR_CACHE_PHASH_MAX_DISTANCE + 1
+
+    for key, value in _by_label.items():
+        d = _distance(key, label_hash)
+        if d < best_distance:
+            best_key, best_value, best_distance = key, value, d
+
+    if best_key is None:
+        _by_label.miss()
+        return None
+
+    _by_label.touch(best_key)
+    return best_value
+
+
+def put(key: str, result: dict, label_hash: str = None):
+    _by_content.put(key, result)
+    if label_hash:
+        _by_label.put(label_hash, result)
+
+
+def with_cache_info(result: dict, source: str) -> dict:
+    """Kopie des Ergebnisses mit Vermerk, woher es kam (Cache-Einträge bleiben unverändert)."""
+    return {**result, "debug_raw": {**result.get("debug_raw", {}), "cache": source}}
+
+
+def clear():
+    _by_content.clear()
+    _by_label.clear()
+
+
+def cache_stats() -> dict:
+    return {
+        "content": _by_content.info(),
+        "label": _by_label.info() if OCR_CACHE_PHASH else None,
+    }
@@ -0,0 +1,693 @@
+import io
+import json
+import os
+import re
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from backend.utils.ocr_text import normalize_ocr_value, extract_first
+
+# ---------------------------------------------------------
+# OCR-PIPELINE (läuft in den Prozessen des OCR-Pools)
+# ---------------------------------------------------------
+# Jeder Pool-Prozess lädt das easyocr-Modell genau EINMAL in init_worker().
+# Dieses Modul wird nur in den Pool-Prozessen importiert (ocr_pool._call),
+# der Web-Prozess lädt weder cv2 noch easyocr/torch.
+
+# Etikett-Vorlagen: Feldbereiche relativ zum erkannten Etikett-Rechteck.
+# Nur diese kleinen Bereiche werden erkannt (ohne Texterkennung/Detektion
+# über das ganze Etikett). Einschalten erst nach Kalibrierung mit
+# benchmarks/bench_ocr_fields.py auf echten Fotos.
+OCR_LABEL_TEMPLATES = os.getenv("OCR_LABEL_TEMPLATES", "0") == "1"
+OCR_TEMPLATES_PATH = os.getenv("OCR_TEMPLATES_PATH", "backend/data/ocr_templates.json")
+
+# Rand um jeden Feldbereich (Anteil der Etikettgröße)
+FIELD_PADDING = 0.01
+
+# Rand, den easyocr.detect() um jede Textbox legt (Anteil der Boxhöhe).
+# Beim Stapeln mehrerer Ausschnitte liegt mindestens so viel Weiß zwischen
+# zwei Ausschnitten, damit eine Box nie in den Nachbarn hineinreicht.
+DETECT_MARGIN = 0.1
+
+# Schnelles Dekodieren: Handyfotos (12 MP) werden für die Suche nach dem
+# Etikett-Rechteck verkleinert dekodiert (JPEG: PIL-Draft 1/2 … 1/8), nur der
+# Etikett-Ausschnitt wird für die Erkennung in voller Auflösung geholt.
+#   OCR_DETECT_MAX_SIDE       längste Seite des Suchbilds (px)
+#   OCR_RECOGNITION_MAX_SIDE  längste Seite des Bilds für die Erkennung,
+#                             0 = Originalauflösung
+OCR_FAST_DECODE = os.getenv("OCR_FAST_DECODE", "1") == "1"
+OCR_DETECT_MAX_SIDE = int(os.getenv("OCR_DETECT_MAX_SIDE", "1024"))
+OCR_RECOGNITION_MAX_SIDE = int(os.getenv("OCR_RECOGNITION_MAX_SIDE", "0"))
+
+# Mehrere Etiketten pro Foto (Batch-Route): Mindestgröße als Anteil der
+# Bildfläche, Obergrenze pro Foto
+OCR_MIN_LABEL_AREA = float(os.getenv("OCR_MIN_LABEL_AREA", "0.01"))
+OCR_MAX_LABELS_PER_IMAGE = int(os.getenv("OCR_MAX_LABELS_PER_IMAGE", "20"))
+
+# Barcode/QR-Code vor der OCR lesen (deutlich schneller als easyocr)
+OCR_CODES = os.getenv("OCR_CODES", "1") == "1"
+
+# Schlüssel in Code-Inhalten ("kuerzel=…;stk=…" oder JSON) → Feldname
+CODE_KEYS = {
+    "kuerzel": "kuerzel",
+    "kz": "kuerzel",
+    "stueckzahl": "stueckzahl",
+    "stk": "stueckzahl",
+    "st": "stueckzahl",
+    "menge": "stueckzahl",
+    "durchmesser": "durchmesser",
+    "dm": "durchmesser",
+    "d": "durchmesser",
+    "laenge": "laenge",
+    "l": "laenge",
+    "artikelnummer": "artikelnummer",
+    "artikel_nr": "artikelnummer",
+    "art": "artikelnummer",
+}
+
+FIELDS = ["kuerzel", "stueckzahl", "durchmesser", "laenge", "artikelnummer"]
+
+_reader = None
+_templates = None
+
+
+def init_worker():
+    """Initializer der Pool-Prozesse: Modell laden."""
+    global _reader
+    import easyocr
+
+    _reader = easyocr.Reader(['de'], gpu=False)
+
+
+def warmup() -> bool:
+    """Leerer Job, damit der Pool seine Prozesse (und Modelle) sofort startet."""
+    return _reader is not None
+
+
+# ---------------------------------------------------------
+# Hilfsfunktionen
+# ---------------------------------------------------------
+def _label_quads(img) -> list:
+    """Alle äußeren Vierecke im Bild als (x, y, w, h)."""
+    edges = cv2.Canny(img, 50, 150)
+    contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+    quads = []
+    for c in contours:
+        approx = cv2.approxPolyDP(c, 0.02 * cv2.arcLength(c, True), True)
+        if len(approx) == 4:
+            quads.append(cv2.boundingRect(approx))
+
+    return quads
+
+
+def find_label_region(img):
+    best = None
+    best_area = 0
+
+    for x, y, w, h in _label_quads(img):
+        area = w * h
+        if area > best_area:
+            best_area = area
+            best = (x, y, w, h)
+
+    return best
+
+
+def _overlap(a, b) -> float:
+    """Anteil der kleineren Box, der in der anderen liegt."""
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    iw = max(0, min(ax + aw, bx + bw) - max(ax, bx))
+    ih = max(0, min(ay + ah, by + bh) - max(ay, by))
+    return iw * ih / max(1, min(aw * ah, bw * bh))
+
+
+def find_label_regions(img) -> list:
+    """
+    Alle Etiketten im Bild (z.B. Palette mit mehreren Etiketten):
+    Vierecke ab OCR_MIN_LABEL_AREA der Bildfläche, ohne Überlappungen,
+    sortiert von oben links nach unten rechts.
+    """
+    min_area = OCR_MIN_LABEL_AREA * img.shape[0] * img.shape[1]
+
+    regions = []
+    for quad in sorted(_label_quads(img), key=lambda q: q[2] * q[3], reverse=True):
+        if quad[2] * quad[3] < min_area:
+            break
+        if any(_overlap(quad, r) > 0.5 for r in regions):
+            continue
+        regions.append(quad)
+        if len(regions) >= OCR_MAX_LABELS_PER_IMAGE:
+            break
+
+    return sorted(regions, key=lambda r: (r[1], r[0]))
+
+
+# ---------------------------------------------------------
+# Dekodieren + Etikett ausschneiden
+# ---------------------------------------------------------
+def _open_gray(content: bytes, max_side: int = 0):
+    """
+    Öffnet das Bild als Graustufen. Mit max_side dekodiert PIL JPEGs direkt
+    verkleinert (Draft: 1/2, 1/4, 1/8) – das spart Zeit und Speicher.
+    """
+    image = Image.open(io.BytesIO(content))
+    w, h = image.size
+
+    if max_side and max(w, h) > max_side:
+        scale = max_side / max(w, h)
+        image.draft("L", (int(w * scale), int(h * scale)))
+
+    return image.convert("L"), (w, h)
+
+
+def detection_image(content: bytes):
+    """
+    → (Graustufenbild für die Rechteck-Suche, Faktor Original/Suchbild).
+    Ohne OCR_FAST_DECODE: Originalgröße, Faktor 1.
+    """
+    if not OCR_FAST_DECODE:
+        return np.array(Image.open(io.BytesIO(content)).convert("L")), 1.0
+
+    image, (w, _) = _open_gray(content, OCR_DETECT_MAX_SIDE)
+    small = np.array(image)
+
+    # Draft skaliert nur in Zweierpotenzen → Rest mit cv2
+    longest = max(small.shape)
+    if longest > OCR_DETECT_MAX_SIDE:
+        f = OCR_DETECT_MAX_SIDE / longest
+        small = cv2.resize(
+            small,
+            (int(small.shape[1] * f), int(small.shape[0] * f)),
+            interpolation=cv2.INTER_AREA,
+        )
+
+    return small, w / small.shape[1]
+
+
+def recognition_crop(content: bytes, small, region_small, factor: float):
+    """
+    Etikett-Ausschnitt für die Erkennung in (bis zu) Originalauflösung.
+    → (Ausschnitt, Region in Originalkoordinaten oder None)
+    """
+    return recognition_crops(content, small, [region_small], factor)[0]
+
+
+def recognition_crops(content: bytes, small, regions_small: list, factor: float) -> list:
+    """Wie recognition_crop, für mehrere Etiketten eines Fotos (einmal dekodieren)."""
+    regions = [
+        tuple(int(round(v * factor)) for v in r) if r else None
+        for r in regions_small
+    ]
+
+    # Suchbild hat bereits die nötige Auflösung → nicht erneut dekodieren
+    if factor == 1.0 and not OCR_RECOGNITION_MAX_SIDE:
+        return [
+            (_slice(small, r), region)
+            for r, region in zip(regions_small, regions)
+        ]
+
+    image, (w, h) = _open_gray(content, OCR_RECOGNITION_MAX_SIDE)
+
+    # Originalkoordinaten → Koordinaten des (evtl. per Draft verkleinerten) Bilds
+    f = image.size[0] / w
+
+    # Draft wirkt nur bei JPEG → andere Formate hier auf die Zielgröße bringen
+    r = 1.0
+    if OCR_RECOGNITION_MAX_SIDE:
+        target = min(1.0, OCR_RECOGNITION_MAX_SIDE / max(w, h))
+        if f > target * 1.01:
+            r = target / f
+
+    crops = []
+    for region in regions:
+        # Nur den Ausschnitt nach numpy kopieren, nie das ganze Foto
+        if region:
+            x, y, rw, rh = region
+            crop = np.array(image.crop((int(x * f), int(y * f), int((x + rw) * f), int((y + rh) * f))))
+        else:
+            crop = np.array(image)
+        if r < 1.0:
+            crop = cv2.resize(
+                crop,
+                (max(1, int(crop.shape[1] * r)), max(1, int(crop.shape[0] * r))),
+                interpolation=cv2.INTER_AREA,
+            )
+        crops.append((crop, region))
+
+    return crops
+
+
+def _slice(img, region):
+    if not region:
+        return img
+    x, y, w, h = region
+    return img[y:y+h, x:x+w]
+
+
+def crop_label(img):
+    """Graustufenbild → (Ausschnitt des Etiketts, Region oder None)."""
+    region = find_label_region(img)
+    return _slice(img, region), region
+
+
+def label_hash(content: bytes) -> str:
+    """
+    Wahrnehmungs-Hash (dHash, 256 Bit) des Etikett-Ausschnitts.
+    Gleiche Etiketten auf verschiedenen Fotos → (fast) gleicher Hash.
+    """
+    small, _ = detection_image(content)
+    crop, _ = crop_label(small)
+    small = cv2.resize(crop, (17, 16), interpolation=cv2.INTER_AREA)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    return "%064x" % int("".join("1" if b else "0" for b in bits), 2)
+
+
+# ---------------------------------------------------------
+# Barcode / QR-Code
+# ---------------------------------------------------------
+_code_detectors = None
+
+
+def _detectors() -> list:
+    """QR- und (ab OpenCV 4.8) 1D-Barcode-Detektor, einmal pro Prozess."""
+    global _code_detectors
+    if _code_detectors is None:
+        _code_detectors = [cv2.QRCodeDetector()]
+        if hasattr(cv2, "barcode"):
+            _code_detectors.append(cv2.barcode.BarcodeDetector())
+    return _code_detectors
+
+
+def decode_codes(img) -> list:
+    """Alle lesbaren Code-Inhalte im Graustufenbild."""
+    payloads = []
+
+    for detector in _detectors():
+        try:
+            ok, infos, _, _ = detector.detectAndDecodeMulti(img)
+        except cv2.error:
+            continue
+        if ok:
+            payloads += [p for p in infos if p]
+
+    return payloads
+
+
+def parse_code_payload(payload: str) -> dict:
+    """
+    Code-Inhalt → Rohwerte wie aus der OCR. Unterstützt JSON,
+    "schluessel=wert;…" (auch ":" / "|" / Zeilenumbrüche) und Klartext
+    wie auf dem Etikett (dann greifen die Volltext-Regexe).
+    """
+    payload = payload.strip()
+    pairs = {}
+
+    if payload.startswith("{"):
+        try:
+            pairs = json.loads(payload)
+        except json.JSONDecodeError:
+            pairs = {}
+
+    if not isinstance(pairs, dict) or not pairs:
+        pairs = {}
+        for part in re.split(r"[;|\n&]", payload):
+            m = re.match(r"\s*(\w+)\s*[=:]\s*(.*?)\s*$", part)
+            if m:
+                pairs[m.group(1)] = m.group(2)
+
+    raw = {f: v for f, v in extract_fields(payload).items() if v}
+
+    for key, value in pairs.items():
+        field = CODE_KEYS.get(str(key).strip().lower())
+        if field and value not in (None, ""):
+            raw[field] = str(value).strip()
+
+    return raw
+
+
+# ---------------------------------------------------------
+# Etikett-Vorlagen
+# ---------------------------------------------------------
+def load_templates() -> dict:
+    global _templates
+    if _templates is None:
+        if os.path.exists(OCR_TEMPLATES_PATH):
+            with open(OCR_TEMPLATES_PATH, "r", encoding="utf-8") as f:
+                _templates = json.load(f)
+        else:
+            _templates = {}
+    return _templates
+
+
+def pick_template(region, templates: dict):
+    """Erste Vorlage, deren Seitenverhältnis zum erkannten Etikett passt."""
+    if not region:
+        return None, None
+
+    _, _, w, h = region
+    aspect = w / h if h else 0
+
+    for name, template in templates.items():
+        if template.get("aspect_min", 0) <= aspect <= template.get("aspect_max", 99):
+            return name, template
+
+    return None, None
+
+
+def field_box(crop, box) -> list:
+    """Relativer Bereich [x, y, w, h] → [x_min, x_max, y_min, y_max] in Pixeln."""
+    ch, cw = crop.shape[:2]
+    x, y, w, h = box
+    pad_x, pad_y = FIELD_PADDING * cw, FIELD_PADDING * ch
+
+    return [
+        max(0, int((x * cw) - pad_x)),
+        min(cw, int((x + w) * cw + pad_x)),
+        max(0, int((y * ch) - pad_y)),
+        min(ch, int((y + h) * ch + pad_y)),
+    ]
+
+
+def read_template_fields(crop, template: dict) -> tuple:
+    """
+    Erkennt nur die Feldbereiche der Vorlage. Felder mit gleicher Allowlist
+    werden in EINEM recognize()-Aufruf erkannt (ohne Text-Detektion).
+    → (Rohwerte je Feld, erkannter Text je Feld)
+    """
+    return read_template_fields_batch([(crop, template)])[0]
+
+
+def read_template_fields_batch(items: list) -> list:
+    """
+    Wie read_template_fields für mehrere (Ausschnitt, Vorlage): alle
+    Ausschnitte liegen untereinander auf einer Fläche → pro Allowlist
+    EIN recognize()-Aufruf für alle Etiketten.
+    """
+    canvas, offsets = _stack([crop for crop, _ in items])
+
+    groups = {}
+    for i, ((crop, template), y0) in enumerate(zip(items, offsets)):
+        for name, field in template["fields"].items():
+            x_min, x_max, y_min, y_max = field_box(crop, field["box"])
+            groups.setdefault(field.get("allowlist"), []).append(
+                (i, name, [x_min, x_max, y_min + y0, y_max + y0])
+            )
+
+    texts = [{} for _ in items]
+    for allowlist, entries in groups.items():
+        results = _reader.recognize(
+            canvas,
+            horizontal_list=[box for _, _, box in entries],
+            free_list=[],
+            allowlist=allowlist,
+            decoder='greedy',
+            detail=1,
+        )
+
+        # easyocr sortiert die Ergebnisse nach y → über die Box-Ecke zuordnen
+        by_corner = {
+            (int(corners[0][0]), int(corners[0][1])): text
+            for corners, text, _ in results
+        }
+        for i, name, (x_min, _, y_min, _) in entries:
+            texts[i][name] = by_corner.get((x_min, y_min), "")
+
+    return [
+        (
+            {
+                name: extract_first(field["pattern"], texts[i].get(name, ""))
+                for name, field in template["fields"].items()
+            },
+            texts[i],
+        )
+        for i, (_, template) in enumerate(items)
+    ]
+
+
+def read_fulltext_batch(crops: list) -> list:
+    """
+    Volltext mehrerer Etikett-Ausschnitte: Text-Detektion pro Ausschnitt,
+    Erkennung aller Textzeilen in EINEM recognize()-Aufruf.
+    Liefert denselben Text wie readtext() pro Ausschnitt.
+    """
+    canvas, offsets = _stack(crops)
+
+    # Jede Box merkt sich ihren Ausschnitt (Schlüssel: linke obere Ecke),
+    # statt ihn später aus der y-Position zu raten
+    horizontal, free, source = [], [], {}
+    for i, (crop, y0) in enumerate(zip(crops, offsets)):
+        ch, cw = crop.shape[:2]
+        h_boxes, f_boxes = _reader.detect(crop, text_threshold=0.6, add_margin=DETECT_MARGIN)
+
+        for x1, x2, y1, y2 in h_boxes[0]:
+            # wie readtext() pro Ausschnitt: Box endet am Rand des Ausschnitts
+            box = [max(0, int(x1)), min(cw, int(x2)), max(0, int(y1)) + y0, min(ch, int(y2)) + y0]
+            horizontal.append(box)
+            source[(box[0], box[2])] = i
+
+        for poly in f_boxes[0]:
+            poly = [[int(x), int(y) + y0] for x, y in poly]
+            free.append(poly)
+            source[tuple(poly[0])] = i
+
+    texts = [[] for _ in crops]
+    if horizontal or free:
+        results = _reader.recognize(
+            canvas,
+            horizontal_list=horizontal,
+            free_list=free,
+            decoder='greedy',
+            contrast_ths=0.05,
+            adjust_contrast=0.7,
+            detail=1,
+            paragraph=False,
+        )
+
+        # Ergebnisse kommen nach y sortiert → über die Box-Ecke zuordnen
+        for corners, text, _ in results:
+            texts[source[(int(corners[0][0]), int(corners[0][1]))]].append(text)
+
+    return [" ".join(t for t in label if t).replace("\n", " ") for label in texts]
+
+
+def _stack(crops: list) -> tuple:
+    """
+    Ausschnitte untereinander auf eine weiße Fläche → (Fläche, y-Versätze).
+    Zwischen zwei Ausschnitten bleibt ein weißer Streifen von mindestens
+    DETECT_MARGIN der Ausschnitthöhe.
+    """
+    width = max(c.shape[1] for c in crops)
+    gap = int(DETECT_MARGIN * max(c.shape[0] for c in crops)) + 1
+    offsets = []
+    y = 0
+    for c in crops:
+        offsets.append(y)
+        y += c.shape[0] + gap
+    y -= gap
+
+    canvas = np.full((y, width), 255, dtype=np.uint8)
+    for c, y0 in zip(crops, offsets):
+        canvas[y0:y0 + c.shape[0], :c.shape[1]] = c
+
+    return canvas, offsets
+
+
+def extract_fields(full_text: str) -> dict:
+    return {
+        "kuerzel": extract_first(r"/\s*([A-Z0-9]{4,10})", full_text),
+        "stueckzahl": extract_first(r"(\d+)\s*St\b", full_text),
+        "durchmesser": extract_first(r"\b\d{1,2}/(\d{1,2})\b", full_text),
+        "laenge": extract_first(r"L[: ]+(\d{2,4})\b", full_text),
+        "artikelnummer": extract_first(r"([A-Z0-9]{3,10}-\d{6,10})", full_text),
+    }
+
+
+# ---------------------------------------------------------
+# Ein Etikett lesen (Bild-Bytes → Felder)
+# ---------------------------------------------------------
+def read_label(content: bytes, use_templates: bool = None, use_codes: bool = None) -> dict:
+    if use_templates is None:
+        use_templates = OCR_LABEL_TEMPLATES
+    if use_codes is None:
+        use_codes = OCR_CODES
+
+    small, factor = detection_image(content)
+
+    # 0) Barcode / QR-Code (auf dem Suchbild): reicht er für alle Felder,
+    #    ist weder volle Auflösung noch OCR nötig
+    code_raw, payloads = read_codes(small) if use_codes else ({}, [])
+    if all(code_raw.get(f) for f in FIELDS):
+        return code_result(code_raw, payloads, None)
+
+    crop, region = recognition_crop(content, small, find_label_region(small), factor)
+
+    result = read_label_ocr(crop, region, use_templates)
+    return merge_code(result, code_raw, payloads)
+
+
+def read_codes(img) -> tuple:
+    """→ (Rohwerte aus allen Codes im Bild, Code-Inhalte)"""
+    code_raw = {}
+    payloads = decode_codes(img)
+    for payload in payloads:
+        for field, value in parse_code_payload(payload).items():
+            code_raw.setdefault(field, value)
+    return code_raw, payloads
+
+
+def code_result(code_raw: dict, payloads: list, region) -> dict:
+    result = label_result(code_raw, region, "code", full_text=" ".join(payloads))
+    result["path"] = "code"
+    return result
+
+
+def merge_code(result: dict, code_raw: dict, payloads: list) -> dict:
+    """OCR-Ergebnis + Code mit Teilinformationen: Code-Werte haben Vorrang."""
+    result["path"] = "ocr"
+
+    if code_raw:
+        debug = result["debug_raw"]
+        result = {
+            **label_result({**debug["raw"], **code_raw}, debug["region"], debug["mode"],
+                           full_text=debug["full_text"]),
+            "path": "code+ocr",
+        }
+
+    if payloads:
+        result["debug_raw"]["codes"] = payloads
+
+    return result
+
+
+# ---------------------------------------------------------
+# Mehrere Fotos / mehrere Etiketten pro Foto
+# ---------------------------------------------------------
+def read_labels(contents: list, all_labels: bool = True,
+                use_templates: bool = None, use_codes: bool = None) -> list:
+    """
+    Liest alle Etiketten aller Fotos in einem Durchgang.
+    → pro Foto eine Liste von Ergebnissen (wie read_label, plus "region").
+
+    Codes werden pro Etikett gelesen; alle übrigen Etiketten des Batches
+    gehen gemeinsam durch die Erkennung (Vorlage bzw. Volltext).
+    """
+    if use_templates is None:
+        use_templates = OCR_LABEL_TEMPLATES
+    if use_codes is None:
+        use_codes = OCR_CODES
+
+    results = []
+    pending = []    # (Foto-Index, Etikett-Index, Ausschnitt, Region, Code-Rohwerte, Inhalte)
+
+    for i, content in enumerate(contents):
+        small, factor = detection_image(content)
+
+        regions = find_label_regions(small) if all_labels else [find_label_region(small)]
+        regions = [r for r in regions if r] or [None]
+
+        labels = [None] * len(regions)
+        need_ocr = []
+
+        for j, region_small in enumerate(regions):
+            code_raw, payloads = read_codes(_slice(small, region_small)) if use_codes else ({}, [])
+            if all(code_raw.get(f) for f in FIELDS):
+                region = tuple(int(round(v * factor)) for v in region_small) if region_small else None
+                labels[j] = code_result(code_raw, payloads, region)
+            else:
+                need_ocr.append((j, region_small, code_raw, payloads))
+
+        if need_ocr:
+            crops = recognition_crops(content, small, [r for _, r, _, _ in need_ocr], factor)
+            for (j, _, code_raw, payloads), (crop, region) in zip(need_ocr, crops):
+                crop = cv2.GaussianBlur(crop, (3, 3), 0)
+                crop = cv2.equalizeHist(crop)
+                pending.append((i, j, crop, region, code_raw, payloads))
+
+        results.append(labels)
+
+    # 1) Vorlagen (alle passenden Etiketten zusammen)
+    fulltext = []
+    if use_templates and pending:
+        templated = []
+        for entry in pending:
+            name, template = pick_template(entry[3], load_templates())
+            if template:
+                templated.append((entry, name, template))
+
+        done = set()
+        if templated:
+            batch = read_template_fields_batch([(e[2], t) for e, _, t in templated])
+            for (entry, name, _), (raw, texts) in zip(templated, batch):
+                if all(raw.get(f) for f in FIELDS):
+                    i, j, _, region, code_raw, payloads = entry
+                    result = label_result(raw, region, f"vorlage:{name}", texts=texts)
+                    results[i][j] = merge_code(result, code_raw, payloads)
+                    done.add((i, j))
+
+        fulltext = [e for e in pending if (e[0], e[1]) not in done]
+    else:
+        fulltext = pending
+
+    # 2) Volltext (alle restlichen Etiketten zusammen)
+    if fulltext:
+        texts = read_fulltext_batch([e[2] for e in fulltext])
+        for (i, j, _, region, code_raw, payloads), full_text in zip(fulltext, texts):
+            result = label_result(extract_fields(full_text), region, "volltext", full_text=full_text)
+            results[i][j] = merge_code(result, code_raw, payloads)
+
+    for labels in results:
+        for result in labels:
+            result["region"] = result["debug_raw"]["region"]
+
+    return results
+
+
+def read_label_ocr(crop, region, use_templates: bool) -> dict:
+    crop = cv2.GaussianBlur(crop, (3, 3), 0)
+    crop = cv2.equalizeHist(crop)
+
+    # 1) Vorlage: nur Feldbereiche erkennen
+    if use_templates:
+        name, template = pick_template(region, load_templates())
+        if template:
+            raw, texts = read_template_fields(crop, template)
+            # Nur übernehmen, wenn ALLE Felder gelesen wurden
+            if all(raw.get(f) for f in FIELDS):
+                return label_result(raw, region, f"vorlage:{name}", texts=texts)
+
+    # 2) Ganzes Etikett (Detektion + Erkennung)
+    texts = _reader.readtext(
+        crop,
+        detail=0,
+        paragraph=False,
+        contrast_ths=0.05,
+        adjust_contrast=0.7,
+        text_threshold=0.6,
+        decoder='greedy'
+    )
+
+    full_text = " ".join(t for t in texts if t).replace("\n", " ")
+
+    return label_result(extract_fields(full_text), region, "volltext", full_text=full_text)
+
+
+def label_result(raw: dict, region, mode: str, full_text: str = None, texts: dict = None) -> dict:
+    """Rohwerte → Antwort der OCR-Route (normalisiert + debug_raw)."""
+    result = {f: normalize_ocr_value(raw.get(f)) for f in FIELDS}
+
+    result["debug_raw"] = {
+        "mode": mode,
+        "full_text": full_text if full_text is not None else " ".join(
+            t for t in (texts or {}).values() if t
+        ),
+        "region": region,
+        "raw": {f: raw.get(f) for f in FIELDS},
+    }
+    if texts is not None:
+        result["debug_raw"]["fields"] = texts
+
+    return result
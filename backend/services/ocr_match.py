@@ -0,0 +1,322 @@
+import os
+import threading
+from collections import Counter
+
+from sqlalchemy import and_, not_, func
+
+from backend.database_base import SessionLocal
+from backend.database import Item
+from backend.utils.ocr_text import normalize_ocr_value
+
+# ---------------------------------------------------------
+# OCR → OFFENE ITEMS (Abgleich-Index im Speicher)
+# ---------------------------------------------------------
+# OCR-Felder laufen durch normalize_ocr_value (0→o, 1→i, …) und sind so nicht
+# mit den DB-Werten vergleichbar. Der Index hält für jedes offene Item
+# (nicht ausgeliefert, nicht in der Parkzone, kein Produktionsartikel) die
+# GLEICH normalisierten Werte von kuerzel, artikel_nr, durchmesser, laenge.
+#
+# Suche: exakt über das Kürzel, sonst über gemeinsame Trigramme (Kürzel,
+# dann Artikelnummer), sonst über Durchmesser+Länge. Bewertet wird mit
+# Editierdistanz pro Feld.
+#
+# Aufbau beim ersten Scan; danach aktualisieren schreibende Routen nur die
+# betroffenen ProdIDs (update_orders).
+
+OCR_MATCH = os.getenv("OCR_MATCH", "1") == "1"
+OCR_MATCH_LIMIT = int(os.getenv("OCR_MATCH_LIMIT", "5"))
+OCR_MATCH_MIN_SCORE = float(os.getenv("OCR_MATCH_MIN_SCORE", "0.5"))
+
+# Gewichte der Felder im Score (Summe 1)
+WEIGHTS = {
+    "kuerzel": 0.4,
+    "artikelnummer": 0.3,
+    "durchmesser": 0.15,
+    "laenge": 0.15,
+}
+
+# Höchstens so viele Kandidaten aus der Trigramm-Suche bewerten
+MAX_FUZZY_CANDIDATES = 200
+
+IN_CHUNK_SIZE = 500
+
+MATCH_COLUMNS = [
+    Item.merge_key,
+    Item.prod_id,
+    Item.kuerzel,
+    Item.start_bft,
+    Item.artikel_nr,
+    Item.durchmesser,
+    Item.laenge,
+    Item.kommissioniert,
+]
+
+_lock = threading.Lock()
+_build_lock = threading.Lock()
+_built = False
+_missed = set()        # ProdIDs, die sich während des Aufbaus geändert haben
+
+_entries = {}          # merge_key → Eintrag
+_by_prod = {}          # prod_id → {merge_key}
+_by_kuerzel = {}       # normalisiertes Kürzel → {merge_key}
+_by_size = {}          # (durchmesser, laenge) → {merge_key}
+_grams = {"kuerzel": {}, "artikelnummer": {}}   # Trigramm → {merge_key}
+
+
+# ---------------------------------------------------------
+# Normalisierung der DB-Werte (wie die OCR-Felder)
+# ---------------------------------------------------------
+def _number_text(value):
+    """12.0 → "12", 12.5 → "12.5" – so wie die Zahl auf dem Etikett steht."""
+    if value is None or value != value:
+        return None
+    if float(value).is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _entry(row) -> dict:
+    return {
+        "merge_key": row.merge_key,
+        "prod_id": row.prod_id,
+        "kuerzel": row.kuerzel,
+        "start_bft": row.start_bft,
+        "artikel_nr": row.artikel_nr,
+        "durchmesser": row.durchmesser,
+        "laenge": row.laenge,
+        "kommissioniert": bool(row.kommissioniert),
+        "norm": {
+            "kuerzel": normalize_ocr_value(row.kuerzel),
+            "artikelnummer": normalize_ocr_value(row.artikel_nr),
+            "durchmesser": normalize_ocr_value(_number_text(row.durchmesser)),
+            "laenge": normalize_ocr_value(_number_text(row.laenge)),
+        },
+    }
+
+
+def _trigrams(value: str) -> set:
+    if not value:
+        return set()
+    padded = f"  {value} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _distance(a: str, b: str) -> int:
+    """Levenshtein-Distanz (kurze Strings → einfache DP reicht)."""
+    if a == b:
+        return 0
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        prev = cur
+    return prev[-1]
+
+
+def _similarity(a: str, b: str) -> float:
+    if not a or not b:
+        return 0.0
+    return 1.0 - _distance(a, b) / max(len(a), len(b))
+
+
+# ---------------------------------------------------------
+# Index pflegen
+# ---------------------------------------------------------
+def _open_items_query(db):
+    produktion = and_(
+        func.trim(func.coalesce(Item.beschaffung, "")) == "Produktion",
+        func.trim(func.coalesce(Item.referenz, "")) == "Produktion",
+    )
+    return db.query(*MATCH_COLUMNS).filter(
+        func.coalesce(Item.ausgeliefert, False) == False,
+        func.coalesce(Item.verschoben, False) == False,
+        not_(produktion),
+    )
+
+
+def _add(entry: dict):
+    key = entry["merge_key"]
+    norm = entry["norm"]
+
+    _entries[key] = entry
+    _by_prod.setdefault(entry["prod_id"], set()).add(key)
+    if norm["kuerzel"]:
+        _by_kuerzel.setdefault(norm["kuerzel"], set()).add(key)
+    _by_size.setdefault((norm["durchmesser"], norm["laenge"]), set()).add(key)
+
+    for field, grams in _grams.items():
+        for g in _trigrams(norm[field]):
+            grams.setdefault(g, set()).add(key)
+
+
+def _remove(key: str):
+    entry = _entries.pop(key, None)
+    if entry is None:
+        return
+    norm = entry["norm"]
+
+    _by_prod.get(entry["prod_id"], set()).discard(key)
+    _by_kuerzel.get(norm["kuerzel"], set()).discard(key)
+    _by_size.get((norm["durchmesser"], norm["laenge"]), set()).discard(key)
+
+    for field, grams in _grams.items():
+        for g in _trigrams(norm[field]):
+            grams.get(g, set()).discard(key)
+
+
+def _clear():
+    _entries.clear()
+    _by_prod.clear()
+    _by_kuerzel.clear()
+    _by_size.clear()
+    for grams in _grams.values():
+        grams.clear()
+
+
+def rebuild():
+    """Kompletter Aufbau aus der Datenbank."""
+    global _built
+
+    with _build_lock:
+        with _lock:
+            _missed.clear()
+
+        db = SessionLocal()
+        try:
+            rows = _open_items_query(db).all()
+        finally:
+            db.close()
+
+        entries = [_entry(r) for r in rows]
+
+        with _lock:
+            _clear()
+            for entry in entries:
+                _add(entry)
+            _built = True
+            missed = list(_missed)
+            _missed.clear()
+
+    # Änderungen während des Lesens nachziehen
+    if missed:
+        update_orders(missed)
+
+
+def _ensure_built():
+    if not _built:
+        with _build_lock:
+            if _built:
+                return
+        rebuild()
+
+
+def update_orders(prod_ids):
+    """
+    Nach Statusänderungen / Import aufrufen (nach dem Commit):
+    liest nur die Items der betroffenen ProdIDs neu ein.
+    """
+    prod_ids = sorted({p for p in prod_ids if p is not None})
+
+    with _lock:
+        if not _built:
+            # Noch nicht aufgebaut: der Aufbau liest ohnehin alles,
+            # ein laufender Aufbau zieht diese ProdIDs danach nach
+            _missed.update(prod_ids)
+            return
+
+    db = SessionLocal()
+    try:
+        rows = []
+        for i in range(0, len(prod_ids), IN_CHUNK_SIZE):
+            chunk = prod_ids[i:i + IN_CHUNK_SIZE]
+            rows += _open_items_query(db).filter(Item.prod_id.in_(chunk)).all()
+    finally:
+        db.close()
+
+    entries = [_entry(r) for r in rows]
+
+    with _lock:
+        for prod_id in prod_ids:
+            for key in list(_by_prod.pop(prod_id, ())):
+                _remove(key)
+        for entry in entries:
+            _add(entry)
+
+
+# ---------------------------------------------------------
+# Suche
+# ---------------------------------------------------------
+def _fuzzy(field: str, value: str) -> set:
+    counts = Counter()
+    grams = _grams[field]
+    for g in _trigrams(value):
+        counts.update(grams.get(g, ()))
+    return {key for key, _ in counts.most_common(MAX_FUZZY_CANDIDATES)}
+
+
+def _candidates(ocr: dict) -> set:
+    kuerzel = ocr.get("kuerzel")
+    if kuerzel and _by_kuerzel.get(kuerzel):
+        return set(_by_kuerzel[kuerzel])
+
+    for field in ("kuerzel", "artikelnummer"):
+        if ocr.get(field):
+            found = _fuzzy(field, ocr[field])
+            if found:
+                return found
+
+    return set(_by_size.get((ocr.get("durchmesser"), ocr.get("laenge")), ()))
+
+
+def _score(ocr: dict, entry: dict) -> float:
+    return sum(
+        weight * _similarity(ocr.get(field), entry["norm"][field])
+        for field, weight in WEIGHTS.items()
+    )
+
+
+def match_candidates(ocr: dict, limit: int = None) -> list:
+    """
+    OCR-Ergebnis (bereits normalisierte Felder) → offene Items,
+    bester Treffer zuerst.
+    """
+    if not OCR_MATCH:
+        return []
+
+    _ensure_built()
+    limit = limit or OCR_MATCH_LIMIT
+
+    with _lock:
+        scored = [
+            (_score(ocr, _entries[key]), _entries[key])
+            for key in _candidates(ocr)
+            if key in _entries
+        ]
+
+    scored = [s for s in scored if s[0] >= OCR_MATCH_MIN_SCORE]
+    scored.sort(key=lambda s: (-s[0], s[1]["kommissioniert"], s[1]["merge_key"]))
+
+    return [
+        {
+            "merge_key": e["merge_key"],
+            "score": round(score, 3),
+            "kuerzel": e["kuerzel"],
+            "prod_id": e["prod_id"],
+            "start_bft": e["start_bft"],
+            "artikel_nr": e["artikel_nr"],
+            "durchmesser": e["durchmesser"],
+            "laenge": e["laenge"],
+            "kommissioniert": e["kommissioniert"],
+        }
+        for score, e in scored[:limit]
+    ]
+
+
+def index_stats() -> dict:
+    with _lock:
+        return {
+            "built": _built,
+            "items": len(_entries),
+            "orders": sum(1 for keys in _by_prod.values() if keys),
+        }
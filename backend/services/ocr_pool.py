@@ -0,0 +1,337 @@
+import asyncio
+import importlib.util
+import multiprocessing
+import os
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from backend.services import ocr_cache
+
+# ---------------------------------------------------------
+# OCR-PROZESSPOOL
+# ---------------------------------------------------------
+# OCR (cv2 + easyocr) ist reine CPU-Arbeit und hält den GIL. Im Event-Loop
+# ausgeführt blockiert ein Scan alle anderen Requests des uvicorn-Workers.
+# Deshalb laufen Scans in eigenen Prozessen; die Route wartet nur auf das
+# Ergebnis.
+#
+#   OCR_WORKERS          Anzahl Prozesse (je Prozess ein geladenes Modell)
+#   OCR_QUEUE_SIZE       max. gleichzeitig angenommene Scans (laufend + wartend),
+#                        darüber → 503 mit Retry-After
+#   OCR_TIMEOUT_SECONDS  max. Dauer eines Scans inkl. Wartezeit
+#   OCR_ENABLED          0 → OCR komplett aus (Route antwortet 503)
+#   OCR_PRELOAD          1 → Modelle OCR_PRELOAD_DELAY_SECONDS nach dem Start
+#                        im Hintergrund laden, 0 → erst beim ersten Scan
+#
+# Der Web-Prozess importiert weder torch/easyocr noch cv2 – das passiert nur
+# in den Pool-Prozessen (siehe _init_worker / _call). Der App-Start wartet
+# damit nie auf das Modell.
+
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", "1"))
+OCR_QUEUE_SIZE = int(os.getenv("OCR_QUEUE_SIZE", str(OCR_WORKERS * 4)))
+OCR_TIMEOUT_SECONDS = float(os.getenv("OCR_TIMEOUT_SECONDS", "30"))
+OCR_RETRY_AFTER_SECONDS = int(os.getenv("OCR_RETRY_AFTER_SECONDS", "5"))
+OCR_BATCH_MAX_IMAGES = int(os.getenv("OCR_BATCH_MAX_IMAGES", "12"))
+OCR_ENABLED = os.getenv("OCR_ENABLED", "1") != "0"
+OCR_PRELOAD = os.getenv("OCR_PRELOAD", "1") != "0"
+OCR_PRELOAD_DELAY_SECONDS = float(os.getenv("OCR_PRELOAD_DELAY_SECONDS", "5"))
+
+OCR_MODULES = ("easyocr", "cv2", "PIL")
+
+
+class OcrBusy(Exception):
+    """Warteschlange voll oder Pool gerade neu gestartet."""
+
+
+class OcrTimeout(Exception):
+    """Scan hat länger als OCR_TIMEOUT_SECONDS gedauert."""
+
+
+class OcrUnavailable(Exception):
+    """OCR abgeschaltet oder Pakete nicht installiert."""
+
+
+_pool = None
+_lock = threading.Lock()
+_pending = 0
+
+# Pool → Anzahl Scans, deren Aufrufer noch auf das Ergebnis warten
+_waiting = {}
+
+# aus | nicht installiert | nicht geladen | laedt | bereit | fehler
+_state = None
+_state_detail = ""
+
+_stats = {"done": 0, "rejected": 0, "timeouts": 0, "failed": 0, "restarts": 0}
+
+
+# ---------------------------------------------------------
+# Ausführung in den Pool-Prozessen
+# ---------------------------------------------------------
+def _init_worker():
+    from backend.services import ocr_engine
+    ocr_engine.init_worker()
+
+
+def _call(name: str, *args):
+    """Ruft ocr_engine.<name> im Pool-Prozess auf (Import nur dort)."""
+    from backend.services import ocr_engine
+    return getattr(ocr_engine, name)(*args)
+
+
+# ---------------------------------------------------------
+# Zustand
+# ---------------------------------------------------------
+def _initial_state() -> str:
+    if not OCR_ENABLED:
+        return "aus"
+    if any(importlib.util.find_spec(m) is None for m in OCR_MODULES):
+        return "nicht installiert"
+    return "nicht geladen"
+
+
+def ocr_state() -> str:
+    global _state
+    with _lock:
+        if _state is None:
+            _state = _initial_state()
+        return _state
+
+
+def _set_state(state: str, detail: str = "", pool=None):
+    global _state, _state_detail
+    with _lock:
+        # Meldungen eines bereits verworfenen Pools ignorieren
+        if pool is not None and pool is not _pool:
+            return
+        _state = state
+        _state_detail = detail
+
+
+def _watch_warmup(pool, futures):
+    """Wartet auf alle Warmup-Jobs: bereit erst, wenn jeder Prozess geladen hat."""
+    # Fehler eines Prozesses sofort melden, nicht erst wenn alle fertig sind
+    done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+    for future in done:
+        try:
+            future.result()
+        except Exception as e:
+            print("OCR-Modell konnte nicht geladen werden:", e)
+            _set_state("fehler", str(e) or type(e).__name__, pool)
+            return
+    _set_state("bereit", "", pool)
+
+
+# ---------------------------------------------------------
+# Pool-Verwaltung
+# ---------------------------------------------------------
+def _new_pool() -> ProcessPoolExecutor:
+    # "spawn": der Web-Prozess hat Threads (Import-Worker, SQLite) → kein fork
+    return ProcessPoolExecutor(
+        max_workers=OCR_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+    )
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Liefert den Pool; legt ihn beim ersten Aufruf an und lädt die Modelle."""
+    global _pool, _state, _state_detail
+
+    if ocr_state() in ("aus", "nicht installiert"):
+        raise OcrUnavailable()
+
+    with _lock:
+        if _pool is not None:
+            return _pool
+
+        pool = _pool = _new_pool()
+        _state, _state_detail = "laedt", ""
+
+    # Ein Warmup-Job pro Prozess → alle Prozesse starten und laden ihr Modell
+    futures = [pool.submit(_call, "warmup") for _ in range(OCR_WORKERS)]
+    threading.Thread(
+        target=_watch_warmup, args=(pool, futures), name="ocr-warmup", daemon=True
+    ).start()
+
+    return pool
+
+
+def start_pool():
+    """Modelle im Hintergrund laden (kehrt sofort zurück)."""
+    try:
+        _get_pool()
+    except OcrUnavailable:
+        pass
+
+
+def schedule_preload(loop):
+    """Nach dem App-Start aufrufen: lädt OCR verzögert, wenn OCR_PRELOAD an ist."""
+    if OCR_PRELOAD and ocr_state() == "nicht geladen":
+        loop.call_later(OCR_PRELOAD_DELAY_SECONDS, start_pool)
+
+
+def shutdown_pool():
+    global _pool
+    with _lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _retire_pool(pool: ProcessPoolExecutor):
+    """
+    Hängende Prozesse lassen sich nicht abbrechen → Pool ausmustern:
+    neue Scans bekommen einen neuen Pool, laufende Scans anderer Nutzer
+    im alten Pool laufen zu Ende. Beendet wird er erst in _reap_pool().
+    """
+    global _pool, _state
+    with _lock:
+        if _pool is not pool:
+            return
+        _pool = None
+        _state = "nicht geladen"
+        _stats["restarts"] += 1
+
+
+def _reap_pool(pool: ProcessPoolExecutor):
+    """Ausgemusterten Pool beenden, sobald niemand mehr auf ihn wartet."""
+    with _lock:
+        if pool is _pool or _waiting.get(pool, 0) > 0:
+            return
+        _waiting.pop(pool, None)
+
+    # Übrig sind nur noch Jobs, deren Aufrufer aufgegeben haben (Timeout).
+    # ProcessPoolExecutor bietet (bis Python 3.14) kein terminate()
+    for process in list((pool._processes or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def pool_stats() -> dict:
+    state = ocr_state()
+    with _lock:
+        return {
+            "state": state,
+            "detail": _state_detail,
+            "available": state in ("nicht geladen", "laedt", "bereit"),
+            **_stats,
+            "workers": OCR_WORKERS,
+            "queue_size": OCR_QUEUE_SIZE,
+            "pending": _pending,
+            "running": _pool is not None,
+        }
+
+
+# ---------------------------------------------------------
+# Scan ausführen
+# ---------------------------------------------------------
+async def run_in_pool(name: str, *args, timeout: float = None):
+    """
+    Führt ocr_engine.<name>(*args) in einem Pool-Prozess aus.
+    Wirft OcrUnavailable / OcrBusy (→ 503) oder OcrTimeout (→ 504).
+    """
+    if timeout is None:
+        timeout = OCR_TIMEOUT_SECONDS
+
+    global _pending
+
+    # Modell beim ersten Scan laden, falls kein Preload lief
+    pool = _get_pool()
+
+    with _lock:
+        if _pending >= OCR_QUEUE_SIZE:
+            _stats["rejected"] += 1
+            raise OcrBusy()
+        _pending += 1
+        _waiting[pool] = _waiting.get(pool, 0) + 1
+
+    try:
+        try:
+            future = pool.submit(_call, name, *args)
+        except RuntimeError:
+            # Pool wurde inzwischen ausgemustert und beendet
+            raise OcrBusy()
+
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            with _lock:
+                _stats["timeouts"] += 1
+            # Noch nicht gestartete Jobs lassen sich einfach streichen
+            if not future.cancel():
+                _retire_pool(pool)
+            raise OcrTimeout()
+        except asyncio.CancelledError:
+            # Job vom Pool gestrichen (Shutdown) – nicht der Request abgebrochen
+            if asyncio.current_task().cancelling() or not future.cancelled():
+                raise
+            with _lock:
+                _stats["failed"] += 1
+            raise OcrBusy()
+        except BrokenProcessPool:
+            with _lock:
+                _stats["failed"] += 1
+            _retire_pool(pool)
+            raise OcrBusy()
+
+        with _lock:
+            _stats["done"] += 1
+        return result
+
+    finally:
+        with _lock:
+            _pending -= 1
+            _waiting[pool] -= 1
+        _reap_pool(pool)
+
+
+async def scan_label(content: bytes) -> dict:
+    """Etikett lesen – zuerst im Ergebnis-Cache nachsehen."""
+    key = ocr_cache.content_key(content)
+
+    cached = ocr_cache.get_by_content(key)
+    if cached is not None:
+        return ocr_cache.with_cache_info(cached, "inhalt")
+
+    label_hash = None
+    if ocr_cache.OCR_CACHE_PHASH:
+        label_hash = await run_in_pool("label_hash", content)
+        cached = ocr_cache.get_by_label(label_hash)
+        if cached is not None:
+            ocr_cache.put(key, cached)
+            return ocr_cache.with_cache_info(cached, "etikett")
+
+    result = await run_in_pool("read_label", content)
+    ocr_cache.put(key, result, label_hash)
+
+    return ocr_cache.with_cache_info(result, None)
+
+
+async def scan_labels(contents: list, all_labels: bool = True) -> list:
+    """
+    Mehrere Fotos in EINEM Pool-Job (→ gebündelte Erkennung im Prozess).
+    Pro Foto eine Ergebnisliste; bereits gelesene Fotos kommen aus dem Cache.
+    """
+    suffix = ":alle" if all_labels else ":eins"
+    keys = [ocr_cache.content_key(c) + suffix for c in contents]
+
+    results = [ocr_cache.get_by_content(k) for k in keys]
+    missing = [i for i, r in enumerate(results) if r is None]
+
+    if missing:
+        fresh = await run_in_pool(
+            "read_labels",
+            [contents[i] for i in missing],
+            all_labels,
+            timeout=OCR_TIMEOUT_SECONDS * len(missing),
+        )
+        for i, labels in zip(missing, fresh):
+            ocr_cache.put(keys[i], labels)
+            results[i] = labels
+
+    return [
+        [ocr_cache.with_cache_info(label, None if i in missing else "inhalt") for label in labels]
+        for i, labels in enumerate(results)
+    ]
@@ -0,0 +1,139 @@
+from datetime import datetime
+
+from backend.database import Item, OrderStatus
+from backend.logic.order_status import refresh_orders, order_is_done, IN_CHUNK_SIZE
+from backend.services.completion import complete_orders
+from backend.utils.item_snapshot import bump_data_version
+from backend.services.live_updates import publish_orders
+from backend.services.ocr_match import update_orders as update_match_index
+
+# ---------------------------------------------------------
+# KOMMISSIONIEREN / AUSLIEFERN – MEHRERE AUFTRÄGE AUF EINMAL
+# ---------------------------------------------------------
+# Für Handscanner: ein ganzer Wagen (viele merge_keys, viele Aufträge)
+# in EINER Transaktion. order_status und CompletedToday werden am Ende
+# einmal pro betroffener ProdID aktualisiert, nicht pro Klick.
+#
+# Ablauf im Aufrufer:
+#   prod_ids = set()
+#   prod_ids |= apply_kommissioniert(db, keys)
+#   prod_ids |= apply_ausliefern(db, keys, ziellager)
+#   orders = finish(db, prod_ids)   → refresh + Abschlüsse, vor dem Commit
+#   db.commit()
+#   after_commit(prod_ids)
+
+
+def _items(db, merge_keys) -> list:
+    keys = sorted({k for k in merge_keys if k})
+    items = []
+    for i in range(0, len(keys), IN_CHUNK_SIZE):
+        items += db.query(Item).filter(Item.merge_key.in_(keys[i:i + IN_CHUNK_SIZE])).all()
+    return items
+
+
+def unknown_keys(db, merge_keys) -> list:
+    """merge_keys, zu denen es kein Item (mehr) gibt."""
+    keys = sorted({k for k in merge_keys if k})
+    found = set()
+    for i in range(0, len(keys), IN_CHUNK_SIZE):
+        found.update(
+            k for (k,) in db.query(Item.merge_key).filter(Item.merge_key.in_(keys[i:i + IN_CHUNK_SIZE]))
+        )
+    return [k for k in keys if k not in found]
+
+
+def apply_kommissioniert(db, merge_keys) -> set:
+    items = _items(db, merge_keys)
+
+    for item in items:
+        item.kommissioniert = True
+
+    return {item.prod_id for item in items}
+
+
+def apply_ausliefern(db, merge_keys, ziellager: str) -> set:
+    items = _items(db, merge_keys)
+
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    for item in items:
+        item.ausgeliefert = True
+        item.ziel_lagerort = ziellager
+        item.ausgeliefert_am = timestamp
+
+    return {item.prod_id for item in items}
+
+
+def apply_fehlteil_erledigt(db, merge_keys) -> set:
+    items = _items(db, merge_keys)
+
+    for item in items:
+        item.referenz = "Nicht gefunden"
+
+    return {item.prod_id for item in items}
+
+
+def apply_verschieben(db, kuerzel: str, prod_id: str) -> set:
+    # Vorherige Änderungen (gleiche Transaktion) zuerst schreiben → Reihenfolge bleibt
+    db.flush()
+    count = db.query(Item).filter(
+        Item.kuerzel == kuerzel,
+        Item.prod_id == prod_id,
+    ).update({"verschoben": True}, synchronize_session=False)
+
+    return {prod_id} if count else set()
+
+
+def finish(db, prod_ids) -> list:
+    """
+    order_status der betroffenen ProdIDs neu berechnen und fertige
+    Aufträge in CompletedToday eintragen. Commit macht der Aufrufer.
+    Rückgabe: die aktuellen order_status-Zeilen.
+    """
+    prod_ids = sorted({p for p in prod_ids if p is not None})
+
+    refresh_orders(db, prod_ids)
+    complete_orders(db, prod_ids)
+
+    orders = []
+    for i in range(0, len(prod_ids), IN_CHUNK_SIZE):
+        orders += (
+            db.query(OrderStatus)
+            .filter(OrderStatus.prod_id.in_(prod_ids[i:i + IN_CHUNK_SIZE]))
+            .all()
+        )
+
+    return orders
+
+
+def after_commit(prod_ids):
+    bump_data_version()
+    publish_orders(prod_ids)
+    update_match_index(prod_ids)
+
+
+# ---------------------------------------------------------
+# Antwort für den Scanner
+# ---------------------------------------------------------
+def order_state(order) -> dict:
+    if order.verschoben:
+        status = "verschoben"
+    elif order_is_done(order):
+        status = "fertig"
+    elif order.total_buendel and order.kommissioniert_buendel == order.total_buendel:
+        status = "kommissioniert"
+    elif order.kommissioniert_einige:
+        status = "teilweise"
+    else:
+        status = "offen"
+
+    return {
+        "kuerzel": order.kuerzel,
+        "prod_id": order.prod_id,
+        "start_bft": order.start_bft,
+        "status": status,
+        "total": int(order.total_buendel or 0),
+        "kommissioniert": int(order.kommissioniert_buendel or 0),
+        "ausgeliefert": int(order.ausgeliefert_buendel or 0),
+        "fehlteile": bool(order.fehlteile),
+    }
@@ -0,0 +1,148 @@
+import json
+import os
+from datetime import datetime, timedelta
+
+from sqlalchemy.exc import IntegrityError
+
+from backend.database_base import SessionLocal
+from backend.database import PickingEvent
+from backend.services.picking import (
+    apply_kommissioniert,
+    apply_fehlteil_erledigt,
+    apply_ausliefern,
+    apply_verschieben,
+    finish,
+    after_commit,
+    order_state,
+)
+
+# ---------------------------------------------------------
+# OFFLINE-EVENTS DER KOMMISSIONIER-TABLETS
+# ---------------------------------------------------------
+# Fällt das WLAN in der Halle aus, sammelt das Tablet die Klicks als Events
+# (mit eigener ID + Zeitstempel) und schickt sie später gesammelt.
+#
+# - Reihenfolge: nach client_ts, bei Gleichstand wie gesendet
+# - Idempotent: jede event_id wird genau einmal angewendet (picking_events);
+#   ein erneutes Senden nach Timeout liefert "doppelt" statt doppelter Buchung
+# - Ein Sync = eine Transaktion, order_status/CompletedToday einmal am Ende
+#
+#   PICKING_EVENT_RETENTION_DAYS  so lange bleiben Event-IDs gespeichert
+
+PICKING_EVENT_RETENTION_DAYS = int(os.getenv("PICKING_EVENT_RETENTION_DAYS", "30"))
+
+EVENT_TYPES = ("kommissioniert", "fehlteil_erledigt", "ausliefern", "verschieben")
+
+# Bei gleichzeitigem Sync derselben Events (zwei Requests) einmal wiederholen
+MAX_ATTEMPTS = 2
+
+IN_CHUNK_SIZE = 500
+
+
+def _known_ids(db, event_ids) -> set:
+    ids = sorted(set(event_ids))
+    known = set()
+    for i in range(0, len(ids), IN_CHUNK_SIZE):
+        known.update(
+            e for (e,) in db.query(PickingEvent.event_id).filter(
+                PickingEvent.event_id.in_(ids[i:i + IN_CHUNK_SIZE])
+            )
+        )
+    return known
+
+
+def _apply(db, event: dict) -> set:
+    """Ein Event anwenden → betroffene ProdIDs. ValueError = ungültig."""
+    typ = event["typ"]
+    merge_keys = event.get("merge_keys") or []
+
+    if typ == "kommissioniert":
+        return apply_kommissioniert(db, merge_keys)
+    if typ == "fehlteil_erledigt":
+        return apply_fehlteil_erledigt(db, merge_keys)
+    if typ == "ausliefern":
+        return apply_ausliefern(db, merge_keys, event.get("ziellager") or "")
+    if typ == "verschieben":
+        if not event.get("kuerzel") or not event.get("prod_id"):
+            raise ValueError("verschieben braucht kuerzel und prod_id")
+        return apply_verschieben(db, event["kuerzel"], event["prod_id"])
+
+    raise ValueError(f"unbekannter Typ: {typ}")
+
+
+def _sync_once(events: list) -> tuple:
+    db = SessionLocal()
+    try:
+        known = _known_ids(db, [e["id"] for e in events])
+        now = datetime.now()
+
+        results = []
+        prod_ids = set()
+        seen = set()
+
+        for event in events:
+            event_id = event["id"]
+            if event_id in known or event_id in seen:
+                results.append({"id": event_id, "status": "doppelt"})
+                continue
+            seen.add(event_id)
+
+            try:
+                prod_ids |= _apply(db, event)
+                ergebnis = "angewendet"
+                results.append({"id": event_id, "status": ergebnis})
+            except ValueError as e:
+                ergebnis = "ungueltig"
+                results.append({"id": event_id, "status": ergebnis, "fehler": str(e)})
+
+            db.add(PickingEvent(
+                event_id=event_id,
+                typ=event["typ"],
+                client_ts=event.get("ts") or "",
+                received_at=now,
+                daten=json.dumps(
+                    {k: v for k, v in event.items() if k not in ("id", "typ", "ts")},
+                    ensure_ascii=False,
+                ),
+                ergebnis=ergebnis,
+            ))
+
+        orders = finish(db, prod_ids)
+        states = [order_state(o) for o in orders]
+
+        # Alte Event-IDs aufräumen
+        db.query(PickingEvent).filter(
+            PickingEvent.received_at < now - timedelta(days=PICKING_EVENT_RETENTION_DAYS)
+        ).delete(synchronize_session=False)
+
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    return results, prod_ids, states
+
+
+def sync_events(events: list) -> dict:
+    """
+    events: [{"id", "ts", "typ", "merge_keys"?, "ziellager"?, "kuerzel"?, "prod_id"?}]
+    → {"events": [{"id", "status"}], "orders": [Status der betroffenen Aufträge]}
+    """
+    # sorted() ist stabil → gleiche Zeitstempel bleiben in Sende-Reihenfolge
+    events = sorted(events, key=lambda e: e.get("ts") or "")
+
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            results, prod_ids, states = _sync_once(events)
+            break
+        except IntegrityError:
+            # Anderer Request hat dieselben event_ids gerade eingetragen
+            if attempt == MAX_ATTEMPTS - 1:
+                raise
+
+    if prod_ids:
+        after_commit(prod_ids)
+
+    return {"events": results, "orders": states}
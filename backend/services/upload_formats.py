@@ -0,0 +1,159 @@
+import io
+import os
+
+import pandas as pd
+
+from backend.utils.dataframe import column_plan, normalize_header, NUMERIC_FIELDS
+
+# ---------------------------------------------------------
+# UPLOAD-FORMATE: Excel, CSV, Parquet
+# ---------------------------------------------------------
+# Das ERP exportiert CSV und Parquet deutlich schneller als xlsx, und das
+# Parsen von xlsx ist der langsamste Teil des Uploads. Alle Formate liefern
+# ein DataFrame mit den Original-Spaltenköpfen – danach laufen sie durch
+# dasselbe prepare_dataframe und denselben Import.
+#
+# Erkannt wird am Dateiinhalt (Signatur), erst dann an der Endung.
+
+FORMATS = ("xlsx", "xls", "csv", "parquet")
+
+SIGNATURES = {
+    b"PK\x03\x04": "xlsx",                          # Zip-Container (OOXML)
+    b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1": "xls",     # altes Excel (OLE2)
+    b"PAR1": "parquet",
+}
+
+EXTENSIONS = {
+    ".xlsx": "xlsx",
+    ".xlsm": "xlsx",
+    ".xls": "xls",
+    ".csv": "csv",
+    ".txt": "csv",
+    ".parquet": "parquet",
+}
+
+# CSV-Trennzeichen, unter denen die Kopfzeile gesucht wird
+CSV_SEPARATORS = (";", ",", "\t", "|")
+
+# Erkennung der Kopfzeile: so viele Bytes vom Dateianfang
+CSV_SNIFF_BYTES = 64 * 1024
+
+
+def detect_format(content: bytes, filename: str = "") -> str:
+    for signature, fmt in SIGNATURES.items():
+        if content.startswith(signature):
+            return fmt
+
+    ext = os.path.splitext(filename or "")[1].lower()
+    fmt = EXTENSIONS.get(ext)
+
+    # Zip/OLE/Parquet ohne passende Signatur → kaputte Datei, kein CSV
+    if fmt in ("csv", None) and _looks_like_text(content):
+        return "csv"
+    if fmt is None:
+        raise ValueError(
+            f"Unbekanntes Dateiformat: {filename or 'ohne Namen'} "
+            f"(erlaubt: Excel, CSV, Parquet)"
+        )
+    raise ValueError(f"Datei ist kein gültiges {fmt.upper()}: {filename}")
+
+
+def _looks_like_text(content: bytes) -> bool:
+    sample = content[:CSV_SNIFF_BYTES]
+    return bool(sample.strip()) and b"\x00" not in sample
+
+
+# ---------------------------------------------------------
+# CSV
+# ---------------------------------------------------------
+def _csv_engine() -> str:
+    # pyarrow parst spaltenweise und um ein Vielfaches schneller;
+    # ohne pyarrow der C-Parser von pandas
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return "c"
+    return "pyarrow"
+
+
+def _decode_head(content: bytes):
+    """Dateianfang als Text + Encoding (ERP: UTF-8 mit BOM oder Windows-1252)."""
+    sample = content[:CSV_SNIFF_BYTES]
+    try:
+        return sample.decode("utf-8-sig"), "utf-8-sig"
+    except UnicodeDecodeError as e:
+        # Abgeschnittenes Mehrbyte-Zeichen am Ende des Ausschnitts ist kein Fehler
+        if e.start >= len(sample) - 3:
+            return sample[:e.start].decode("utf-8-sig"), "utf-8-sig"
+        return sample.decode("cp1252", errors="replace"), "cp1252"
+
+
+def _csv_dialect(head: str) -> dict:
+    """
+    Trennzeichen = häufigstes Zeichen der Kopfzeile. Deutsches Excel/ERP
+    schreibt ";" mit Dezimalkomma, sonst gilt der Dezimalpunkt.
+    """
+    header = head.splitlines()[0] if head else ""
+    sep = max(CSV_SEPARATORS, key=header.count)
+    return {"sep": sep, "decimal": "," if sep == ";" else "."}
+
+
+def _read_csv_pyarrow(content: bytes, encoding: str, dialect: dict, text_columns) -> pd.DataFrame:
+    # pyarrow.csv direkt: pd.read_csv(engine="pyarrow") wandelt dtype erst
+    # NACH dem Lesen um und wäre damit langsamer als der C-Parser
+    import pyarrow as pa
+    from pyarrow import csv
+
+    table = csv.read_csv(
+        io.BytesIO(content),
+        read_options=csv.ReadOptions(encoding="utf8" if encoding == "utf-8-sig" else encoding),
+        parse_options=csv.ParseOptions(delimiter=dialect["sep"]),
+        convert_options=csv.ConvertOptions(
+            decimal_point=dialect["decimal"],
+            column_types={h: pa.string() for h in text_columns},
+            strings_can_be_null=True,       # leere Zelle → NaN wie bei pandas
+        ),
+    )
+    return table.to_pandas()
+
+
+def read_csv(content: bytes) -> pd.DataFrame:
+    head, encoding = _decode_head(content)
+    dialect = _csv_dialect(head)
+
+    # Kopfzeile vorab: nur Zahlenspalten (laut Spaltenplan) typisieren lassen,
+    # alles andere bleibt Text – sonst würde aus ProdID "012345" die Zahl 12345
+    # und aus einer ProdID-Spalte mit Lücken "100000.0"
+    headers = pd.read_csv(io.BytesIO(content), nrows=0, encoding=encoding, **dialect).columns
+    _, _, targets = column_plan(tuple(headers))
+    numeric = {old for new, old in targets.items() if new in NUMERIC_FIELDS}
+    text_columns = [h for h in headers if normalize_header(h) not in numeric]
+
+    if _csv_engine() == "pyarrow":
+        return _read_csv_pyarrow(content, encoding, dialect, text_columns)
+
+    return pd.read_csv(
+        io.BytesIO(content),
+        encoding=encoding,
+        dtype={h: str for h in text_columns},
+        **dialect,
+    )
+
+
+# ---------------------------------------------------------
+# Parquet
+# ---------------------------------------------------------
+def read_parquet(content: bytes) -> pd.DataFrame:
+    try:
+        return pd.read_parquet(io.BytesIO(content))
+    except ImportError:
+        raise ValueError("Parquet-Import nicht verfügbar: pyarrow ist nicht installiert.")
+
+
+def read_upload(content: bytes, fmt: str) -> pd.DataFrame:
+    """Ganze Datei → DataFrame mit den Original-Spaltenköpfen."""
+    if fmt == "csv":
+        return read_csv(content)
+    if fmt == "parquet":
+        return read_parquet(content)
+    return pd.read_excel(io.BytesIO(content))
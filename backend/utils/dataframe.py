@@ -1,146 +1,201 @@
-import pandas as pd
 import datetime
+from functools import lru_cache
 
-def prepare_dataframe(df: pd.DataFrame) -> pd.DataFrame:
-    # ---------------------------------------------------------
-    # 1. Spaltennamen vereinheitlichen
-    # ---------------------------------------------------------
-    df.columns = (
-        df.columns
-        .str.strip()
-        .str.lower()
-        .str.replace(" ", "_")
-        .str.replace("-", "_")
-        .str.replace(".", "")
-        .str.replace("ä", "ae")
-        .str.replace("ö", "oe")
-        .str.replace("ü", "ue")
+import numpy as np
+import pandas as pd
+
+# ---------------------------------------------------------
+# EXCEL → INTERNE SPALTEN (Normalisierung)
+# ---------------------------------------------------------
+# Die Kopfzeile wird EINMAL in einen Plan übersetzt (Excel-Spalte → interne
+# Spalte); der Plan hängt nur von den Spaltennamen ab und wird gecacht –
+# die Datei vom Vortag hat dieselben Spalten. Danach arbeiten alle Schritte
+# spaltenweise, ohne Python-Schleife über die Zeilen.
+
+# Spaltennamen: Leerzeichen/Bindestrich → "_", Punkte weg, Umlaute ausschreiben
+HEADER_TRANSLATION = str.maketrans({
+    " ": "_",
+    "-": "_",
+    ".": None,
+    "ä": "ae",
+    "ö": "oe",
+    "ü": "ue",
+})
+
+KUERZEL_ALIASES = ["kuerzel", "kürzel", "kurzel", "kennz", "kennzeichen", "kz"]
+
+# Excel → interne Spaltennamen (Reihenfolge zählt: spätere Treffer gewinnen)
+COLUMN_MAP = {
+    "prodid_bft": "prod_id",
+    "prodid": "prod_id",
+
+    "artikel_nr_bft": "artikel_nr",
+    "artikel_nr": "artikel_nr",
+
+    "bew_artikel": "artikel_clean",
+    "bew_art": "artikel_clean",
+    "bewartikel": "artikel_clean",
+    "bew_artikel_bft": "artikel_clean",
+    "bew_artikel_bew": "artikel_clean",
+    "bewartikelbft": "artikel_clean",
+    "bewartikelbew": "artikel_clean",
+
+    "durchm": "durchmesser",
+    "durchmesser": "durchmesser",
+
+    "laenge": "laenge",
+    "laenge_bft": "laenge",
+    "laengebew": "laenge",
+
+    "biegung": "biegung",
+
+    "bedarfs_menge": "bedarfs_menge_pos",
+    "bedarfs_n": "bedarfs_menge_pos",
+    "bedarfs_nr": "bedarfs_menge_pos",
+    "bedarfsnr": "bedarfs_menge_pos",
+    "bedarfsmenge": "bedarfs_menge_pos",
+
+    "menge": "menge",
+
+    "beschaffung": "beschaffung",
+    "beschaff": "beschaffung",
+
+    "referenz": "referenz",
+    "ref": "referenz",
+    "refnr": "referenz",
+
+    "start_bft": "start_bft",
+    "start_bew": "start_bew",
+}
+
+# Zahlen bleiben float64: sie landen als Text im merge_key,
+# float32 würde dort andere Ziffern erzeugen
+NUMERIC_FIELDS = ["durchmesser", "laenge", "bedarfs_menge_pos", "menge"]
+
+DATE_FIELDS = ["start_bft", "start_bew"]
+
+# Wenige verschiedene Werte, nie leer → category spart Speicher
+CATEGORY_FIELDS = ["kuerzel", "biegung", "start_bft", "start_bew"]
+
+DEFAULTS = {
+    "artikel_nr": "",
+    "artikel_clean": "",
+    "durchmesser": 0.0,
+    "laenge": 0.0,
+    "biegung": "unbekannt",
+    "bedarfs_menge_pos": 0.0,
+    "menge": 0.0,
+    "prod_id": "",
+    "start_bft": "",
+    "start_bew": "",
+    "beschaffung": "",
+    "referenz": "",
+    "fertig": False,
+    "ausgeliefert": False,
+}
+
+
+def normalize_header(name):
+    if not isinstance(name, str):
+        return np.nan
+    return name.strip().lower().translate(HEADER_TRANSLATION)
+
+
+@lru_cache(maxsize=32)
+def column_plan(headers: tuple) -> tuple:
+    """
+    Kopfzeile → (normalisierte Namen, Kürzel-Spalte, {Ziel: Quelle}).
+
+    Die Zuordnung wird so aufgelöst, als würde COLUMN_MAP der Reihe nach
+    kopiert (df[neu] = df[alt]): eine Zielspalte kann selbst wieder Quelle
+    sein, spätere Treffer überschreiben frühere.
+    """
+    columns = [normalize_header(h) for h in headers]
+
+    kuerzel = next((a for a in KUERZEL_ALIASES if a in columns), None)
+
+    present = set(columns) | {"kuerzel"}
+    holds = {c: c for c in present}         # Spalte → Original, dessen Werte sie hat
+    targets = {}
+
+    for old, new in COLUMN_MAP.items():
+        if old in present:
+            holds[new] = holds[old]
+            targets[new] = holds[old]
+            present.add(new)
+
+    return columns, kuerzel, targets
+
+
+def _date_strings(series: pd.Series) -> pd.Series:
+    """Datum → "YYYY-MM-DD", leer → "", alles andere als Text."""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.dt.strftime("%Y-%m-%d").fillna("")
+
+    # Gemischte Spalte: jeden VERSCHIEDENEN Wert einmal umwandeln
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    converted = np.array(
+        [
+            v.strftime("%Y-%m-%d") if isinstance(v, (pd.Timestamp, datetime.datetime)) else str(v)
+            for v in uniques
+        ] + [""],
+        dtype=object,
     )
+    return pd.Series(converted[codes], index=series.index)
 
+
+def prepare_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     # ---------------------------------------------------------
-    # 2. Kürzel-Spalte finden
+    # 1. Spaltennamen vereinheitlichen + Plan holen
     # ---------------------------------------------------------
-    kuerzel_aliases = ["kuerzel", "kürzel", "kurzel", "kennz", "kennzeichen", "kz"]
-    found = None
-    for alias in kuerzel_aliases:
-        if alias in df.columns:
-            found = alias
-            break
-
-    if not found:
-        raise ValueError("Keine gültige Kürzel-Spalte gefunden.")
+    columns, kuerzel, targets = column_plan(tuple(df.columns))
+    df.columns = columns
 
-    df["kuerzel"] = df[found].astype(str).str.strip()
+    if not kuerzel:
+        raise ValueError("Keine gültige Kürzel-Spalte gefunden.")
 
     # ---------------------------------------------------------
-    # 3. Leere oder ungültige Kürzel entfernen
+    # 2. Leere oder ungültige Kürzel entfernen (eine Maske)
     # ---------------------------------------------------------
-    df = df[df["kuerzel"].notna()]
-    df = df[df["kuerzel"].str.strip() != ""]
-    df = df[df["kuerzel"].str.lower() != "nan"]
+    kuerzel_values = df[kuerzel].astype(str).str.strip()
+    keep = (
+        kuerzel_values.notna()
+        & (kuerzel_values != "")
+        & (kuerzel_values.str.lower() != "nan")
+    )
+
+    df = df.loc[keep.to_numpy()].copy()
+    df["kuerzel"] = kuerzel_values[keep]
 
     # ---------------------------------------------------------
-    # 4. Excel → interne Spaltennamen (Mapping)
+    # 3. Excel → interne Spaltennamen (nach Plan)
     # ---------------------------------------------------------
-    column_map = {
-        "prodid_bft": "prod_id",
-        "prodid": "prod_id",
-
-        "artikel_nr_bft": "artikel_nr",
-        "artikel_nr": "artikel_nr",
-
-        "bew_artikel": "artikel_clean",
-        "bew_art": "artikel_clean",
-        "bewartikel": "artikel_clean",
-        "bew_artikel_bft": "artikel_clean",
-        "bew_artikel_bew": "artikel_clean",
-        "bewartikelbft": "artikel_clean",
-        "bewartikelbew": "artikel_clean",
-
-        "durchm": "durchmesser",
-        "durchmesser": "durchmesser",
-
-        "laenge": "laenge",
-        "laenge_bft": "laenge",
-        "laengebew": "laenge",
-
-        "biegung": "biegung",
-
-        "bedarfs_menge": "bedarfs_menge_pos",
-        "bedarfs_n": "bedarfs_menge_pos",
-        "bedarfs_nr": "bedarfs_menge_pos",
-        "bedarfsnr": "bedarfs_menge_pos",
-        "bedarfsmenge": "bedarfs_menge_pos",
-
-        "menge": "menge",
-
-        "beschaffung": "beschaffung",
-        "beschaff": "beschaffung",
-
-        "referenz": "referenz",
-        "ref": "referenz",
-        "refnr": "referenz",
-
-        "start_bft": "start_bft",
-        "start_bew": "start_bew",
-    }
-
-    for old, new in column_map.items():
-        if old in df.columns:
-            df[new] = df[old]
+    mapped = {new: df[old] for new, old in targets.items()}
+    for new, values in mapped.items():
+        df[new] = values
 
     # ---------------------------------------------------------
-    # 5. Typkonvertierungen (narrensicher)
+    # 4. Typen: Zahlen, Biegung, Datum
     # ---------------------------------------------------------
-    numeric_fields = ["durchmesser", "laenge", "bedarfs_menge_pos", "menge"]
-    for col in numeric_fields:
+    for col in NUMERIC_FIELDS:
         if col in df.columns:
             df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0.0)
 
-    # ---------------------------------------------------------
-    # 6. Biegung absichern (keine NaN-Gruppen)
-    # ---------------------------------------------------------
     if "biegung" in df.columns:
         df["biegung"] = df["biegung"].fillna("unbekannt").astype(str)
 
-    # ---------------------------------------------------------
-    # 7. Datumsfelder in Strings umwandeln
-    # ---------------------------------------------------------
-    date_fields = ["start_bft", "start_bew"]
-
-    for col in date_fields:
+    for col in DATE_FIELDS:
         if col in df.columns:
-            def convert_date(x):
-                if pd.isna(x):
-                    return ""
-                if isinstance(x, (pd.Timestamp, datetime.datetime)):
-                    return x.strftime("%Y-%m-%d")
-                return str(x)
-
-            df[col] = df[col].apply(convert_date)
+            df[col] = _date_strings(df[col])
 
     # ---------------------------------------------------------
-    # 8. Fehlende Spalten ergänzen
+    # 5. Fehlende Spalten ergänzen, kompakte Typen
     # ---------------------------------------------------------
-    defaults = {
-        "artikel_nr": "",
-        "artikel_clean": "",
-        "durchmesser": 0.0,
-        "laenge": 0.0,
-        "biegung": "unbekannt",
-        "bedarfs_menge_pos": 0.0,
-        "menge": 0.0,
-        "prod_id": "",
-        "start_bft": "",
-        "start_bew": "",
-        "beschaffung": "",
-        "referenz": "",
-        "fertig": False,
-        "ausgeliefert": False,
-    }
-
-    for col, default in defaults.items():
+    for col, default in DEFAULTS.items():
         if col not in df.columns:
             df[col] = default
 
+    for col in CATEGORY_FIELDS:
+        df[col] = df[col].astype("category")
+
     return df
@@ -0,0 +1,90 @@
+import threading
+
+import pandas as pd
+
+from backend.database_base import SessionLocal
+from backend.database import Item
+
+# ---------------------------------------------------------
+# DATENVERSION + ITEM-SNAPSHOT (prozessweit)
+# ---------------------------------------------------------
+# Jede schreibende Route ruft nach dem Commit bump_data_version() auf.
+# Lesende Routen holen sich den DataFrame über load_df(); er wird nur
+# neu aufgebaut, wenn sich die Version seit dem letzten Aufbau geändert hat.
+#
+# WICHTIG: Der DataFrame wird geteilt → Aufrufer dürfen ihn nicht verändern
+# (Filter/Kopien sind ok, Spaltenzuweisungen nur auf .copy()).
+
+_lock = threading.Lock()
+_build_lock = threading.Lock()
+
+_version = 0
+_snapshot_version = None
+_snapshot = None
+
+_stats = {"hits": 0, "misses": 0, "rebuilds": 0}
+
+
+def data_version() -> int:
+    return _version
+
+
+def bump_data_version() -> int:
+    global _version
+    with _lock:
+        _version += 1
+        return _version
+
+
+def _read_items() -> pd.DataFrame:
+    db = SessionLocal()
+    try:
+        columns = list(Item.__table__.columns)
+        rows = db.query(*columns).all()
+    finally:
+        db.close()
+
+    if not rows:
+        return pd.DataFrame()
+
+    return pd.DataFrame(rows, columns=[c.key for c in columns])
+
+
+def load_df() -> pd.DataFrame:
+    """Alle Items als DataFrame – aus dem Snapshot, solange die Version passt."""
+    global _snapshot, _snapshot_version
+
+    with _lock:
+        if _snapshot is not None and _snapshot_version == _version:
+            _stats["hits"] += 1
+            return _snapshot
+        _stats["misses"] += 1
+
+    # Nur ein Thread baut neu auf, die anderen warten und nehmen das Ergebnis
+    with _build_lock:
+        with _lock:
+            version = _version
+            if _snapshot is not None and _snapshot_version == version:
+                return _snapshot
+
+        # Version VOR dem Lesen merken → Schreiben währenddessen erzwingt neuen Aufbau
+        df = _read_items()
+
+        with _lock:
+            _stats["rebuilds"] += 1
+            _snapshot = df
+            _snapshot_version = version
+
+    return df
+
+
+def cache_stats() -> dict:
+    with _lock:
+        total = _stats["hits"] + _stats["misses"]
+        return {
+            **_stats,
+            "hit_rate": round(_stats["hits"] / total, 3) if total else 0.0,
+            "data_version": _version,
+            "snapshot_version": _snapshot_version,
+            "snapshot_rows": 0 if _snapshot is None else len(_snapshot),
+        }
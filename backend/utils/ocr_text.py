@@ -0,0 +1,51 @@
+import re
+
+# Ohne cv2/easyocr → auch im Web-Prozess nutzbar (z.B. Abgleich mit Items)
+
+
+# ---------------------------------------------------------
+# NORMALISIERUNG: macht OCR-Ausgabe DB-kompatibel
+# ---------------------------------------------------------
+def normalize_ocr_value(s: str) -> str:
+    if not s:
+        return None
+
+    s = s.lower().strip()
+
+    # Entferne Leerzeichen und typische OCR-Artefakte
+    remove_chars = [" ", "\n", "\t", "[", "]", "(", ")", "|"]
+    for ch in remove_chars:
+        s = s.replace(ch, "")
+
+    # Typische OCR-Verwechslungen korrigieren
+    ocr_fix = {
+        "0": "o",   # 0 -> o
+        "1": "i",   # 1 -> i
+        "l": "i",   # l -> i
+        "5": "s",   # 5 -> s
+        "6": "g",   # 6 -> g
+        "8": "b",   # 8 -> b
+        "§": "s",
+        "€": "e",
+        "ß": "ss",
+    }
+
+    for wrong, right in ocr_fix.items():
+        s = s.replace(wrong, right)
+
+    # Doppelte Fehler korrigieren
+    s = s.replace("g1", "gi")
+    s = s.replace("i1", "ih")
+    s = s.replace("1h", "ih")
+
+    return s
+
+
+# ---------------------------------------------------------
+# Hilfsfunktionen
+# ---------------------------------------------------------
+def extract_first(pattern, text):
+    if not text:
+        return None
+    m = re.search(pattern, text)
+    return m.group(1) if m else None
@@ -1,21 +1,8 @@
-from backend.database import SessionLocal, Item
+from backend.utils.item_snapshot import load_df
+import numpy as np
 import pandas as pd
 
-
-def load_df():
-    db = SessionLocal()
-    items = db.query(Item).all()
-    db.close()
-
-    if not items:
-        return pd.DataFrame()
-
-    df = pd.DataFrame([i.__dict__ for i in items])
-
-    if "_sa_instance_state" in df.columns:
-        df = df.drop(columns=["_sa_instance_state"])
-
-    return df
+ORDER_KEYS = ["kuerzel", "prod_id", "start_bft"]
 
 
 def build_production_tiles():
@@ -51,3 +38,200 @@ def build_production_tiles():
         })
 
     return tiles
+
+
+# ---------------------------------------------------------
+# PRODUKTION – LADUNGSTRÄGER-KACHELN
+# ---------------------------------------------------------
+def produktion_tile(lt: dict, status: str) -> dict:
+    """Kachel auf der Produktionsseite (Status "fertig" oder "offen")."""
+    if status == "fertig":
+        color = "gruen"
+        icon = "✔"
+    else:
+        color = "grau"
+        icon = "⏳"
+
+    return {
+        "id": lt["id"],
+        "name": lt["name"],
+        "status": color,
+        "icon": icon,
+    }
+
+
+def logistik_lt_tile(lt: dict) -> dict:
+    """Fertiger Ladungsträger auf der Logistikseite."""
+    return {
+        "id": lt["id"],
+        "name": lt["name"],
+        "status": "fertig",
+        "icon": "🚚",
+    }
+
+
+# ---------------------------------------------------------
+# LOGISTIK – AUFTRAGS-AGGREGATE IN EINEM DURCHLAUF
+# ---------------------------------------------------------
+def _flag(df: pd.DataFrame, col: str) -> pd.Series:
+    if col not in df.columns:
+        return pd.Series(False, index=df.index)
+    return df[col].fillna(False).astype(bool)
+
+
+def _pick(values: pd.Series, positions: pd.Series, default=""):
+    """Wert an Position (erste Zeile der Gruppe) oder Default."""
+    values = values.to_numpy()
+    return [
+        default if pd.isna(p) else values[int(p)]
+        for p in positions
+    ]
+
+
+def aggregate_orders(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Ein groupby().agg() über alle Items → eine Zeile pro Auftrag
+    (Kürzel + ProdID + Start-BFT) mit allen Werten für Kacheln
+    und order_status.
+
+    Kachel-Werte zählen nur sichtbare Logistik-Items
+    (nicht verschoben, nicht Produktion/Produktion), "alle_ausgeliefert"
+    alle Logistik-Items inkl. verschobener (wie früher is_done),
+    Menge/Zielort/Typ alle Items des Auftrags.
+    """
+    columns = ORDER_KEYS + [
+        "total_buendel", "kommissioniert_buendel", "ausgeliefert_buendel",
+        "kommissioniert_einige", "alle_ausgeliefert", "fehlteile", "reaktiviert", "verschoben",
+        "artikel_nr", "menge", "zielort", "has_produktion", "has_logistik",
+    ]
+
+    if df.empty:
+        return pd.DataFrame(columns=columns)
+
+    df = df.reset_index(drop=True)
+
+    produktion = df["beschaffung"] == "Produktion"
+    logistik = ~(produktion & (df["referenz"] == "Produktion"))
+    sichtbar = ~_flag(df, "verschoben")
+    sel = logistik & sichtbar
+
+    kommissioniert = _flag(df, "kommissioniert")
+    ausgeliefert = _flag(df, "ausgeliefert")
+    position = pd.Series(np.arange(len(df)), index=df.index, dtype=float)
+    zielort = df["ziel_lagerort"] if "ziel_lagerort" in df.columns else pd.Series("", index=df.index)
+
+    work = df[ORDER_KEYS].copy()
+    work["sichtbar"] = sichtbar
+
+    # Bündel = merge_key; offen, sobald EIN Item des Bündels offen ist
+    work["buendel"] = df["merge_key"].where(sel)
+    work["buendel_offen"] = df["merge_key"].where(sel & ~kommissioniert)
+    work["buendel_unterwegs"] = df["merge_key"].where(sel & ~ausgeliefert)
+
+    work["log_pos"] = logistik
+    work["log_unterwegs"] = logistik & ~ausgeliefert
+
+    work["kommi"] = sel & kommissioniert
+    work["fehlteil"] = sel & (df["referenz"] == "Bestellung")
+    work["reaktiviert"] = sichtbar & _flag(df, "reaktiviert")
+    work["erste_pos"] = position.where(sel)
+
+    work["menge"] = pd.to_numeric(df["bedarfs_menge_pos"], errors="coerce").fillna(0.0).abs()
+    work["zielort_pos"] = position.where(zielort.fillna("").astype(bool))
+    work["prod"] = produktion
+    work["log"] = df["beschaffung"] != "Produktion"
+
+    agg = work.groupby(ORDER_KEYS, sort=True).agg(
+        sichtbar=("sichtbar", "any"),
+        total_buendel=("buendel", "nunique"),
+        buendel_offen=("buendel_offen", "nunique"),
+        buendel_unterwegs=("buendel_unterwegs", "nunique"),
+        kommissioniert_einige=("kommi", "any"),
+        log_pos=("log_pos", "any"),
+        log_unterwegs=("log_unterwegs", "any"),
+        fehlteile=("fehlteil", "any"),
+        reaktiviert=("reaktiviert", "any"),
+        erste_pos=("erste_pos", "min"),
+        menge=("menge", "sum"),
+        zielort_pos=("zielort_pos", "min"),
+        has_produktion=("prod", "any"),
+        has_logistik=("log", "any"),
+    )
+
+    agg["kommissioniert_buendel"] = agg["total_buendel"] - agg["buendel_offen"]
+    agg["ausgeliefert_buendel"] = agg["total_buendel"] - agg["buendel_unterwegs"]
+    agg["verschoben"] = ~agg["sichtbar"]
+    agg["alle_ausgeliefert"] = agg["log_pos"] & ~agg["log_unterwegs"]
+
+    # Reaktiviert gilt für den ganzen Auftrag (Kürzel + ProdID)
+    agg["reaktiviert"] = agg.groupby(level=[0, 1])["reaktiviert"].transform("any")
+
+    agg["artikel_nr"] = _pick(df["artikel_nr"], agg["erste_pos"])
+    agg["zielort"] = _pick(zielort, agg["zielort_pos"])
+
+    return agg.reset_index()[columns]
+
+
+# ---------------------------------------------------------
+# LOGISTIK – KACHELN
+# ---------------------------------------------------------
+def logistik_tile(order) -> dict:
+    """Kachel für einen Auftrag (order_status-Zeile oder Aggregat-Zeile)."""
+    kommi_alle = order.kommissioniert_buendel == order.total_buendel
+    kommi_einige = bool(order.kommissioniert_einige)
+
+    if not kommi_einige:
+        status = "grau"
+        icon = "⏳"
+    elif kommi_einige and not kommi_alle:
+        status = "gelb"
+        icon = "🛠"
+    elif kommi_alle:
+        status = "hellgruen"
+        icon = "✅"
+    else:
+        status = "grau"
+        icon = "⏳"
+
+    return {
+        "kuerzel": order.kuerzel,
+        "prod_id": order.prod_id,
+        "status": status,
+        "icon": icon,
+        "fehlteile": bool(order.fehlteile),
+        "kritische_fehlteile": False,
+        "total": int(order.total_buendel),
+        "done": int(order.kommissioniert_buendel),
+        "produktion_fertig": True,
+        "start_bft": order.start_bft,
+        "reaktiviert": bool(order.reaktiviert),
+        "verschoben": False,
+        "artikel_nr": order.artikel_nr,
+    }
+
+
+def sort_logistik_tiles(tiles: list) -> list:
+    return sorted(
+        tiles,
+        key=lambda t: (
+            0 if t["reaktiviert"] else 1,
+            t["kuerzel"],
+            t["prod_id"],
+            t["start_bft"],
+        ),
+    )
+
+
+def build_logistik_tiles(df: pd.DataFrame) -> list:
+    """Alle offenen Logistik-Kacheln direkt aus einem Items-DataFrame."""
+    orders = aggregate_orders(df)
+
+    offen = orders[
+        ~orders["verschoben"]
+        & (orders["total_buendel"] > 0)
+        & ~orders["alle_ausgeliefert"]
+    ]
+
+    return sort_logistik_tiles(
+        [logistik_tile(o) for o in offen.itertuples(index=False)]
+    )
@@ -0,0 +1,157 @@
+import math
+import zipfile
+from xml.sax.saxutils import escape
+
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.utils import get_column_letter
+
+# ---------------------------------------------------------
+# XLSX STREAMEN (konstanter Speicher, erstes Byte sofort)
+# ---------------------------------------------------------
+# df.to_excel / openpyxl write_only / xlsxwriter constant_memory bauen die
+# Datei komplett (im Speicher oder als Temp-Datei), bevor das erste Byte
+# an den Browser geht. Eine xlsx ist ein Zip aus ein paar festen XML-Teilen
+# und dem Tabellenblatt – das Blatt wird hier Zeile für Zeile erzeugt und
+# durch einen Zip-Writer ohne seek() geschickt (Datendeskriptor statt
+# nachträglich geschriebener Größen). Nach jedem Zeilen-Paket wird das
+# fertig komprimierte Stück ausgeliefert.
+#
+# Zellen: Text als inlineStr (keine sharedStrings-Tabelle nötig), Zahlen,
+# Wahrheitswerte; None/NaN bleiben leer. Kopfzeile fett wie bei pandas.
+
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+
+ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+
+WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    '</Relationships>'
+)
+
+# Stil 0 = Standard, Stil 1 = fett (Kopfzeile)
+STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<sheetData>'
+)
+SHEET_TAIL = '</sheetData></worksheet>'
+
+
+class _Sink:
+    """Schreibziel des Zip-Writers ohne tell/seek: sammelt Bytes bis take()."""
+
+    def __init__(self):
+        self._parts = []
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts = []
+        return data
+
+
+def _cell(ref: str, value, style: str = "") -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return f'<c r="{ref}"{style} t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        if isinstance(value, float) and not math.isfinite(value):
+            return ""
+        return f'<c r="{ref}"{style}><v>{value!r}</v></c>'
+
+    text = escape(ILLEGAL_CHARACTERS_RE.sub("", str(value)))
+    return f'<c r="{ref}"{style} t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _row(number: int, letters: list, values, style: str = "") -> str:
+    cells = "".join(
+        _cell(f"{letter}{number}", value, style)
+        for letter, value in zip(letters, values)
+    )
+    return f'<row r="{number}">{cells}</row>'
+
+
+def stream_xlsx(header: list, batches, sheet_name: str = "Sheet1"):
+    """
+    Erzeugt eine xlsx-Datei als Folge von Byte-Stücken.
+
+    header:  Spaltenüberschriften
+    batches: Iterable von Zeilen-Paketen (Listen von Tupeln) – nach jedem
+             Paket wird das bis dahin Komprimierte ausgeliefert.
+    """
+    letters = [get_column_letter(i + 1) for i in range(len(header))]
+    sink = _Sink()
+
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", CONTENT_TYPES)
+        zf.writestr("_rels/.rels", ROOT_RELS)
+        zf.writestr("xl/workbook.xml", WORKBOOK.format(name=escape(sheet_name)))
+        zf.writestr("xl/_rels/workbook.xml.rels", WORKBOOK_RELS)
+        zf.writestr("xl/styles.xml", STYLES)
+
+        with zf.open("xl/worksheets/sheet1.xml", "w") as sheet:
+            sheet.write((SHEET_HEAD + _row(1, letters, header, ' s="1"')).encode())
+            yield sink.take()
+
+            number = 1
+            for batch in batches:
+                rows = []
+                for values in batch:
+                    number += 1
+                    rows.append(_row(number, letters, values))
+                sheet.write("".join(rows).encode())
+
+                chunk = sink.take()
+                if chunk:
+                    yield chunk
+
+            sheet.write(SHEET_TAIL.encode())
+
+    yield sink.take()
@@ -0,0 +1,77 @@
+"""
+Benchmark: fast gleiche Excel erneut importieren – Voll-Import vs. Delta-Import.
+
+Bestand: ZEILEN Items (teilweise kommissioniert). Die neue Datei ist dieselbe,
+mit ein paar geänderten Stammdaten und ein paar neuen Positionen.
+Prüft nebenbei, dass der Delta-Import den Fortschritt behält.
+
+    python -m benchmarks.bench_delta_import [ZEILEN] [GEAENDERT] [NEU]
+"""
+import os
+import sys
+
+import pandas as pd
+
+from backend.database import Item
+from backend.services.bulk_import import import_dataframe, import_delta
+from benchmarks.common import temp_session_factory, make_upload_frame, Timer
+
+
+def seeded_db(df):
+    Session, path = temp_session_factory()
+    db = Session()
+    import_dataframe(db, df)
+
+    # Fortschritt: jede dritte Position kommissioniert
+    db.query(Item).filter(Item.id % 3 == 0).update({"kommissioniert": True})
+    db.commit()
+    return db, path
+
+
+def next_day_file(df, changed: int, new: int):
+    df = df.copy()
+
+    # Stammdaten außerhalb des merge_key ändern
+    step = max(len(df) // max(changed, 1), 1)
+    idx = df.index[::step][:changed]
+    df.loc[idx, "referenz"] = "Umdisponiert"
+
+    extra = make_upload_frame(new, seed=99)
+    extra["prod_id"] = [f"{900000 + i // 12}" for i in range(new)]
+    return pd.concat([df, extra], ignore_index=True)
+
+
+def run(label, fn, base, upload):
+    db, path = seeded_db(base)
+    picked_before = db.query(Item).filter(Item.kommissioniert == True).count()
+
+    with Timer() as t:
+        result = fn(db, upload)
+        db.commit()
+
+    picked_after = db.query(Item).filter(Item.kommissioniert == True).count()
+    total = db.query(Item).count()
+    db.close()
+    os.remove(path)
+
+    print(f"{label:<8} {len(upload):>7} Zeilen  {t.seconds:7.2f} s  Items {total:>7}  "
+          f"kommissioniert {picked_before} → {picked_after}")
+    return result
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    changed = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    new = int(sys.argv[3]) if len(sys.argv) > 3 else 120
+
+    base = make_upload_frame(n)
+    upload = next_day_file(base, changed, new)
+
+    errors, _, _ = run("voll", import_dataframe, base, upload)
+    print(f"         {len(errors)} Fehler \"Position existiert bereits\"")
+
+    errors, _, diff, _ = run("delta", import_delta, base, upload)
+    print(f"         neu {diff['neu']}, geändert {diff['geaendert']}, "
+          f"unverändert {diff['unveraendert']}, Fehler {len(errors)}")
+
+    assert diff["neu"] == new and diff["geaendert"] == changed
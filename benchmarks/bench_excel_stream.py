@@ -0,0 +1,117 @@
+"""
+Benchmark: Spitzen-Speicher (RSS) beim Excel-Import – pandas vs. Streaming.
+
+Erzeugt eine .xlsx mit ZEILEN Positionen und importiert sie je Modus in
+einem frischen Prozess (eigenes Temp-Verzeichnis mit leerer app.db):
+
+    pandas     – pd.read_excel, ganze Arbeitsmappe im Speicher
+    streaming  – openpyxl read_only, Teilstücke à IMPORT_CHUNK_ROWS Zeilen
+
+    python -m benchmarks.bench_excel_stream [ZEILEN] [TEILSTUECK]
+"""
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from openpyxl import Workbook
+
+from tests.upload_data import EXCEL_HEADERS, make_upload_frame
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODES = {
+    "pandas": {"IMPORT_STREAMING": "0"},
+    "streaming": {"IMPORT_STREAMING": "1"},
+}
+
+
+def write_xlsx(path: str, n: int):
+    df = make_upload_frame(n).rename(columns=EXCEL_HEADERS)
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(list(df.columns))
+    for row in df.itertuples(index=False):
+        ws.append(list(row))
+    wb.save(path)
+
+
+def peak_rss_mb() -> float:
+    # VmHWM gehört zum Prozess selbst; ru_maxrss kann nach fork/exec
+    # noch den (größeren) Wert des Elternprozesses enthalten
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def child(path: str):
+    """Läuft im eigenen Prozess: ein Import-Job, Ergebnis als JSON."""
+    from backend.database_base import Base, engine
+    from backend.services import import_jobs
+
+    Base.metadata.create_all(bind=engine)
+
+    with open(path, "rb") as f:
+        content = f.read()
+
+    base = peak_rss_mb()
+    job = import_jobs._new_job(os.path.basename(path), "voll")
+
+    start = time.perf_counter()
+    import_jobs._run_job(job, content)
+    seconds = time.perf_counter() - start
+
+    print(json.dumps({
+        "status": job["status"],
+        "message": job["message"],
+        "inserted": job["inserted"],
+        "seconds": seconds,
+        "base_mb": base,
+        "peak_mb": peak_rss_mb(),
+    }))
+
+
+def run(mode: str, path: str, chunk_rows: int) -> dict:
+    env = {
+        **os.environ,
+        **MODES[mode],
+        "IMPORT_CHUNK_ROWS": str(chunk_rows),
+        "PYTHONPATH": os.pathsep.join(p for p in (ROOT, os.environ.get("PYTHONPATH")) if p),
+    }
+    with tempfile.TemporaryDirectory() as cwd:
+        out = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_excel_stream", "--child", path],
+            cwd=cwd, env=env, capture_output=True, text=True, check=True,
+        ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(sys.argv[2])
+        sys.exit()
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    chunk_rows = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "upload.xlsx")
+        write_xlsx(path, n)
+        print(f"{n} Zeilen, {os.path.getsize(path) / 2**20:.1f} MB xlsx, Teilstück {chunk_rows}")
+
+        results = {mode: run(mode, path, chunk_rows) for mode in MODES}
+
+    for mode, r in results.items():
+        print(f"{mode:<10} {r['status']:<7} {r['inserted']:>7} Items  {r['seconds']:7.1f} s  "
+              f"RSS Spitze {r['peak_mb']:7.0f} MB  (+{r['peak_mb'] - r['base_mb']:.0f} MB über Start)")
+
+    assert results["pandas"]["inserted"] == results["streaming"]["inserted"]
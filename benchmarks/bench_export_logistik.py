@@ -0,0 +1,166 @@
+"""
+Benchmark: /export/logistik – bisher (ORM + DataFrame + to_excel in BytesIO)
+vs. Streaming (Core-Select mit yield_per + xlsx Zeile für Zeile).
+
+Legt in einem Temp-Verzeichnis eine app.db mit ZEILEN Items an (teilweise
+kommissioniert / ausgebucht / Produktion) und exportiert je Variante in
+einem frischen Prozess. Gemessen: Zeit bis zum ersten Byte, Gesamtzeit,
+Spitzen-Speicher (RSS). Beide Dateien müssen denselben Inhalt haben.
+
+    python -m benchmarks.bench_export_logistik [ZEILEN]
+"""
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.bench_excel_stream import peak_rss_mb
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+VARIANTS = ("vorher", "streaming")
+
+
+def legacy_export_logistik(db) -> io.BytesIO:
+    """Bisherige Implementierung (Stand vor der Umstellung)."""
+    from backend.database import Item
+
+    items = db.query(Item).all()
+    rows = []
+
+    for item in items:
+        if item.beschaffung == "Produktion" and item.referenz == "Produktion":
+            continue
+
+        if item.ausgebucht:
+            status = "kritisch"
+        elif not item.kommissioniert:
+            status = "offen"
+        else:
+            status = "teil-kommissioniert"
+
+        if status not in ["offen", "teil-kommissioniert"]:
+            continue
+
+        rows.append({
+            "ProdID": item.prod_id,
+            "Kürzel": item.kuerzel,
+            "Artikel-Nr": item.artikel_nr,
+            "Bew.-Artikel": item.artikel_clean,
+            "Durchmesser": item.durchmesser,
+            "Länge": item.laenge,
+            "Biegung": item.biegung,
+            "Bedarfs-Menge": item.bedarfs_menge_pos,
+            "Beschaffung": item.beschaffung,
+            "Referenz (ERP-Artikel)": item.referenz,
+            "Menge": item.menge,
+            "Kommissioniert": item.kommissioniert,
+            "Status": status,
+            "Start-BFT": item.start_bft,
+            "Start-Bew": item.start_bew,
+        })
+
+    df = pd.DataFrame(rows)
+
+    output = io.BytesIO()
+    df.to_excel(output, index=False)
+    output.seek(0)
+    return output
+
+
+def seed(n: int):
+    from backend.database_base import Base, engine, SessionLocal
+    from backend.database import Item
+    from backend.services.bulk_import import import_dataframe
+    from benchmarks.common import make_upload_frame
+
+    Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    import_dataframe(db, make_upload_frame(n))
+    db.query(Item).filter(Item.id % 3 == 0).update({"kommissioniert": True})
+    db.query(Item).filter(Item.id % 17 == 0).update({"ausgebucht": True})
+    db.query(Item).filter(Item.beschaffung == "Produktion", Item.id % 2 == 0).update(
+        {"referenz": "Produktion"}
+    )
+    db.commit()
+    db.close()
+
+
+def child(variant: str, out_path: str):
+    """Läuft im eigenen Prozess: ein Export, Ergebnis als JSON."""
+    from backend.database_base import SessionLocal
+    from backend.routes.export import _logistik_xlsx
+
+    base = peak_rss_mb()
+    start = time.perf_counter()
+    first_byte = None
+
+    with open(out_path, "wb") as f:
+        if variant == "vorher":
+            db = SessionLocal()
+            chunks = iter(legacy_export_logistik(db))
+        else:
+            chunks = _logistik_xlsx()
+
+        for chunk in chunks:
+            if first_byte is None:
+                first_byte = time.perf_counter() - start
+            f.write(chunk)
+
+        if variant == "vorher":
+            db.close()
+
+    print(json.dumps({
+        "first_byte": first_byte,
+        "seconds": time.perf_counter() - start,
+        "base_mb": base,
+        "peak_mb": peak_rss_mb(),
+    }))
+
+
+def run(cwd: str, *args) -> dict:
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(p for p in (ROOT, os.environ.get("PYTHONPATH")) if p),
+    }
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_export_logistik", *args],
+        cwd=cwd, env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--seed"]:
+        seed(int(sys.argv[2]))
+        print("{}")
+        sys.exit()
+    if sys.argv[1:2] == ["--child"]:
+        child(*sys.argv[2:4])
+        sys.exit()
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    with tempfile.TemporaryDirectory() as cwd:
+        run(cwd, "--seed", str(n))
+
+        results, files = {}, {}
+        for variant in VARIANTS:
+            path = os.path.join(cwd, f"{variant}.xlsx")
+            results[variant] = run(cwd, "--child", variant, path)
+            files[variant] = pd.read_excel(path)
+            results[variant]["mb"] = os.path.getsize(path) / 2**20
+
+    print(f"{n} Items, {len(files['vorher'])} Zeilen im Export")
+    for variant, r in results.items():
+        print(f"{variant:<10} erstes Byte {r['first_byte'] * 1000:7.0f} ms  gesamt {r['seconds']:6.2f} s  "
+              f"RSS +{r['peak_mb'] - r['base_mb']:5.0f} MB  Datei {r['mb']:5.1f} MB")
+
+    pd.testing.assert_frame_equal(files["streaming"], files["vorher"])
+    print("Inhalt identisch")
@@ -0,0 +1,123 @@
+"""
+Benchmark: doppelt hochgeladene Datei mit und ohne Import-Fingerabdruck.
+
+Je Variante in einem frischen Prozess (eigenes Temp-Verzeichnis, leere app.db):
+
+    1. Datei A importieren (voll)
+    2. Datei A noch einmal (voll)            – z.B. zweite Schicht
+    3. Datei B = A mit geänderten/neuen Zeilen (delta)
+
+"ohne" löscht vor jedem Upload die gespeicherten Fingerabdrücke, d.h. jede
+Zeile wird wie bisher geprüft. Beide Varianten müssen denselben Bestand und
+denselben Diff ergeben.
+
+    python -m benchmarks.bench_import_fingerprint [ZEILEN] [GEAENDERT] [NEU]
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_delta_import import next_day_file
+from tests.upload_data import EXCEL_HEADERS, make_upload_frame
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+VARIANTS = ("mit", "ohne")
+
+
+def child(variant: str, path_a: str, path_b: str):
+    """Läuft im eigenen Prozess: drei Uploads, Ergebnis als JSON."""
+    from backend.database_base import Base, engine, SessionLocal
+    from backend.database import Item, ImportRecord
+    from backend.services import import_jobs
+
+    Base.metadata.create_all(bind=engine)
+
+    def upload(path, mode):
+        if variant == "ohne":
+            db = SessionLocal()
+            db.query(ImportRecord).delete()
+            db.commit()
+            db.close()
+
+        with open(path, "rb") as f:
+            content = f.read()
+
+        job = import_jobs._new_job(os.path.basename(path), mode, "csv")
+        start = time.perf_counter()
+        import_jobs._run_job(job, content)
+        return job, time.perf_counter() - start
+
+    steps = []
+    for label, path, mode in (
+        ("A erstmals", path_a, "voll"),
+        ("A erneut", path_a, "voll"),
+        ("B delta", path_b, "delta"),
+    ):
+        job, seconds = upload(path, mode)
+        steps.append({
+            "label": label,
+            "seconds": seconds,
+            "message": job["message"],
+            "bekannt": job["bekannt"],
+            "diff": {k: v for k, v in (job["diff"] or {}).items() if k != "beispiele"},
+        })
+
+    db = SessionLocal()
+    items = db.query(Item).count()
+    db.close()
+
+    print(json.dumps({"steps": steps, "items": items}))
+
+
+def run(variant: str, path_a: str, path_b: str) -> dict:
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(p for p in (ROOT, os.environ.get("PYTHONPATH")) if p),
+    }
+    with tempfile.TemporaryDirectory() as cwd:
+        out = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_import_fingerprint",
+             "--child", variant, path_a, path_b],
+            cwd=cwd, env=env, capture_output=True, text=True, check=True,
+        ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(*sys.argv[2:5])
+        sys.exit()
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    changed = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    new = int(sys.argv[3]) if len(sys.argv) > 3 else 120
+
+    base = make_upload_frame(n)
+    files = {
+        "a.csv": base,
+        "b.csv": next_day_file(base, changed, new),
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for name, df in files.items():
+            path = os.path.join(tmp, name)
+            df.rename(columns=EXCEL_HEADERS).to_csv(path, sep=";", decimal=",", index=False)
+            paths.append(path)
+
+        results = {variant: run(variant, *paths) for variant in VARIANTS}
+
+    print(f"{n} Zeilen, {changed} geändert, {new} neu")
+    for variant, r in results.items():
+        for step in r["steps"]:
+            print(f"{variant:<5} {step['label']:<11} {step['seconds'] * 1000:8.0f} ms  "
+                  f"bekannt {step['bekannt']:>7}  {step['message'] or ''}")
+
+    mit, ohne = results["mit"], results["ohne"]
+    assert mit["items"] == ohne["items"]
+    assert mit["steps"][2]["diff"] == ohne["steps"][2]["diff"], (mit["steps"][2], ohne["steps"][2])
+    print(f"Bestand identisch ({mit['items']} Items), Delta-Diff identisch: {mit['steps'][2]['diff']}")
@@ -0,0 +1,70 @@
+"""
+Benchmark: Barcode/QR-Pfad vs. OCR-Pfad.
+
+Erzeugt synthetische Etiketten mit QR-Code (Inhalt "kuerzel=…;stueckzahl=…")
+und liest jedes Etikett zweimal mit ocr_engine.read_label:
+    code – Code-Erkennung zuerst (OCR_CODES), OCR nur als Rückfall
+    ocr  – nur OCR (use_codes=False)
+Zusätzlich: Etiketten OHNE Code, um die Kosten der erfolglosen
+Code-Suche vor der OCR zu zeigen.
+
+    python -m benchmarks.bench_ocr_codes [ANZAHL]
+
+Braucht easyocr + opencv.
+"""
+import random
+import statistics
+import sys
+
+from backend.services import ocr_engine
+from benchmarks.common import make_label_image, random_label_fields, code_payload, Timer
+
+
+def timed(samples: list, **kwargs) -> tuple:
+    latencies = []
+    paths = {}
+    correct = 0
+
+    for fields, content in samples:
+        with Timer() as t:
+            result = ocr_engine.read_label(content, **kwargs)
+        latencies.append(t.seconds * 1000)
+        paths[result["path"]] = paths.get(result["path"], 0) + 1
+        correct += all(
+            result[f] == ocr_engine.normalize_ocr_value(fields[f]) for f in ocr_engine.FIELDS
+        )
+
+    return statistics.mean(latencies), max(latencies), paths, correct
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    rnd = random.Random(3)
+
+    with_code = []
+    without_code = []
+    for _ in range(n):
+        fields = random_label_fields(rnd)
+        with_code.append((fields, make_label_image(fields, qr=code_payload(fields))))
+        without_code.append((fields, make_label_image(fields)))
+
+    ocr_engine.init_worker()
+    ocr_engine.read_label(without_code[0][1], use_codes=False)
+
+    rows = [
+        ("mit Code, Code-Pfad", with_code, {"use_codes": True}),
+        ("mit Code, nur OCR", with_code, {"use_codes": False}),
+        ("ohne Code, Code-Pfad", without_code, {"use_codes": True}),
+        ("ohne Code, nur OCR", without_code, {"use_codes": False}),
+    ]
+
+    print(f"{n} Etiketten je Zeile")
+    results = {}
+    for label, samples, kwargs in rows:
+        mean_ms, max_ms, paths, correct = results[label] = timed(samples, **kwargs)
+        print(f"{label:22s} Ø {mean_ms:8.1f} ms  max {max_ms:8.1f} ms  "
+              f"alle Felder richtig {correct:3d}/{n}  Pfade {paths}")
+
+    speedup = results["mit Code, nur OCR"][0] / results["mit Code, Code-Pfad"][0]
+    overhead = results["ohne Code, Code-Pfad"][0] - results["ohne Code, nur OCR"][0]
+    print(f"Code-Pfad {speedup:.0f}x schneller, erfolglose Code-Suche kostet Ø {overhead:.1f} ms")
@@ -0,0 +1,145 @@
+"""
+Benchmark: bleiben andere Routen erreichbar, während OCR läuft?
+
+Startet eine kleine App (uvicorn, ein Worker) mit /api/ocr/etikett und
+einer leichten Route /ping. Es werden SCANS Etiketten gleichzeitig
+geschickt, parallel wird alle 50 ms /ping gemessen.
+
+    inline  – OCR direkt in der async-Route (bisheriges Verhalten)
+    pool    – OCR im Prozesspool (backend.services.ocr_pool)
+
+    python -m benchmarks.bench_ocr_concurrency [SCANS] [BILD]
+
+Braucht easyocr + opencv. Ohne BILD wird ein synthetisches Etikett erzeugt.
+Worker-Anzahl über OCR_WORKERS.
+"""
+import asyncio
+import socket
+import statistics
+import sys
+import threading
+import time
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, UploadFile, File
+
+from backend.services import ocr_engine, ocr_pool
+from backend.routes.ocr import router as ocr_router
+from benchmarks.common import make_label_image, Timer
+
+PING_INTERVAL = 0.05
+
+
+def inline_app() -> FastAPI:
+    ocr_engine.init_worker()
+    app = FastAPI()
+
+    @app.post("/api/ocr/etikett")
+    async def ocr_etikett(file: UploadFile = File(...)):
+        return ocr_engine.read_label(await file.read())
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+def pool_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(ocr_router, prefix="/api")
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def serve(app: FastAPI) -> tuple:
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(app, port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, thread, f"http://127.0.0.1:{port}"
+
+
+async def measure(base_url: str, image: bytes, scans: int) -> dict:
+    async with httpx.AsyncClient(base_url=base_url, timeout=600) as client:
+        pings = []
+        running = True
+
+        async def pinger():
+            while running:
+                t = time.perf_counter()
+                await client.get("/ping")
+                pings.append(time.perf_counter() - t)
+                await asyncio.sleep(PING_INTERVAL)
+
+        async def scan():
+            r = await client.post(
+                "/api/ocr/etikett",
+                files={"file": ("etikett.png", image, "image/png")},
+            )
+            return r.status_code
+
+        ping_task = asyncio.create_task(pinger())
+
+        with Timer() as t:
+            codes = await asyncio.gather(*(scan() for _ in range(scans)))
+
+        running = False
+        await ping_task
+
+    return {
+        "seconds": t.seconds,
+        "codes": {c: codes.count(c) for c in sorted(set(codes))},
+        "ping_p50_ms": statistics.median(pings) * 1000,
+        "ping_max_ms": max(pings) * 1000,
+        "pings": len(pings),
+    }
+
+
+def run(mode: str, image: bytes, scans: int) -> dict:
+    app = inline_app() if mode == "inline" else pool_app()
+
+    if mode == "pool":
+        ocr_pool.start_pool()
+        # Modelle geladen? (Warmup-Scan)
+        asyncio.run(ocr_pool.scan_label(image))
+
+    server, thread, base_url = serve(app)
+    try:
+        return asyncio.run(measure(base_url, image, scans))
+    finally:
+        server.should_exit = True
+        thread.join()
+        if mode == "pool":
+            ocr_pool.shutdown_pool()
+
+
+if __name__ == "__main__":
+    scans = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+
+    if len(sys.argv) > 2:
+        with open(sys.argv[2], "rb") as f:
+            image = f.read()
+    else:
+        image = make_label_image()
+
+    print(f"{scans} gleichzeitige Scans, OCR_WORKERS={ocr_pool.OCR_WORKERS}")
+    for mode in ("inline", "pool"):
+        r = run(mode, image, scans)
+        print(
+            f"{mode:7s} {r['seconds']:7.2f} s   Status {r['codes']}   "
+            f"/ping p50 {r['ping_p50_ms']:7.1f} ms  max {r['ping_max_ms']:8.1f} ms  ({r['pings']} Pings)"
+        )
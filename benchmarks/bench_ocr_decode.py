@@ -0,0 +1,76 @@
+"""
+Benchmark: Dekodieren + Etikett-Suche bei Handyfotos (12 MP JPEG).
+
+Misst pro Scan die Vorverarbeitung von read_label (Dekodieren, Rechteck
+suchen, Ausschnitt für die Erkennung holen) sowie den Spitzenspeicher
+(ru_maxrss) – jeweils in einem eigenen Prozess:
+
+    voll     – OCR_FAST_DECODE=0 (bisher: volle Auflösung dekodieren)
+    schnell  – OCR_FAST_DECODE=1 (Draft-Dekodierung, Suche auf ≤ 1024 px)
+    schnell+ – zusätzlich OCR_RECOGNITION_MAX_SIDE=2048
+
+    python -m benchmarks.bench_ocr_decode [SCANS] [JPEG]
+
+Braucht opencv + Pillow (kein easyocr).
+"""
+import json
+import os
+import subprocess
+import sys
+
+MODES = {
+    "voll": {"OCR_FAST_DECODE": "0"},
+    "schnell": {"OCR_FAST_DECODE": "1"},
+    "schnell+": {"OCR_FAST_DECODE": "1", "OCR_RECOGNITION_MAX_SIDE": "2048"},
+}
+
+CHILD = """
+import json, resource, sys, time
+from backend.services import ocr_engine as e
+
+content = open(sys.argv[1], "rb").read()
+scans = int(sys.argv[2])
+base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+times = []
+for _ in range(scans):
+    t = time.perf_counter()
+    small, factor = e.detection_image(content)
+    crop, region = e.recognition_crop(content, small, e.find_label_region(small), factor)
+    times.append(time.perf_counter() - t)
+
+print(json.dumps({
+    "ms": sum(times) / len(times) * 1000,
+    "peak_mb": (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - base) / 1024,
+    "crop": list(crop.shape),
+    "region": region,
+}))
+"""
+
+
+def make_photo(path: str):
+    from benchmarks.common import make_label_image
+
+    with open(path, "wb") as f:
+        f.write(make_label_image(width=4000, height=3000, fmt=".jpg"))
+
+
+if __name__ == "__main__":
+    scans = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    path = sys.argv[2] if len(sys.argv) > 2 else "/tmp/bench_etikett_12mp.jpg"
+
+    if not os.path.exists(path):
+        make_photo(path)
+
+    print(f"{scans} Scans von {path} ({os.path.getsize(path) / 1e6:.1f} MB)")
+    for name, env in MODES.items():
+        out = subprocess.run(
+            [sys.executable, "-c", CHILD, path, str(scans)],
+            env={**os.environ, **env},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        r = json.loads(out.strip().splitlines()[-1])
+        print(f"{name:9s} {r['ms']:8.1f} ms/Scan   Spitzenspeicher +{r['peak_mb']:6.1f} MB   "
+              f"Ausschnitt {r['crop']}  Region {r['region']}")
@@ -0,0 +1,110 @@
+"""
+Benchmark: Feld-Genauigkeit und Latenz – Volltext vs. Etikett-Vorlage.
+
+ORDNER enthält Fotos (*.jpg, *.jpeg, *.png) und je Foto eine gleichnamige
+.json mit den erwarteten Werten, so wie sie auf dem Etikett stehen:
+
+    {"kuerzel": "HBK24A", "stueckzahl": "12", "durchmesser": "12",
+     "laenge": "1250", "artikelnummer": "B500B-12345678"}
+
+Fehlende Felder in der .json werden nicht bewertet. Ohne ORDNER werden
+ANZAHL synthetische Etiketten erzeugt (Layout aus ocr_templates.json).
+
+    python -m benchmarks.bench_ocr_fields [ORDNER | ANZAHL]
+
+Braucht easyocr + opencv. Vorlagen-Bereiche werden mit diesem Skript auf
+echten Fotos kalibriert, bevor OCR_LABEL_TEMPLATES=1 gesetzt wird.
+"""
+import glob
+import json
+import os
+import random
+import statistics
+import sys
+
+from backend.services import ocr_engine
+from benchmarks.common import make_label_image, random_label_fields, Timer
+
+IMAGE_PATTERNS = ("*.jpg", "*.jpeg", "*.png")
+
+
+def load_samples(folder: str) -> list:
+    samples = []
+    for pattern in IMAGE_PATTERNS:
+        for path in sorted(glob.glob(os.path.join(folder, pattern))):
+            truth_path = os.path.splitext(path)[0] + ".json"
+            if not os.path.exists(truth_path):
+                continue
+            with open(path, "rb") as f, open(truth_path, "r", encoding="utf-8") as t:
+                samples.append((os.path.basename(path), f.read(), json.load(t)))
+    return samples
+
+
+def synthetic_samples(n: int) -> list:
+    rnd = random.Random(7)
+    samples = []
+    for i in range(n):
+        fields = random_label_fields(rnd)
+        samples.append((f"synthetisch-{i:03d}", make_label_image(fields), fields))
+    return samples
+
+
+def evaluate(samples: list, use_templates: bool) -> dict:
+    correct = {f: 0 for f in ocr_engine.FIELDS}
+    total = {f: 0 for f in ocr_engine.FIELDS}
+    latencies = []
+    fallbacks = 0
+
+    for name, content, truth in samples:
+        with Timer() as t:
+            result = ocr_engine.read_label(content, use_templates=use_templates)
+        latencies.append(t.seconds)
+
+        if use_templates and result["debug_raw"]["mode"] == "volltext":
+            fallbacks += 1
+
+        for field in ocr_engine.FIELDS:
+            if field not in truth:
+                continue
+            total[field] += 1
+            if result[field] == ocr_engine.normalize_ocr_value(str(truth[field])):
+                correct[field] += 1
+
+    latencies.sort()
+    return {
+        "accuracy": {f: correct[f] / total[f] if total[f] else None for f in ocr_engine.FIELDS},
+        "mean_ms": statistics.mean(latencies) * 1000,
+        "p95_ms": latencies[int(0.95 * (len(latencies) - 1))] * 1000,
+        "fallbacks": fallbacks,
+    }
+
+
+if __name__ == "__main__":
+    arg = sys.argv[1] if len(sys.argv) > 1 else "30"
+
+    if os.path.isdir(arg):
+        samples = load_samples(arg)
+    else:
+        samples = synthetic_samples(int(arg))
+
+    if not samples:
+        sys.exit("Keine Fotos mit passender .json gefunden")
+
+    ocr_engine.init_worker()
+    # Erster Aufruf lädt noch Gewichte nach → nicht mitmessen
+    ocr_engine.read_label(samples[0][1], use_templates=False)
+
+    print(f"{len(samples)} Etiketten")
+    print(f"{'':10s}" + "".join(f"{f:>15s}" for f in ocr_engine.FIELDS) + f"{'Ø ms':>10s}{'p95 ms':>10s}")
+
+    results = {}
+    for label, use_templates in (("Volltext", False), ("Vorlage", True)):
+        r = results[label] = evaluate(samples, use_templates)
+        acc = "".join(
+            f"{'-':>15s}" if a is None else f"{a * 100:14.1f}%"
+            for a in r["accuracy"].values()
+        )
+        print(f"{label:10s}{acc}{r['mean_ms']:10.0f}{r['p95_ms']:10.0f}")
+
+    print(f"Vorlage → Volltext-Fallback bei {results['Vorlage']['fallbacks']} von {len(samples)} Etiketten")
+    print(f"Faktor Ø-Latenz: {results['Volltext']['mean_ms'] / results['Vorlage']['mean_ms']:.1f}x")
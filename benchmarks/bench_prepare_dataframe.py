@@ -0,0 +1,61 @@
+"""
+Benchmark + Gleichheitsprüfung: prepare_dataframe (alt vs. neu).
+
+Erzeugt ein Blatt wie aus pd.read_excel (Original-Spaltennamen mit Umlauten,
+Punkten, Aliasen; Datumsspalten als datetime64 bzw. gemischt; leere Kürzel)
+und vergleicht die bisherige Implementierung mit backend.utils.dataframe:
+gleiche Zeilen, Spalten und Werte (category-Spalten als Text verglichen).
+
+    python -m benchmarks.bench_prepare_dataframe [ZEILEN]
+"""
+import datetime
+import random
+import sys
+
+import numpy as np
+import pandas as pd
+
+from backend.utils.dataframe import prepare_dataframe
+from benchmarks.common import Timer
+from tests.legacy_prepare import legacy_prepare_dataframe, assert_same
+from tests.upload_data import EXCEL_HEADERS, make_upload_frame
+
+
+def make_sheet(n: int) -> pd.DataFrame:
+    rnd = random.Random(3)
+    df = make_upload_frame(n)
+
+    # Start BFT als echtes Datum (wie openpyxl es liefert), Start Bew gemischt
+    df["start_bft"] = pd.to_datetime(df["start_bft"])
+    df["start_bew"] = [
+        rnd.choice([datetime.datetime(2026, 3, 1 + i % 28), f"KW{i % 52}", np.nan])
+        for i in range(n)
+    ]
+
+    # Leere / fehlende Kürzel, fehlende Biegung
+    for i in rnd.sample(range(n), n // 50):
+        df.at[i, "kuerzel"] = rnd.choice(["", "  ", np.nan, "nan"])
+    for i in rnd.sample(range(n), n // 50):
+        df.at[i, "biegung"] = np.nan
+
+    return df.rename(columns=EXCEL_HEADERS)
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    sheet = make_sheet(n)
+
+    with Timer() as t_old:
+        old = legacy_prepare_dataframe(sheet.copy())
+    with Timer() as t_new:
+        new = prepare_dataframe(sheet.copy())
+
+    assert_same(new, old)
+
+    mb_old = old.memory_usage(deep=True).sum() / 2**20
+    mb_new = new.memory_usage(deep=True).sum() / 2**20
+
+    print(f"{n} Zeilen, {len(new)} nach Filter – Ergebnis identisch")
+    print(f"vorher  {t_old.seconds * 1000:8.0f} ms  {mb_old:7.1f} MB")
+    print(f"neu     {t_new.seconds * 1000:8.0f} ms  {mb_new:7.1f} MB")
+    print(f"Faktor  {t_old.seconds / t_new.seconds:8.1f}x")
@@ -0,0 +1,99 @@
+"""
+Benchmark: mehrere Kommissionierer schreiben gleichzeitig.
+
+Jeder Thread bucht einzelne Positionen als kommissioniert (eine
+Transaktion pro Klick, wie /logistik/kommissioniert) und liest danach
+den Auftrag. Verglichen werden das bisherige Engine-Setup und das
+SQLite-Profil aus database_base (WAL, synchronous=NORMAL, busy_timeout …).
+
+    python -m benchmarks.bench_sqlite_writers [THREADS] [KLICKS_PRO_THREAD]
+"""
+import os
+import sys
+import tempfile
+import threading
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from backend.database_base import Base, SQLITE_PRAGMAS, SQLITE_BUSY_TIMEOUT_MS, apply_sqlite_profile
+from backend.database import Item
+from backend.services.bulk_import import import_dataframe
+from benchmarks.common import make_upload_frame, Timer
+
+
+def make_engine(tuned: bool):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+
+    connect_args = {"check_same_thread": False}
+    if tuned:
+        connect_args["timeout"] = SQLITE_BUSY_TIMEOUT_MS / 1000
+
+    engine = create_engine(f"sqlite:///{path}", connect_args=connect_args)
+    if tuned:
+        apply_sqlite_profile(engine, SQLITE_PRAGMAS)
+
+    Base.metadata.create_all(bind=engine)
+    return engine, path
+
+
+def run(tuned: bool, threads: int, clicks: int):
+    engine, path = make_engine(tuned)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = Session()
+    import_dataframe(db, make_upload_frame(threads * clicks))
+    db.commit()
+    keys = [k for (k,) in db.query(Item.merge_key).order_by(Item.id).all()]
+    db.close()
+
+    errors = []
+    done = []
+
+    def picker(n):
+        for key in keys[n * clicks:(n + 1) * clicks]:
+            db = Session()
+            try:
+                item = db.query(Item).filter(Item.merge_key == key).first()
+                item.kommissioniert = True
+                db.commit()
+                db.query(Item).filter(
+                    Item.kuerzel == item.kuerzel,
+                    Item.prod_id == item.prod_id,
+                    Item.start_bft == item.start_bft,
+                ).all()
+                done.append(1)
+            except OperationalError as e:
+                db.rollback()
+                errors.append(str(e.orig))
+            finally:
+                db.close()
+
+    workers = [threading.Thread(target=picker, args=(n,)) for n in range(threads)]
+
+    with Timer() as t:
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+
+    engine.dispose()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+    label = "Profil" if tuned else "bisher"
+    print(
+        f"{label:<7} {threads} Threads  {len(done):6} Klicks  {t.seconds:7.2f} s  "
+        f"{len(done) / t.seconds:8.0f} Klicks/s  {len(errors):4} 'database is locked'"
+    )
+
+
+if __name__ == "__main__":
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    clicks = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    run(False, threads, clicks)
+    run(True, threads, clicks)
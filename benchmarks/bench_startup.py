@@ -0,0 +1,108 @@
+"""
+Messung: Zeit bis zum ersten Request (App-Start per uvicorn).
+
+    ohne OCR    – OCR_ENABLED=0
+    lazy        – OCR wird nach dem Start im Hintergrund geladen
+                  (zusätzlich: Zeit bis /ready "ocr.ready" meldet)
+    beim Import – easyocr-Modell wird VOR dem App-Start geladen
+                  (so wie früher beim Import von routes/ocr.py)
+
+Jeder Lauf startet einen frischen Prozess in einem leeren Temp-Verzeichnis
+(eigene app.db).
+
+    python -m benchmarks.bench_startup [WIEDERHOLUNGEN]
+"""
+import importlib.util
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SERVE = "import uvicorn; uvicorn.run('backend.main:app', port={port}, log_level='warning')"
+EAGER = "import easyocr; easyocr.Reader(['de'], gpu=False); " + SERVE
+
+MODES = {
+    "ohne OCR": (SERVE, {"OCR_ENABLED": "0"}),
+    "lazy": (SERVE, {"OCR_ENABLED": "1", "OCR_PRELOAD": "1", "OCR_PRELOAD_DELAY_SECONDS": "0"}),
+    "beim Import": (EAGER, {"OCR_ENABLED": "1", "OCR_PRELOAD": "0"}),
+}
+
+TIMEOUT_SECONDS = 300
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_once(code: str, env: dict) -> tuple:
+    """→ (Sekunden bis erster Request, Sekunden bis OCR bereit | None)"""
+    wait_for_ocr = env.get("OCR_PRELOAD") == "1"
+    port = free_port()
+    url = f"http://127.0.0.1:{port}/ready"
+
+    with tempfile.TemporaryDirectory() as cwd:
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            [sys.executable, "-c", code.format(port=port)],
+            cwd=cwd,
+            env={**os.environ, **env, "PYTHONPATH": os.pathsep.join(
+                p for p in (ROOT, os.environ.get("PYTHONPATH")) if p
+            )},
+            stdout=subprocess.DEVNULL,
+        )
+
+        first = None
+        ocr_ready = None
+        try:
+            while time.perf_counter() - start < TIMEOUT_SECONDS:
+                if proc.poll() is not None:
+                    raise RuntimeError("Server beendet sich beim Start")
+                try:
+                    r = httpx.get(url, timeout=1)
+                except httpx.HTTPError:
+                    time.sleep(0.02)
+                    continue
+
+                now = time.perf_counter() - start
+                if first is None:
+                    first = now
+
+                ocr = r.json()["ocr"]
+                if ocr["ready"]:
+                    ocr_ready = now
+                if ocr_ready or not wait_for_ocr or not ocr["available"]:
+                    break
+                time.sleep(0.1)
+        finally:
+            proc.terminate()
+            proc.wait()
+
+    return first, ocr_ready
+
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    have_ocr = importlib.util.find_spec("easyocr") is not None
+
+    for name, (code, env) in MODES.items():
+        if name != "ohne OCR" and not have_ocr:
+            print(f"{name:12s} übersprungen (easyocr nicht installiert)")
+            continue
+
+        runs = [start_once(code, env) for _ in range(repeats)]
+        first = statistics.median(r[0] for r in runs)
+        ready = [r[1] for r in runs if r[1] is not None]
+
+        line = f"{name:12s} erster Request {first:6.2f} s"
+        if ready:
+            line += f"   OCR bereit {statistics.median(ready):6.2f} s"
+        print(line)
@@ -0,0 +1,29 @@
+"""
+Benchmark: Logistik-Kacheln.
+
+Misst die bisherige Schleife aus logistik_overview (Masken pro Auftrag,
+is_done pro Auftrag) gegen build_logistik_tiles (ein groupby-Pass).
+Die Parität prüft tests/test_tiles.py.
+
+    python -m benchmarks.bench_tiles [ITEMS]
+"""
+import sys
+
+from backend.utils.tiles import build_logistik_tiles
+from benchmarks.common import make_items_frame, Timer
+from tests.legacy_tiles import legacy_tiles
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    df = make_items_frame(n, rows_per_order=40)
+
+    with Timer() as t_old:
+        old = legacy_tiles(df)
+
+    with Timer() as t_new:
+        new = build_logistik_tiles(df)
+
+    print(f"{n} Items, {len(new)} Kacheln")
+    print(f"vorher   {t_old.seconds:8.3f} s")
+    print(f"groupby  {t_new.seconds:8.3f} s   (Faktor {t_old.seconds / t_new.seconds:.0f}x)")
@@ -0,0 +1,100 @@
+"""
+Benchmark: Zeilen/Sekunde beim Excel-Import.
+
+Vergleicht die bisherige Zeilen-Schleife (2 SELECTs + flush pro Zeile)
+mit dem mengenbasierten Bulk-Import aus backend.services.bulk_import.
+
+    python -m benchmarks.bench_upload [ZEILEN]
+"""
+import os
+import sys
+
+from backend.database import Item
+from backend.services.bulk_import import import_dataframe, norm
+from benchmarks.common import temp_session_factory, make_upload_frame, Timer
+
+
+def legacy_import(db, df):
+    """Bisherige Implementierung aus upload_excel (nur die Schleife)."""
+    errors = []
+    warnings = []
+
+    for _, row in df.iterrows():
+        prod_id = norm(row.get("prod_id"))
+        kuerzel = norm(row.get("kuerzel"))
+        start_bft = norm(row.get("start_bft"))
+        artikel_nr = norm(row.get("artikel_nr"))
+        bew_artikel = norm(row.get("bew_artikel"))
+        start_bew = norm(row.get("start_bew"))
+        durchmesser = norm(row.get("durchmesser"))
+        laenge = norm(row.get("laenge"))
+        biegung = norm(row.get("biegung"))
+        menge = norm(row.get("menge"))
+
+        merge_key = (
+            f"{prod_id}|{kuerzel}|{artikel_nr}|{start_bew}|"
+            f"{durchmesser}|{laenge}|{biegung}|{menge}"
+        )
+
+        existing_items_same_prod = db.query(Item).filter(Item.prod_id == prod_id).all()
+        if existing_items_same_prod:
+            if all(i.verschoben for i in existing_items_same_prod):
+                for old in existing_items_same_prod:
+                    old.verschoben = False
+                    old.reaktiviert = True
+                db.commit()
+                warnings.append({"prod_id": prod_id, "kuerzel": kuerzel})
+
+        if db.query(Item).filter(Item.merge_key == merge_key).first():
+            errors.append({"prod_id": prod_id, "kuerzel": kuerzel})
+            continue
+
+        item = Item()
+        db.add(item)
+        db.flush()
+
+        item.merge_key = merge_key
+        item.fertig = False
+        item.kommissioniert = False
+        item.ausgeliefert = False
+        item.kuerzel = kuerzel
+        item.prod_id = prod_id
+        item.artikel_nr = artikel_nr
+        item.artikel_clean = bew_artikel
+        item.durchmesser = float(row.get("durchmesser", 0) or 0)
+        item.laenge = float(row.get("laenge", 0) or 0)
+        item.biegung = biegung
+        item.bedarfs_menge_pos = float(row.get("bedarfs_menge_pos", 0) or 0)
+        item.menge = float(row.get("menge", 0) or 0)
+        item.beschaffung = norm(row.get("beschaffung"))
+        item.referenz = norm(row.get("referenz"))
+        item.start_bft = start_bft
+        item.start_bew = start_bew
+
+    return errors, warnings
+
+
+def run(label, fn, df):
+    Session, path = temp_session_factory()
+    db = Session()
+
+    with Timer() as t:
+        fn(db, df)
+        db.commit()
+
+    count = db.query(Item).count()
+    db.close()
+    os.remove(path)
+
+    print(f"{label:<10} {len(df):>7} Zeilen  {t.seconds:8.2f} s  {len(df) / t.seconds:10.0f} Zeilen/s")
+    return count
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    df = make_upload_frame(n)
+
+    before = run("vorher", legacy_import, df)
+    after = run("bulk", import_dataframe, df)
+
+    assert before == after, f"Unterschiedliche Anzahl Items: {before} != {after}"
@@ -0,0 +1,99 @@
+"""
+Benchmark: Parse-Zeit derselben Daten als xlsx, CSV und Parquet.
+
+Erzeugt ZEILEN Positionen mit den Spaltenköpfen des ERP-Exports und
+schreibt sie in alle drei Formate (CSV wie aus deutschem Excel: ";" und
+Dezimalkomma). Gemessen wird Datei → DataFrame (read_upload) und danach
+prepare_dataframe; die vorbereiteten Daten müssen in allen Formaten gleich
+sein. CSV wird mit pyarrow und mit dem C-Parser gemessen.
+
+    python -m benchmarks.bench_upload_formats [ZEILEN]
+"""
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+from backend.services import upload_formats
+from backend.services.bulk_import import norm
+from backend.services.upload_formats import detect_format, read_upload
+from backend.utils.dataframe import prepare_dataframe, NUMERIC_FIELDS
+from benchmarks.bench_excel_stream import write_xlsx
+from benchmarks.common import Timer
+from tests.upload_data import EXCEL_HEADERS, make_upload_frame
+
+# Vergleich wie beim Import: Text über norm(), Zahlen als float
+TEXT_FIELDS = ["kuerzel", "prod_id", "artikel_nr", "artikel_clean", "biegung",
+               "beschaffung", "referenz", "start_bft", "start_bew"]
+
+
+def write_files(tmp: str, n: int) -> dict:
+    paths = {
+        "xlsx": os.path.join(tmp, "upload.xlsx"),
+        "csv": os.path.join(tmp, "upload.csv"),
+        "parquet": os.path.join(tmp, "upload.parquet"),
+    }
+    write_xlsx(paths["xlsx"], n)
+
+    df = make_upload_frame(n).rename(columns=EXCEL_HEADERS)
+    df.to_csv(paths["csv"], sep=";", decimal=",", index=False, encoding="utf-8-sig")
+    try:
+        df.to_parquet(paths["parquet"], index=False)
+    except ImportError:
+        print("Parquet übersprungen: pyarrow ist nicht installiert")
+        del paths["parquet"]
+
+    return paths
+
+
+def comparable(df: pd.DataFrame) -> pd.DataFrame:
+    out = pd.DataFrame({c: df[c].map(norm).astype(object) for c in TEXT_FIELDS})
+    for c in NUMERIC_FIELDS:
+        out[c] = df[c].astype(float).to_numpy()
+    return out.reset_index(drop=True)
+
+
+def measure(content: bytes, fmt: str):
+    with Timer() as t_read:
+        df = read_upload(content, fmt)
+    with Timer() as t_prep:
+        df = prepare_dataframe(df)
+    return df, t_read.seconds, t_prep.seconds
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_files(tmp, n)
+        files = {}
+        for fmt, path in paths.items():
+            with open(path, "rb") as f:
+                files[fmt] = f.read()
+
+    print(f"{n} Zeilen")
+
+    # CSV zusätzlich mit dem C-Parser (Fallback ohne pyarrow)
+    engines = {"csv": [upload_formats._csv_engine()]}
+    if engines["csv"] == ["pyarrow"]:
+        engines["csv"].append("c")
+
+    results = {}
+    for fmt, content in files.items():
+        assert detect_format(content, os.path.basename(paths[fmt])) == fmt
+
+        for engine in engines.get(fmt, [None]):
+            label = f"{fmt} ({engine})" if engine else fmt
+            if engine:
+                upload_formats._csv_engine = lambda e=engine: e
+
+            df, t_read, t_prep = measure(content, fmt)
+            results[label] = comparable(df)
+            print(f"{label:<14} {len(content) / 2**20:6.1f} MB  lesen {t_read * 1000:8.0f} ms  "
+                  f"vorbereiten {t_prep * 1000:6.0f} ms  {len(df):>7} Zeilen")
+
+    reference = results.pop("xlsx")
+    for label, df in results.items():
+        pd.testing.assert_frame_equal(df, reference, obj=label)
+    print("Vorbereitete Daten in allen Formaten identisch")
@@ -0,0 +1,164 @@
+"""
+Gemeinsame Hilfen für die Benchmarks.
+
+Aufruf immer aus dem Projektverzeichnis, z.B.:
+    python -m benchmarks.bench_upload
+"""
+import os
+import random
+import tempfile
+import time
+
+import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.database_base import Base
+import backend.database  # noqa: F401  (Tabellen registrieren)
+
+# Synthetische Upload-Daten liegen bei den Tests (eine Quelle für beide)
+from tests.upload_data import make_upload_frame  # noqa: F401
+
+
+# ---------------------------------------------------------
+# Temporäre Datenbank
+# ---------------------------------------------------------
+def temp_session_factory():
+    """Legt eine leere SQLite-DB im Temp-Verzeichnis an."""
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=engine)
+
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine), path
+
+
+# ---------------------------------------------------------
+# Synthetische Items-Tabelle (wie load_df() sie liefert)
+# ---------------------------------------------------------
+def make_items_frame(n_rows: int, rows_per_order: int = 12, seed: int = 1) -> pd.DataFrame:
+    """Items mit gemischtem Status: offen, teil-/voll kommissioniert, ausgeliefert, Parkzone."""
+    from backend.services.bulk_import import build_records
+
+    rnd = random.Random(seed)
+    df = build_records(make_upload_frame(n_rows, rows_per_order, seed))
+    df.insert(0, "id", range(1, len(df) + 1))
+
+    order_no = df["prod_id"].astype(int) - 100000
+    order_state = {o: rnd.random() for o in order_no.unique()}
+    state = order_no.map(order_state)
+
+    pick = [rnd.random() for _ in range(len(df))]
+    df["kommissioniert"] = (state > 0.75) | ((state > 0.4) & (pd.Series(pick) < 0.5))
+    df["ausgeliefert"] = state > 0.9
+    df["fertig"] = False
+    df["verschoben"] = (state > 0.35) & (state < 0.4)
+    df["reaktiviert"] = (state > 0.3) & (state < 0.35)
+    df["ziel_lagerort"] = df["ausgeliefert"].map({True: "Halle 2", False: ""})
+    df["ausgebucht"] = False
+    df["ausgebucht_am"] = ""
+
+    return df
+
+
+# ---------------------------------------------------------
+# Synthetisches Etikett (für die OCR-Benchmarks, braucht cv2)
+# ---------------------------------------------------------
+LABEL_FIELDS = {
+    "kuerzel": "HBK24A",
+    "stueckzahl": "12",
+    "durchmesser": "12",
+    "laenge": "1250",
+    "artikelnummer": "B500B-12345678",
+}
+
+# So steht der Wert auf dem Etikett
+LABEL_TEXT = {
+    "kuerzel": "{}",
+    "stueckzahl": "{} St",
+    "durchmesser": "4/{}",
+    "laenge": "L: {}",
+    "artikelnummer": "{}",
+}
+
+TEMPLATES_PATH = "backend/data/ocr_templates.json"
+
+
+def random_label_fields(rnd: random.Random) -> dict:
+    letters = "ABCDEFGHJKLMNPRSTUVWXYZ"
+    return {
+        "kuerzel": "".join(rnd.choice(letters) for _ in range(3)) + f"{rnd.randint(10, 99)}A",
+        "stueckzahl": str(rnd.randint(1, 80)),
+        "durchmesser": str(rnd.choice([8, 10, 12, 14, 16, 20, 25])),
+        "laenge": str(rnd.randint(50, 1200)),
+        "artikelnummer": f"B500B-{rnd.randint(10000000, 99999999)}",
+    }
+
+
+def code_payload(fields: dict = None) -> str:
+    """Inhalt des QR-Codes auf dem Etikett ("schluessel=wert;…")."""
+    f = {**LABEL_FIELDS, **(fields or {})}
+    return ";".join(f"{k}={v}" for k, v in f.items())
+
+
+def make_label_image(fields: dict = None, width: int = 1600, height: int = 1200,
+                     template: str = "standard", qr: str = None, fmt: str = ".png") -> bytes:
+    """
+    Weißes Etikett mit Rahmen auf grauem Hintergrund, als PNG- (oder fmt-) Bytes.
+    Die Felder stehen in den Bereichen der Etikett-Vorlage, optional
+    mit QR-Code (Inhalt qr) rechts neben Stückzahl/Durchmesser.
+    """
+    import json
+
+    import cv2
+    import numpy as np
+
+    f = {**LABEL_FIELDS, **(fields or {})}
+
+    with open(TEMPLATES_PATH, "r", encoding="utf-8") as fh:
+        layout = json.load(fh)[template]["fields"]
+
+    img = np.full((height, width), 90, dtype=np.uint8)
+    x0, y0, x1, y1 = width // 8, height // 6, width * 7 // 8, height * 5 // 6
+    cv2.rectangle(img, (x0, y0), (x1, y1), 255, -1)
+    cv2.rectangle(img, (x0, y0), (x1, y1), 0, 4)
+
+    lw, lh = x1 - x0, y1 - y0
+    font = cv2.FONT_HERSHEY_SIMPLEX
+
+    def put(text, bx, by, bw, bh):
+        # Schrift so groß, dass sie ~60 % der Feldhöhe füllt und in die Breite passt
+        (tw, th), _ = cv2.getTextSize(text, font, 1.0, 3)
+        scale = min(0.6 * bh * lh / th, 0.95 * bw * lw / tw)
+        org = (int(x0 + bx * lw), int(y0 + (by + bh * 0.8) * lh))
+        cv2.putText(img, text, org, font, scale, 0, max(2, int(scale * 2)))
+
+    # Fester Text vor dem Kürzel (Volltext-Regex erwartet "/ KUERZEL")
+    kx, ky, _, kh = layout["kuerzel"]["box"]
+    put("Pos 3 /", 0.04, ky, kx - 0.08, kh)
+
+    for name, field in layout.items():
+        put(LABEL_TEXT[name].format(f[name]), *field["box"])
+
+    if qr:
+        code = cv2.QRCodeEncoder.create().encode(qr)
+        size = int(0.34 * lh)
+        code = cv2.resize(code, (size, size), interpolation=cv2.INTER_NEAREST)
+        qx, qy = int(x0 + 0.74 * lw), int(y0 + 0.27 * lh)
+        img[qy:qy + size, qx:qx + size] = code
+
+    ok, encoded = cv2.imencode(fmt, img)
+    return encoded.tobytes()
+
+
+class Timer:
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.seconds = time.perf_counter() - self.start
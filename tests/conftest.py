@@ -0,0 +1,46 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.database_base import Base
+import backend.database  # noqa: F401  (Tabellen registrieren)
+
+
+# ---------------------------------------------------------
+# Leere SQLite-DB pro Test (im Temp-Verzeichnis von pytest)
+# ---------------------------------------------------------
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+# ---------------------------------------------------------
+# Import-Jobs gegen die Test-DB (ohne Live-Updates / OCR-Index)
+# ---------------------------------------------------------
+@pytest.fixture
+def run_job(monkeypatch, session_factory):
+    from backend.services import import_jobs
+
+    monkeypatch.setattr(import_jobs, "SessionLocal", session_factory)
+    for name in ("bump_data_version", "publish_reload", "after_commit", "update_match_index"):
+        monkeypatch.setattr(import_jobs, name, lambda *args: None)
+
+    def run(content: bytes, mode: str = "voll", fmt: str = "csv") -> dict:
+        job = import_jobs._new_job(f"auftraege.{fmt}", mode, fmt)
+        import_jobs._run_job(job, content)
+        return job
+
+    return run
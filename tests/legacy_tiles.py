@@ -0,0 +1,81 @@
+"""
+Eingefrorene Referenz: Kachel-Schleife aus logistik_overview vor der
+Umstellung auf order_status. Wird von tests/test_tiles.py und
+benchmarks/bench_tiles.py verglichen – nicht mehr ändern.
+"""
+import pandas as pd
+
+
+def legacy_is_done(df_all_items, kuerzel, prod_id, start_bft):
+    """is_done() wie bisher, nur auf dem DataFrame statt per SessionLocal."""
+    items = df_all_items[
+        (df_all_items["kuerzel"] == kuerzel)
+        & (df_all_items["prod_id"] == prod_id)
+        & (df_all_items["start_bft"] == start_bft)
+    ]
+    if items.empty:
+        return False
+
+    log_items = items[
+        ~((items["beschaffung"] == "Produktion") & (items["referenz"] == "Produktion"))
+    ]
+    if log_items.empty:
+        return False
+
+    return bool(log_items["ausgeliefert"].all())
+
+
+def legacy_tiles(df_all_items: pd.DataFrame) -> list:
+    """Bisherige Kachel-Schleife aus logistik_overview."""
+    df = df_all_items[df_all_items["verschoben"] != True]
+    tiles = []
+
+    for (kuerzel, prod_id, start_bft) in sorted(
+        df.groupby(["kuerzel", "prod_id", "start_bft"]).groups.keys(),
+        key=lambda x: (x[0], x[1], x[2]),
+    ):
+        df_all = df[(df["kuerzel"] == kuerzel) & (df["prod_id"] == prod_id)]
+        reaktiviert = bool(df_all["reaktiviert"].any())
+
+        if legacy_is_done(df_all_items, kuerzel, prod_id, start_bft):
+            continue
+
+        df_k = df[
+            (df["kuerzel"] == kuerzel)
+            & (df["prod_id"] == prod_id)
+            & (df["start_bft"] == start_bft)
+            & ~((df["beschaffung"] == "Produktion") & (df["referenz"] == "Produktion"))
+        ]
+        if df_k.empty:
+            continue
+
+        kommi_alle = bool(df_k["kommissioniert"].all())
+        kommi_einige = bool(df_k["kommissioniert"].any())
+
+        if not kommi_einige:
+            status, icon = "grau", "⏳"
+        elif not kommi_alle:
+            status, icon = "gelb", "🛠"
+        else:
+            status, icon = "hellgruen", "✅"
+
+        tiles.append({
+            "kuerzel": kuerzel,
+            "prod_id": prod_id,
+            "status": status,
+            "icon": icon,
+            "fehlteile": bool((df_k["referenz"] == "Bestellung").any()),
+            "kritische_fehlteile": False,
+            "total": df_k["merge_key"].nunique(),
+            "done": df_k.groupby("merge_key")["kommissioniert"].all().sum(),
+            "produktion_fertig": True,
+            "start_bft": start_bft,
+            "reaktiviert": reaktiviert,
+            "verschoben": False,
+            "artikel_nr": df_k.iloc[0]["artikel_nr"],
+        })
+
+    return sorted(
+        tiles,
+        key=lambda t: (0 if t["reaktiviert"] else 1, t["kuerzel"], t["prod_id"], t["start_bft"]),
+    )
@@ -0,0 +1,35 @@
+"""
+Delta-Import auf einer älteren DB mit doppelten merge_keys (vor dem
+eindeutigen Index angelegt, siehe ensure_indexes).
+"""
+from sqlalchemy import text
+
+from backend.database import Item
+from backend.services.bulk_import import build_records, import_dataframe, import_delta
+from tests.upload_data import make_upload_frame
+
+
+def test_delta_with_duplicate_merge_keys_in_db(db):
+    df = make_upload_frame(3)
+    import_dataframe(db, df.copy())
+
+    # Alter Bestand: erste Zeile doppelt, ohne eindeutigen Index
+    db.execute(text("DROP INDEX ix_items_merge_key"))
+    first = build_records(df.head(1)).to_dict(orient="records")[0]
+    db.execute(Item.__table__.insert(), [first])
+    db.commit()
+
+    changed = df.copy()
+    changed.loc[0, "referenz"] = "Umdisponiert"
+
+    errors, warnings, diff, prod_ids = import_delta(db, changed)
+    db.commit()
+
+    assert errors == []
+    assert diff["geaendert"] == 1
+    assert diff["unveraendert"] == 2
+    assert diff["neu"] == 0
+
+    # Aktualisiert wird das Item mit der kleinsten id
+    items = db.query(Item).filter(Item.merge_key == first["merge_key"]).order_by(Item.id).all()
+    assert [i.referenz for i in items] == ["Umdisponiert", first["referenz"]]
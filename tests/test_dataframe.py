@@ -0,0 +1,106 @@
+"""
+prepare_dataframe / column_plan: Sonderfälle der Kopfzeile und der Werte,
+jeweils auch gegen die bisherige Implementierung (legacy_prepare_dataframe).
+"""
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.utils.dataframe import column_plan, prepare_dataframe
+from tests.legacy_prepare import assert_same, legacy_prepare_dataframe
+
+
+def _prepare(sheet: pd.DataFrame) -> pd.DataFrame:
+    new = prepare_dataframe(sheet.copy())
+    assert_same(new, legacy_prepare_dataframe(sheet.copy()))
+    return new
+
+
+def test_alias_collisions_later_column_wins():
+    sheet = pd.DataFrame({
+        "Kürzel": ["K1", "K2"],
+        "ProdID BFT": ["bft-1", "bft-2"],
+        "ProdID": ["p-1", "p-2"],
+        "Länge BFT": [100, 200],
+        "Länge": [1, 2],
+        "Bew.-Artikel BFT": ["a", "b"],
+        "Bew.-Art": ["x", "y"],
+    })
+
+    df = _prepare(sheet)
+
+    assert df["prod_id"].tolist() == ["p-1", "p-2"]
+    assert df["laenge"].tolist() == [100.0, 200.0]
+    assert df["artikel_clean"].tolist() == ["a", "b"]
+
+
+def test_column_plan_resolves_chains():
+    columns, kuerzel, targets = column_plan(("KZ", "Kürzel", "ProdID BFT", "ProdID", "Länge BFT", "Länge"))
+
+    assert columns == ["kz", "kuerzel", "prodid_bft", "prodid", "laenge_bft", "laenge"]
+    assert kuerzel == "kuerzel"
+    assert targets["prod_id"] == "prodid"
+    assert targets["laenge"] == "laenge_bft"
+
+
+def test_non_string_headers_are_ignored():
+    sheet = pd.DataFrame([["K1", "100", 7, "x"]], columns=["Kürzel", "ProdID", 2026, None])
+
+    df = _prepare(sheet)
+
+    assert df["prod_id"].tolist() == ["100"]
+    columns, _, targets = column_plan(("Kürzel", 2026, datetime.datetime(2026, 3, 2)))
+    assert columns[0] == "kuerzel"
+    assert all(pd.isna(c) for c in columns[1:])
+    assert targets == {}
+
+
+def test_mixed_start_bft():
+    sheet = pd.DataFrame({
+        "Kürzel": ["K1"] * 6,
+        "Start BFT": [
+            datetime.datetime(2026, 3, 2, 6, 30),
+            pd.Timestamp("2026-03-03"),
+            "KW12",
+            np.nan,
+            None,
+            "2026-03-02",
+        ],
+    })
+
+    df = _prepare(sheet)
+
+    assert df["start_bft"].astype(str).tolist() == [
+        "2026-03-02", "2026-03-03", "KW12", "", "", "2026-03-02",
+    ]
+    assert df["start_bew"].astype(str).tolist() == [""] * 6
+
+
+def test_datetime_start_bft_with_gaps():
+    sheet = pd.DataFrame({
+        "Kürzel": ["K1", "K2"],
+        "Start BFT": pd.to_datetime(["2026-03-02", None]),
+    })
+
+    df = _prepare(sheet)
+
+    assert df["start_bft"].astype(str).tolist() == ["2026-03-02", ""]
+
+
+def test_empty_and_nan_kuerzel_are_dropped():
+    sheet = pd.DataFrame({
+        "Kürzel": [" K1 ", "", "  ", np.nan, None, "nan", "NaN", "K2"],
+        "ProdID": [str(i) for i in range(8)],
+    })
+
+    df = _prepare(sheet)
+
+    assert df["kuerzel"].astype(str).tolist() == ["K1", "K2"]
+    assert df["prod_id"].tolist() == ["0", "7"]
+
+
+def test_missing_kuerzel_column():
+    with pytest.raises(ValueError):
+        prepare_dataframe(pd.DataFrame({"ProdID": ["1"]}))
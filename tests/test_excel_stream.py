@@ -0,0 +1,76 @@
+"""
+Streaming-Import: iter_excel_chunks muss dieselben Werte (und damit dieselben
+merge_keys) liefern wie pd.read_excel – unabhängig von der Teilstückgröße.
+"""
+import datetime
+import io
+
+import pandas as pd
+import pytest
+
+from backend.services.bulk_import import build_records
+from backend.services.excel_stream import iter_excel_chunks
+from backend.utils.dataframe import prepare_dataframe
+
+
+def _xlsx(rows: list) -> bytes:
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    for row in rows:
+        ws.append(row)
+    output = io.BytesIO()
+    wb.save(output)
+    return output.getvalue()
+
+
+HEADER = ["Kürzel", "ProdID BFT", "Artikel-Nr. BFT", "Länge", "Menge", "Start BFT"]
+
+SHEETS = {
+    "leere ProdID": [
+        HEADER,
+        ["K1", 100000, "A-1", 100, 2, datetime.datetime(2026, 3, 2)],
+        ["K1", None, "A-2", 200, 3, datetime.datetime(2026, 3, 2)],
+        ["K2", 100001, "A-3", 300, 4, "KW12"],
+    ],
+    "leere Zeile, Nachkommastellen, gemischte Spalte": [
+        HEADER,
+        ["K1", 100000, 4711, 100, 2.5, datetime.datetime(2026, 3, 2)],
+        [None] * 6,
+        ["K2", 100001, "A-3", 300, 4, None],
+        ["K3", 100002, None, 400, 1, "KW12"],
+        [None] * 6,
+    ],
+    "ohne Lücken": [
+        HEADER,
+        ["K1", 100000, 4711, 100, 2, "KW11"],
+        ["K2", 100001, 4712, 300, 4, "KW12"],
+    ],
+}
+
+
+def _keys(df: pd.DataFrame) -> pd.DataFrame:
+    return build_records(prepare_dataframe(df))[["prod_id", "artikel_nr", "start_bft", "merge_key"]]
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 2, 1000])
+@pytest.mark.parametrize("name", SHEETS)
+def test_chunks_match_read_excel(name, chunk_rows):
+    content = _xlsx(SHEETS[name])
+
+    expected = _keys(pd.read_excel(io.BytesIO(content)))
+    streamed = pd.concat(
+        [_keys(chunk) for chunk in iter_excel_chunks(content, chunk_rows)],
+        ignore_index=True,
+    )
+
+    pd.testing.assert_frame_equal(streamed, expected.reset_index(drop=True))
+
+
+def test_blank_prod_id_keeps_pandas_text():
+    content = _xlsx(SHEETS["leere ProdID"])
+
+    streamed = pd.concat([_keys(c) for c in iter_excel_chunks(content, 1)], ignore_index=True)
+
+    assert streamed["prod_id"].tolist() == ["100000.0", "", "100001.0"]
@@ -0,0 +1,86 @@
+"""
+Import-Fingerabdruck: Zeilen aus dem letzten Import werden nicht erneut
+verglichen, Parkzone und Auftragsstatus gelten aber für die ganze Datei.
+"""
+import pandas as pd
+import pytest
+
+from backend.database import Item, CompletedToday
+from tests.upload_data import EXCEL_HEADERS, make_upload_frame
+
+REACTIVATED = "Auftrag wurde automatisch aus der Parkzone reaktiviert."
+
+PARKED = "100001"
+DELIVERED = "100002"
+
+
+@pytest.fixture
+def upload(run_job):
+    def run(df: pd.DataFrame, mode: str) -> dict:
+        content = df.rename(columns=EXCEL_HEADERS).to_csv(sep=";", decimal=",", index=False).encode()
+        job = run_job(content, mode)
+        assert job["status"] == "fertig", job["message"]
+        return job
+
+    return run
+
+
+def _items(db, prod_id):
+    db.expire_all()
+    return db.query(Item).filter(Item.prod_id == prod_id).all()
+
+
+@pytest.mark.parametrize("mode", ["voll", "delta"])
+def test_known_rows_still_reactivate_parked_orders(upload, db, mode):
+    base = make_upload_frame(48)
+    upload(base, "voll")
+
+    # Auftrag komplett in die Parkzone, ein anderer ausgeliefert
+    db.query(Item).filter(Item.prod_id == PARKED).update({"verschoben": True})
+    db.query(Item).filter(Item.prod_id == DELIVERED).update({"ausgeliefert": True})
+    db.commit()
+
+    # Fast gleiche Datei: eine Zeile mehr → anderer Inhalt, Rest bekannt
+    extra = make_upload_frame(1, seed=7).assign(prod_id="900000")
+    job = upload(pd.concat([base, extra], ignore_index=True), mode)
+
+    assert job["bekannt"] == len(base)
+
+    warnings = job["result"]["warnings"]
+    assert [w["prod_id"] for w in warnings if w["reason"] == REACTIVATED] == [PARKED]
+
+    parked = _items(db, PARKED)
+    assert parked and all(not i.verschoben and i.reaktiviert for i in parked)
+
+    # Bekannte Zeilen sind keine Fehler und werden nicht doppelt angelegt
+    assert job["result"]["errors"] == []
+    assert len(_items(db, "900000")) == 1
+    assert db.query(Item).count() == len(base) + 1
+
+    if mode == "voll":
+        # Ausgelieferte wurden gelöscht → aus der Datei wieder angelegt
+        assert len(_items(db, DELIVERED)) == 12
+    else:
+        assert job["diff"]["neu"] == 1
+        assert job["diff"]["unveraendert"] == len(base)
+        assert job["diff"]["nicht_in_datei"] == 0
+        assert job["diff"]["reaktiviert"] == 1
+
+
+def test_same_file_in_other_mode_is_imported(upload, db):
+    base = make_upload_frame(48)
+    upload(base, "delta")
+
+    db.query(Item).filter(Item.prod_id == DELIVERED).update({"ausgeliefert": True})
+    db.add(CompletedToday(kuerzel="K9", prod_id="900", start_bft="2026-03-02"))
+    db.commit()
+
+    assert upload(base, "delta")["message"] == "bereits importiert"
+
+    job = upload(base, "voll")
+
+    assert job["message"] != "bereits importiert"
+    db.expire_all()
+    assert db.query(CompletedToday).count() == 0
+    delivered = _items(db, DELIVERED)
+    assert len(delivered) == 12 and not any(i.ausgeliefert for i in delivered)
@@ -0,0 +1,66 @@
+"""
+Voll-Import: Dashboard leeren und Import sind EINE Transaktion – eine
+kaputte Datei (auch beim Streaming-Import) lässt den Bestand unverändert.
+"""
+import io
+
+import pytest
+
+from backend.database import Item, CompletedToday
+from backend.services import excel_stream, import_jobs
+from tests.upload_data import EXCEL_HEADERS, make_upload_frame
+
+
+def _xlsx(df) -> bytes:
+    output = io.BytesIO()
+    df.to_excel(output, index=False)
+    return output.getvalue()
+
+
+@pytest.fixture
+def seeded(db):
+    db.add(CompletedToday(kuerzel="K9", prod_id="900", start_bft="2026-03-02"))
+    db.add(Item(kuerzel="K9", prod_id="900", start_bft="2026-03-02", merge_key="900-a",
+                kommissioniert=True, ausgeliefert=True))
+    db.commit()
+    return db
+
+
+@pytest.fixture
+def streaming(monkeypatch):
+    monkeypatch.setattr(excel_stream, "IMPORT_STREAMING", "1")
+    monkeypatch.setattr(excel_stream, "IMPORT_CHUNK_ROWS", 5)
+
+
+def _unchanged(db):
+    db.expire_all()
+    assert db.query(CompletedToday).count() == 1
+    assert [i.merge_key for i in db.query(Item)] == ["900-a"]
+
+
+def test_missing_kuerzel_column_clears_nothing(run_job, seeded, streaming):
+    sheet = make_upload_frame(12).drop(columns="kuerzel").rename(columns=EXCEL_HEADERS)
+
+    with pytest.raises(ValueError, match="Kürzel"):
+        run_job(_xlsx(sheet), fmt="xlsx")
+
+    _unchanged(seeded)
+
+
+def test_failing_chunk_rolls_back_clear(run_job, seeded, streaming, monkeypatch):
+    import_dataframe = import_jobs.import_dataframe
+    calls = []
+
+    def fail_on_second_chunk(db, df, **kwargs):
+        calls.append(len(df))
+        if len(calls) == 2:
+            raise RuntimeError("Teilstück kaputt")
+        return import_dataframe(db, df, **kwargs)
+
+    monkeypatch.setattr(import_jobs, "import_dataframe", fail_on_second_chunk)
+
+    with pytest.raises(RuntimeError):
+        run_job(_xlsx(make_upload_frame(12).rename(columns=EXCEL_HEADERS)), fmt="xlsx")
+
+    assert calls == [5, 5]
+    _unchanged(seeded)
@@ -0,0 +1,71 @@
+"""
+Formular-Routen der Logistik: gleicher Ablauf wie der Scanner
+(apply_* → finish → Commit → after_commit).
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.database import Item, CompletedToday, OrderStatus
+from backend.logic.order_status import rebuild_all
+from backend.routes import logistik
+
+
+@pytest.fixture
+def client(monkeypatch, session_factory, db):
+    db.add_all([
+        Item(kuerzel="K1", prod_id="100", start_bft="2026-03-02", merge_key="100-a",
+             beschaffung="Lager", referenz="Bestellung"),
+        Item(kuerzel="K1", prod_id="100", start_bft="2026-03-02", merge_key="100-b",
+             beschaffung="Lager", referenz="Am Lager"),
+    ])
+    db.flush()
+    rebuild_all(db)
+    db.commit()
+
+    calls = []
+    monkeypatch.setattr(logistik, "SessionLocal", session_factory)
+    monkeypatch.setattr(logistik, "after_commit", lambda prod_ids: calls.append(set(prod_ids)))
+
+    app = FastAPI()
+    app.include_router(logistik.router)
+    test_client = TestClient(app, follow_redirects=False)
+    test_client.after_commit_calls = calls
+    return test_client
+
+
+def _order(db):
+    db.expire_all()
+    return db.query(OrderStatus).filter(OrderStatus.prod_id == "100").one()
+
+
+FORM = {"kuerzel": "K1", "prod_id": "100", "start_bft": "2026-03-02"}
+
+
+def test_fehlteil_erledigt_updates_order(client, db):
+    assert _order(db).fehlteile
+
+    r = client.post("/logistik/fehlteil_erledigt", data={**FORM, "row_keys": ["100-a"]})
+
+    assert r.status_code == 303
+    assert not _order(db).fehlteile
+    assert client.after_commit_calls == [{"100"}]
+
+
+def test_ausliefern_completes_order(client, db):
+    client.post("/logistik/kommissioniert", data={**FORM, "row_keys": ["100-a", "100-b"]})
+    client.post("/logistik/ausliefern", data={**FORM, "row_keys": ["100-a", "100-b"], "ziellager": "Halle 2"})
+
+    assert _order(db).alle_ausgeliefert
+    assert [c.prod_id for c in db.query(CompletedToday)] == ["100"]
+    assert client.after_commit_calls == [{"100"}, {"100"}]
+
+
+def test_verschieben_and_reaktivieren(client, db):
+    client.post("/logistik/verschieben", data=FORM)
+    assert _order(db).verschoben
+
+    client.post("/parkzone/reaktivieren", data=FORM)
+    order = _order(db)
+    assert not order.verschoben and order.reaktiviert
+    assert client.after_commit_calls == [{"100"}, {"100"}]
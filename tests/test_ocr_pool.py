@@ -0,0 +1,110 @@
+"""
+OCR-Pool: ein hängender Scan darf die Scans anderer Nutzer nicht abbrechen.
+Statt ocr_engine läuft in den Pool-Prozessen _job (kein easyocr nötig).
+"""
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+
+import pytest
+
+from backend.services import ocr_pool
+
+
+def _job(name, seconds=0):
+    time.sleep(seconds)
+    return name
+
+
+def _new_pool():
+    return ProcessPoolExecutor(
+        max_workers=ocr_pool.OCR_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(ocr_pool, "_call", _job)
+    monkeypatch.setattr(ocr_pool, "_new_pool", _new_pool)
+    monkeypatch.setattr(ocr_pool, "OCR_WORKERS", 2)
+    monkeypatch.setattr(ocr_pool, "OCR_QUEUE_SIZE", 8)
+    monkeypatch.setattr(ocr_pool, "_state", "nicht geladen")
+    monkeypatch.setattr(ocr_pool, "_waiting", {})
+    monkeypatch.setattr(ocr_pool, "_stats", dict.fromkeys(ocr_pool._stats, 0))
+    yield
+    ocr_pool.shutdown_pool()
+
+
+def test_timeout_does_not_break_other_scans(pool):
+    async def scenario():
+        # Pool starten und warten, bis beide Prozesse laufen
+        await asyncio.gather(
+            ocr_pool.run_in_pool("ok", 0.5, timeout=30),
+            ocr_pool.run_in_pool("ok", 0.5, timeout=30),
+        )
+        old = ocr_pool._pool
+        processes = list(old._processes.values())
+
+        hung, other = await asyncio.gather(
+            ocr_pool.run_in_pool("haengt", 60, timeout=0.5),
+            ocr_pool.run_in_pool("anderer", 2, timeout=30),
+            return_exceptions=True,
+        )
+        return old, processes, hung, other
+
+    old, processes, hung, other = asyncio.run(scenario())
+
+    assert isinstance(hung, ocr_pool.OcrTimeout)
+    assert other == "anderer"
+
+    # Alter Pool ausgemustert und – nachdem niemand mehr wartet – beendet
+    assert ocr_pool._pool is not old
+    assert ocr_pool._stats["restarts"] == 1
+    for process in processes:
+        process.join(5)
+        assert not process.is_alive()
+
+    # Nächster Scan bekommt einen neuen Pool
+    assert asyncio.run(ocr_pool.run_in_pool("neu", timeout=30)) == "neu"
+
+
+def _warmup(pool, futures):
+    thread = threading.Thread(target=ocr_pool._watch_warmup, args=(pool, futures))
+    thread.start()
+    return thread
+
+
+def test_warmup_waits_for_every_worker(monkeypatch):
+    pool = object()
+    monkeypatch.setattr(ocr_pool, "_pool", pool)
+    monkeypatch.setattr(ocr_pool, "_state", "laedt")
+    monkeypatch.setattr(ocr_pool, "_state_detail", "")
+    futures = [Future(), Future()]
+
+    thread = _warmup(pool, futures)
+    futures[1].set_result(True)
+    time.sleep(0.1)
+    assert ocr_pool._state == "laedt"
+
+    futures[0].set_result(True)
+    thread.join(5)
+    assert ocr_pool._state == "bereit"
+
+
+def test_failed_warmup_in_any_worker_is_reported(monkeypatch):
+    pool = object()
+    monkeypatch.setattr(ocr_pool, "_pool", pool)
+    monkeypatch.setattr(ocr_pool, "_state", "laedt")
+    monkeypatch.setattr(ocr_pool, "_state_detail", "")
+    futures = [Future(), Future()]
+
+    # Prozess 0 lädt noch, Prozess 1 ist gescheitert
+    thread = _warmup(pool, futures)
+    futures[1].set_exception(RuntimeError("Modell kaputt"))
+    thread.join(5)
+
+    assert ocr_pool._state == "fehler"
+    assert ocr_pool._state_detail == "Modell kaputt"
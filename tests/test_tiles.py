@@ -0,0 +1,133 @@
+"""
+Parität: Logistik-Kacheln aus aggregate_orders / order_status vs. die
+bisherige Schleife pro Auftrag (tests/legacy_tiles.py).
+"""
+import pandas as pd
+
+from backend.database import Item, CompletedToday
+from backend.logic.order_status import rebuild_all, load_open_orders
+from backend.services.completion import complete_orders
+from backend.utils.tiles import build_logistik_tiles, logistik_tile, sort_logistik_tiles
+from tests.legacy_tiles import legacy_tiles
+
+
+def _item(kuerzel, prod_id, start_bft, merge_key, **fields):
+    item = {
+        "kuerzel": kuerzel,
+        "prod_id": prod_id,
+        "start_bft": start_bft,
+        "merge_key": merge_key,
+        "artikel_nr": f"ART-{merge_key}",
+        "beschaffung": "Lager",
+        "referenz": "Am Lager",
+        "bedarfs_menge_pos": 2.0,
+        "ziel_lagerort": "",
+        "fertig": False,
+        "kommissioniert": False,
+        "ausgeliefert": False,
+        "verschoben": False,
+        "reaktiviert": False,
+    }
+    item.update(fields)
+    return item
+
+
+PRODUKTION = {"beschaffung": "Produktion", "referenz": "Produktion"}
+GELIEFERT = {"kommissioniert": True, "ausgeliefert": True, "ziel_lagerort": "Halle 2"}
+
+ITEMS = [
+    # offen, zwei Bündel
+    _item("K1", "100", "2026-03-02", "100-a"),
+    _item("K1", "100", "2026-03-02", "100-b"),
+    # teilweise / komplett kommissioniert
+    _item("K1", "101", "2026-03-02", "101-a", kommissioniert=True),
+    _item("K1", "101", "2026-03-02", "101-b"),
+    _item("K1", "102", "2026-03-01", "102-a", kommissioniert=True),
+    # ganz in der Parkzone
+    _item("K2", "200", "2026-03-02", "200-a", verschoben=True),
+    _item("K2", "200", "2026-03-02", "200-b", verschoben=True),
+    # reaktiviert: gilt für alle Start-BFT von Kürzel + ProdID
+    _item("K2", "201", "2026-03-02", "201-a", reaktiviert=True),
+    _item("K2", "201", "2026-03-09", "201-b"),
+    # Fehlteil
+    _item("K3", "300", "2026-03-02", "300-a", referenz="Bestellung"),
+    _item("K3", "300", "2026-03-02", "300-b"),
+    # nur Produktion → keine Kachel
+    _item("K3", "301", "2026-03-02", "301-a", **PRODUKTION),
+    # Produktion + Logistik: Produktion zählt nicht mit
+    _item("K3", "302", "2026-03-02", "302-a", **PRODUKTION),
+    _item("K3", "302", "2026-03-02", "302-b", kommissioniert=True),
+    # komplett ausgeliefert → ausgeblendet
+    _item("K4", "400", "2026-03-02", "400-a", **GELIEFERT),
+    _item("K4", "400", "2026-03-02", "400-b", **PRODUKTION),
+    # teilweise verschoben: sichtbarer Teil ausgeliefert, verschobener nicht
+    _item("K4", "401", "2026-03-02", "401-a", **GELIEFERT),
+    _item("K4", "401", "2026-03-02", "401-b", verschoben=True),
+    # teilweise verschoben, sichtbarer Teil offen
+    _item("K4", "402", "2026-03-02", "402-a", kommissioniert=True),
+    _item("K4", "402", "2026-03-02", "402-b", verschoben=True, reaktiviert=True),
+]
+
+# Erwartete Kacheln (Kürzel, ProdID, Start-BFT)
+SHOWN = {
+    ("K1", "100", "2026-03-02"),
+    ("K1", "101", "2026-03-02"),
+    ("K1", "102", "2026-03-01"),
+    ("K2", "201", "2026-03-02"),
+    ("K2", "201", "2026-03-09"),
+    ("K3", "300", "2026-03-02"),
+    ("K3", "302", "2026-03-02"),
+    ("K4", "401", "2026-03-02"),
+    ("K4", "402", "2026-03-02"),
+}
+
+
+def _frame():
+    df = pd.DataFrame(ITEMS)
+    df.insert(0, "id", range(1, len(df) + 1))
+    return df
+
+
+def _keys(tiles):
+    return {(t["kuerzel"], t["prod_id"], t["start_bft"]) for t in tiles}
+
+
+def test_build_logistik_tiles_matches_legacy_loop():
+    df = _frame()
+
+    legacy = legacy_tiles(df)
+    tiles = build_logistik_tiles(df)
+
+    assert tiles == legacy
+    assert _keys(tiles) == SHOWN
+
+
+def test_flags_per_order():
+    tiles = {(t["prod_id"], t["start_bft"]): t for t in build_logistik_tiles(_frame())}
+
+    assert tiles[("201", "2026-03-09")]["reaktiviert"]
+    assert not tiles[("402", "2026-03-02")]["reaktiviert"]   # nur verschobenes Item reaktiviert
+    assert tiles[("300", "2026-03-02")]["fehlteile"]
+    assert tiles[("302", "2026-03-02")]["total"] == 1
+    assert tiles[("401", "2026-03-02")]["status"] == "hellgruen"
+
+
+def test_order_status_matches_legacy_loop(db):
+    db.execute(Item.__table__.insert(), ITEMS)
+    rebuild_all(db)
+    db.commit()
+
+    tiles = sort_logistik_tiles([logistik_tile(o) for o in load_open_orders(db)])
+
+    assert tiles == legacy_tiles(_frame())
+
+
+def test_partially_parked_order_is_not_completed(db):
+    db.execute(Item.__table__.insert(), ITEMS)
+    rebuild_all(db)
+    complete_orders(db)
+    db.commit()
+
+    completed = {p for (p,) in db.query(CompletedToday.prod_id)}
+
+    assert completed == {"400"}
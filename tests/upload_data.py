@@ -0,0 +1,52 @@
+"""
+Synthetische Upload-Daten für Tests und Benchmarks.
+"""
+import random
+
+import pandas as pd
+
+
+# ---------------------------------------------------------
+# Synthetische Excel-Daten (Format nach prepare_dataframe)
+# ---------------------------------------------------------
+def make_upload_frame(n_rows: int, rows_per_order: int = 12, seed: int = 1) -> pd.DataFrame:
+    rnd = random.Random(seed)
+    rows = []
+
+    for i in range(n_rows):
+        order = i // rows_per_order
+        rows.append({
+            "kuerzel": f"K{order % 97:03d}",
+            "prod_id": f"{100000 + order}",
+            "artikel_nr": f"ART-{rnd.randint(1000, 9999)}",
+            "bew_artikel": f"B500B-K{rnd.randint(1, 40):02d}",
+            "durchmesser": float(rnd.choice([8, 10, 12, 14, 16, 20, 25])),
+            "laenge": float(rnd.randint(50, 1200)),
+            "biegung": rnd.choice(["gerade", "gebogen", "unbekannt"]),
+            "bedarfs_menge_pos": float(rnd.randint(1, 80)),
+            "menge": float(i),
+            "beschaffung": rnd.choice(["Lager", "Lager", "Produktion"]),
+            "referenz": rnd.choice(["Am Lager", "Bestellung", "Produktion"]),
+            "start_bft": f"2026-03-{1 + order % 28:02d}",
+            "start_bew": f"2026-03-{1 + order % 28:02d}",
+        })
+
+    return pd.DataFrame(rows)
+
+
+# Interne Namen → Spaltenköpfe wie im ERP-Export
+EXCEL_HEADERS = {
+    "kuerzel": "Kürzel",
+    "prod_id": "ProdID BFT",
+    "artikel_nr": "Artikel-Nr. BFT",
+    "bew_artikel": "Bew.-Artikel",
+    "durchmesser": "Durchm.",
+    "laenge": "Länge",
+    "biegung": "Biegung",
+    "bedarfs_menge_pos": "Bedarfs-Menge",
+    "menge": "Menge",
+    "beschaffung": "Beschaffung",
+    "referenz": "Referenz",
+    "start_bft": "Start BFT",
+    "start_bew": "Start Bew",
+}